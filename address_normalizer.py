@@ -0,0 +1,120 @@
+"""
+Address Normalization
+
+One normalizer for every place addresses are matched: main/recent sales dedup, niche
+merges and the chunked niche index (monthly_processing_v2), skip trace address
+matching, GIS address fallback, delta scoring property keys and owner mailing keys.
+
+Addresses are put in a canonical USPS-style form so vendor spellings compare equal:
+- upper case, commas and semicolons to spaces, periods/apostrophes/quotes dropped
+- street suffixes abbreviated (AVENUE, AV -> AVE; STREET -> ST; BOULEVARD -> BLVD)
+- directionals abbreviated (NORTH -> N; SOUTHWEST -> SW)
+- unit designators abbreviated (APARTMENT -> APT; SUITE -> STE), '#' after a
+  designator dropped ('APT #4' -> 'APT 4') and a bare '#4' written '# 4'
+- spelled ordinals as numbers (FIRST -> 1ST; TWELFTH -> 12TH)
+- whitespace collapsed
+
+Words are replaced wherever they appear as whole words, not only in the suffix
+position, so '100 NORTH ST' becomes '100 N ST' - both sides of a match get the same
+treatment, which is all matching needs. Normalized addresses are match keys, never
+written to outputs.
+
+normalize_addresses() works on a whole Series: each distinct address is normalized
+once with pandas string operations and precompiled patterns, then mapped back, so
+repeated addresses cost nothing and millions of rows take seconds.
+"""
+
+import re
+import numpy as np
+import pandas as pd
+
+# USPS street suffix abbreviations (Publication 28, Appendix C1), common spellings
+STREET_SUFFIXES = {
+    'ALLEY': 'ALY', 'ALLY': 'ALY',
+    'AVENUE': 'AVE', 'AV': 'AVE', 'AVEN': 'AVE', 'AVENU': 'AVE', 'AVN': 'AVE', 'AVNUE': 'AVE',
+    'BOULEVARD': 'BLVD', 'BOUL': 'BLVD', 'BOULV': 'BLVD', 'BLV': 'BLVD',
+    'BRANCH': 'BR', 'BRIDGE': 'BRG', 'BROOK': 'BRK', 'BYPASS': 'BYP',
+    'CIRCLE': 'CIR', 'CIRC': 'CIR', 'CIRCL': 'CIR', 'CRCL': 'CIR',
+    'COURT': 'CT', 'CRT': 'CT', 'COVE': 'CV', 'CREEK': 'CRK', 'CRESCENT': 'CRES', 'CROSSING': 'XING',
+    'DRIVE': 'DR', 'DRIV': 'DR', 'DRV': 'DR',
+    'EXPRESSWAY': 'EXPY', 'EXTENSION': 'EXT',
+    'FREEWAY': 'FWY', 'GARDENS': 'GDNS', 'GLEN': 'GLN', 'GROVE': 'GRV',
+    'HEIGHTS': 'HTS', 'HIGHWAY': 'HWY', 'HIGHWY': 'HWY', 'HIWAY': 'HWY', 'HIWY': 'HWY', 'HWAY': 'HWY',
+    'HILL': 'HL', 'HILLS': 'HLS', 'HOLLOW': 'HOLW',
+    'JUNCTION': 'JCT', 'LAKE': 'LK', 'LANE': 'LN', 'LANDING': 'LNDG',
+    'MANOR': 'MNR', 'MEADOWS': 'MDWS', 'MOUNT': 'MT', 'MOUNTAIN': 'MTN',
+    'PARKWAY': 'PKWY', 'PARKWY': 'PKWY', 'PKWAY': 'PKWY', 'PKY': 'PKWY',
+    'PLACE': 'PL', 'PLAZA': 'PLZ', 'POINT': 'PT',
+    'RIDGE': 'RDG', 'ROAD': 'RD', 'ROUTE': 'RTE',
+    'SQUARE': 'SQ', 'STREET': 'ST', 'STR': 'ST', 'STRT': 'ST',
+    'TERRACE': 'TER', 'TERR': 'TER', 'TRACE': 'TRCE', 'TRAIL': 'TRL', 'TURNPIKE': 'TPKE',
+    'VALLEY': 'VLY', 'VIEW': 'VW', 'VILLAGE': 'VLG',
+}
+
+DIRECTIONALS = {
+    'NORTH': 'N', 'SOUTH': 'S', 'EAST': 'E', 'WEST': 'W',
+    'NORTHEAST': 'NE', 'NORTHWEST': 'NW', 'SOUTHEAST': 'SE', 'SOUTHWEST': 'SW',
+}
+
+# USPS secondary unit designators (Publication 28, Appendix C2)
+UNIT_DESIGNATORS = {
+    'APARTMENT': 'APT', 'BUILDING': 'BLDG', 'BASEMENT': 'BSMT', 'DEPARTMENT': 'DEPT', 'FLOOR': 'FL',
+    'FRONT': 'FRNT', 'HANGAR': 'HNGR', 'LOBBY': 'LBBY', 'OFFICE': 'OFC', 'PENTHOUSE': 'PH', 'REAR': 'REAR',
+    'ROOM': 'RM', 'SPACE': 'SPC', 'SUITE': 'STE', 'TRAILER': 'TRLR', 'UNIT': 'UNIT', 'LOT': 'LOT',
+}
+
+ORDINALS = {
+    'FIRST': '1ST', 'SECOND': '2ND', 'THIRD': '3RD', 'FOURTH': '4TH', 'FIFTH': '5TH',
+    'SIXTH': '6TH', 'SEVENTH': '7TH', 'EIGHTH': '8TH', 'NINTH': '9TH', 'TENTH': '10TH',
+    'ELEVENTH': '11TH', 'TWELFTH': '12TH', 'THIRTEENTH': '13TH', 'FOURTEENTH': '14TH', 'FIFTEENTH': '15TH',
+    'SIXTEENTH': '16TH', 'SEVENTEENTH': '17TH', 'EIGHTEENTH': '18TH', 'NINETEENTH': '19TH', 'TWENTIETH': '20TH',
+}
+
+# Whole-word replacements applied in one pass
+_WORD_TABLE = {**STREET_SUFFIXES, **DIRECTIONALS, **UNIT_DESIGNATORS, **ORDINALS}
+_WORD_PATTERN = re.compile(r'\b(?:' + '|'.join(sorted(_WORD_TABLE, key=len, reverse=True)) + r')\b')
+
+_SEPARATOR_PATTERN = re.compile(r'[,;]')
+_DROPPED_PATTERN = re.compile(r"[.'\"`]")
+_HASH_PATTERN = re.compile(r'\s*#\s*')
+_DESIGNATOR_HASH_PATTERN = re.compile(r'\b(' + '|'.join(sorted(set(UNIT_DESIGNATORS.values()))) + r') # ')
+_SPACE_PATTERN = re.compile(r'\s+')
+
+
+def _replace_word(match: re.Match) -> str:
+    return _WORD_TABLE[match.group(0)]
+
+
+def _normalize_unique(text: pd.Series) -> pd.Series:
+    """Normalize a Series of distinct address strings"""
+    text = text.str.upper()
+    text = text.str.replace(_SEPARATOR_PATTERN, ' ', regex=True)
+    text = text.str.replace(_DROPPED_PATTERN, '', regex=True)
+    text = text.str.replace(_HASH_PATTERN, ' # ', regex=True)
+    text = text.str.replace(_SPACE_PATTERN, ' ', regex=True).str.strip()
+    text = text.str.replace(_WORD_PATTERN, _replace_word, regex=True)
+    return text.str.replace(_DESIGNATOR_HASH_PATTERN, r'\1 ', regex=True)
+
+
+def normalize_addresses(addresses: pd.Series) -> pd.Series:
+    """
+    Normalize a Series of addresses for matching.
+
+    Missing and blank values normalize to ''. Non-text values (e.g. numbers read from
+    a spreadsheet) are normalized from their text form.
+
+    Returns:
+        Series of normalized addresses with the same index
+    """
+    codes, uniques = pd.factorize(addresses, use_na_sentinel=True)
+    if len(uniques) == 0:
+        return pd.Series('', index=addresses.index, dtype=object)
+    normalized = _normalize_unique(pd.Series(uniques, dtype=object).astype(str))
+    # Code -1 (missing) picks the trailing ''
+    lookup = np.append(normalized.to_numpy(dtype=object), '')
+    return pd.Series(lookup[codes], index=addresses.index, dtype=object)
+
+
+def normalize_address(address) -> str:
+    """Normalize a single address (see normalize_addresses)"""
+    return normalize_addresses(pd.Series([address], dtype=object)).iloc[0]
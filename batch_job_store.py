@@ -0,0 +1,225 @@
+"""
+Batch Job Store
+
+This module persists the state of multi-region batch runs in a small SQLite
+database under output/, so an interrupted --all-regions run can be resumed
+instead of starting over.
+
+Each batch records one job per region with its status (queued, running,
+succeeded, failed), attempt count, timings and output paths. While a region
+runs, its processing stage is recorded in the spirit of UploadLog.ProcessingState
+from the legacy ProcessUploadLog stored procedure, so the furthest stage a job
+reached is visible at any moment - even after the process died.
+"""
+
+import json
+import sqlite3
+import logging
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOB_STORE_PATH = Path("output") / "batch_jobs.sqlite"
+
+# Job status values
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_SUCCEEDED = 'succeeded'
+STATUS_FAILED = 'failed'
+
+# Processing states for a region job. Like UploadLog.ProcessingState the number only
+# moves forward while a job runs, so the last recorded state shows where it stopped.
+PROCESSING_STATES = {
+    'queued': 1,
+    'validating_files': 2,
+    'validating_fips': 3,
+    'loading_main': 4,
+    'scoring': 5,
+    'merging_niches': 6,
+    'saving_outputs': 7,
+    'completed': 8,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS batches (
+    batch_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    options TEXT
+);
+
+CREATE TABLE IF NOT EXISTS region_jobs (
+    batch_id INTEGER NOT NULL,
+    region_key TEXT NOT NULL,
+    status TEXT NOT NULL,
+    processing_state INTEGER NOT NULL,
+    processing_stage TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    queued_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT,
+    duration_seconds REAL,
+    total_records INTEGER,
+    output_file TEXT,
+    error TEXT,
+    PRIMARY KEY (batch_id, region_key)
+);
+
+CREATE TABLE IF NOT EXISTS job_events (
+    batch_id INTEGER NOT NULL,
+    region_key TEXT NOT NULL,
+    attempt INTEGER NOT NULL,
+    processing_state INTEGER NOT NULL,
+    processing_stage TEXT NOT NULL,
+    recorded_at TEXT NOT NULL
+);
+"""
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec='seconds')
+
+
+class BatchJobStore:
+    """SQLite-backed record of region jobs for --all-regions batch runs"""
+
+    def __init__(self, db_path: Path = DEFAULT_JOB_STORE_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            # WAL lets parallel worker processes record progress without blocking readers
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a short-lived connection (safe to use from several processes)"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def create_batch(self, region_keys: List[str], options: Optional[Dict] = None) -> int:
+        """Create a new batch with every region queued and return its id"""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO batches (started_at, options) VALUES (?, ?)",
+                (_now(), json.dumps(options or {}))
+            )
+            batch_id = cursor.lastrowid
+            conn.executemany(
+                """INSERT INTO region_jobs (batch_id, region_key, status, processing_state, processing_stage, queued_at)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                [(batch_id, key, STATUS_QUEUED, PROCESSING_STATES['queued'], 'queued', _now()) for key in region_keys]
+            )
+
+        logger.info(f"Created batch {batch_id} with {len(region_keys)} region jobs")
+        return batch_id
+
+    def latest_batch_id(self) -> Optional[int]:
+        """Return the most recently created batch id, or None if no batch exists"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT MAX(batch_id) AS batch_id FROM batches").fetchone()
+        return row['batch_id'] if row else None
+
+    def get_jobs(self, batch_id: int) -> List[Dict]:
+        """Return all region jobs for a batch"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM region_jobs WHERE batch_id = ? ORDER BY region_key", (batch_id,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def regions_to_resume(self, batch_id: int) -> List[str]:
+        """Regions in a batch that have not succeeded yet (failed, queued or interrupted)"""
+        return [job['region_key'] for job in self.get_jobs(batch_id) if job['status'] != STATUS_SUCCEEDED]
+
+    def mark_running(self, batch_id: int, region_key: str) -> int:
+        """Mark a region job as started and return its attempt number"""
+        with self._connect() as conn:
+            conn.execute(
+                """UPDATE region_jobs
+                   SET status = ?, attempts = attempts + 1, started_at = ?, finished_at = NULL,
+                       duration_seconds = NULL, error = NULL
+                   WHERE batch_id = ? AND region_key = ?""",
+                (STATUS_RUNNING, _now(), batch_id, region_key)
+            )
+            attempt = conn.execute(
+                "SELECT attempts FROM region_jobs WHERE batch_id = ? AND region_key = ?",
+                (batch_id, region_key)
+            ).fetchone()['attempts']
+        return attempt
+
+    def record_stage(self, batch_id: int, region_key: str, stage: str) -> None:
+        """Record that a running region job reached a processing stage"""
+        state = PROCESSING_STATES.get(stage)
+        if state is None:
+            logger.warning(f"Unknown processing stage '{stage}' for {region_key}")
+            return
+
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE region_jobs SET processing_state = ?, processing_stage = ? WHERE batch_id = ? AND region_key = ?",
+                (state, stage, batch_id, region_key)
+            )
+            conn.execute(
+                """INSERT INTO job_events (batch_id, region_key, attempt, processing_state, processing_stage, recorded_at)
+                   SELECT batch_id, region_key, attempts, ?, ?, ? FROM region_jobs
+                   WHERE batch_id = ? AND region_key = ?""",
+                (state, stage, _now(), batch_id, region_key)
+            )
+
+    def mark_finished(self, batch_id: int, region_key: str, result: Dict) -> None:
+        """Record the outcome of a region job from its process_region result dict"""
+        success = result.get('success', False)
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT started_at FROM region_jobs WHERE batch_id = ? AND region_key = ?",
+                (batch_id, region_key)
+            ).fetchone()
+            duration = None
+            if row and row['started_at']:
+                duration = (datetime.now() - datetime.fromisoformat(row['started_at'])).total_seconds()
+
+            conn.execute(
+                """UPDATE region_jobs
+                   SET status = ?, finished_at = ?, duration_seconds = ?, total_records = ?,
+                       output_file = ?, error = ?
+                   WHERE batch_id = ? AND region_key = ?""",
+                (STATUS_SUCCEEDED if success else STATUS_FAILED, _now(), duration,
+                 result.get('total_records'), result.get('output_file'),
+                 None if success else result.get('error', 'Unknown error'),
+                 batch_id, region_key)
+            )
+
+        if success:
+            self.record_stage(batch_id, region_key, 'completed')
+
+    def finish_batch(self, batch_id: int) -> None:
+        """Stamp the batch end time"""
+        with self._connect() as conn:
+            conn.execute("UPDATE batches SET finished_at = ? WHERE batch_id = ?", (_now(), batch_id))
+
+    def print_status(self, batch_id: int) -> None:
+        """Print a table showing where each region job in a batch stands"""
+        jobs = self.get_jobs(batch_id)
+        if not jobs:
+            print(f"No jobs found for batch {batch_id}")
+            return
+
+        print(f"\n=== BATCH {batch_id} STATUS ===")
+        print(f"{'REGION':<22} | {'STATUS':<10} | {'STAGE':<17} | {'TRIES':>5} | {'SECONDS':>8} | DETAIL")
+        print("-" * 90)
+        for job in jobs:
+            seconds = f"{job['duration_seconds']:.0f}" if job['duration_seconds'] is not None else ''
+            detail = job['error'] or job['output_file'] or ''
+            print(f"{job['region_key']:<22} | {job['status']:<10} | {job['processing_stage']:<17} | "
+                  f"{job['attempts']:>5} | {seconds:>8} | {detail}")
+
+        counts: Dict[str, int] = {}
+        for job in jobs:
+            counts[job['status']] = counts.get(job['status'], 0) + 1
+        print("-" * 90)
+        print(", ".join(f"{status}: {count}" for status, count in sorted(counts.items())))
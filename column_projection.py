@@ -0,0 +1,102 @@
+"""
+Column Projection
+
+Vendor main exports carry dozens of columns, but the in-memory pipeline stages
+(scoring, delta keys, niche merging, owner keys and statistics) read about twenty of
+them. After loading, the main data is split into a working frame with only the
+columns the stages declare plus a row id, and a passthrough frame with everything
+else, keyed by that row id. Stages copy and concatenate the narrow working frame;
+the passthrough columns are joined back once, when the output is written.
+"""
+
+import logging
+import numpy as np
+import pandas as pd
+from typing import Iterable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Working frame column linking each row to its passthrough values
+ROW_ID_COLUMN = '_RowId'
+
+
+class PassthroughColumns:
+    """Input columns no stage reads, held by row id until the output is written"""
+
+    def __init__(self, frame: pd.DataFrame, column_order: List[str]):
+        self.frame = frame                # Passthrough values indexed by row id
+        self.column_order = column_order  # Input column order, restored by rejoin()
+        self.inserted: List[pd.DataFrame] = []
+        self._next_id = len(frame)
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.frame.columns)
+
+    def add_rows(self, rows: pd.DataFrame) -> np.ndarray:
+        """
+        Hold the passthrough values of rows added to the working frame (e.g. niche-only
+        records). Passthrough columns the rows don't have are left blank.
+
+        Returns:
+            Row ids to store in the added rows' ROW_ID_COLUMN
+        """
+        row_ids = np.arange(self._next_id, self._next_id + len(rows), dtype='int64')
+        self._next_id += len(rows)
+        values = pd.DataFrame({column: rows[column].to_numpy() if column in rows.columns else ''
+                               for column in self.frame.columns},
+                              index=pd.Index(row_ids, name=ROW_ID_COLUMN))
+        self.inserted.append(values)
+        return row_ids
+
+    def inserted_frame(self) -> pd.DataFrame:
+        """Passthrough values of the rows added since the split (for stage checkpoints)"""
+        if not self.inserted:
+            return self.frame.iloc[:0]
+        return pd.concat(self.inserted)
+
+    def restore_inserted(self, frame: pd.DataFrame) -> None:
+        """Replace the added rows with ones saved by inserted_frame()"""
+        self.inserted = [frame] if len(frame) else []
+        self._next_id = len(self.frame) + len(frame)
+
+    def rejoin(self, working: pd.DataFrame) -> pd.DataFrame:
+        """
+        Join the passthrough columns back onto a working frame.
+
+        Input columns come first in their original order, followed by the columns
+        stages added. A frame without row ids (not projected) is returned unchanged.
+        """
+        if ROW_ID_COLUMN not in working.columns:
+            return working
+        passthrough = pd.concat([self.frame] + self.inserted) if self.inserted else self.frame
+        joined = working.join(passthrough, on=ROW_ID_COLUMN)
+        order = [column for column in self.column_order if column in joined.columns]
+        order += [column for column in working.columns if column not in self.column_order and column != ROW_ID_COLUMN]
+        return joined[order]
+
+
+def project_columns(df: pd.DataFrame, working_columns: Iterable[str]) -> Tuple[pd.DataFrame, PassthroughColumns]:
+    """
+    Split a loaded frame into a working frame and its passthrough columns.
+
+    Args:
+        df: Loaded input records
+        working_columns: Columns the pipeline stages read (missing ones are ignored)
+
+    Returns:
+        tuple: (working frame with the declared columns and ROW_ID_COLUMN,
+                PassthroughColumns holding the other columns)
+    """
+    declared = set(working_columns)
+    row_ids = np.arange(len(df), dtype='int64')
+    passthrough_columns = [column for column in df.columns if column not in declared]
+
+    working = df.drop(columns=passthrough_columns)
+    working[ROW_ID_COLUMN] = row_ids
+    passthrough = df[passthrough_columns].copy()
+    passthrough.index = pd.Index(row_ids, name=ROW_ID_COLUMN)
+
+    logger.info(f"Column projection: {working.shape[1] - 1} working columns, "
+                f"{len(passthrough_columns)} passthrough columns")
+    return working, PassthroughColumns(passthrough, list(df.columns))
@@ -0,0 +1,258 @@
+"""
+Columnar File I/O
+
+Thin helpers around Parquet (via pyarrow). Parquet is the canonical format of the
+enhanced region output and of intermediate and cached data: it keeps column types,
+is compressed, reads back much faster than Excel and can load a subset of columns.
+Excel files are written as an optional export next to the Parquet file.
+
+pyarrow is needed for these helpers; callers should check columnar_available()
+and fall back to keeping data in memory (or in Excel) when it is missing.
+"""
+
+import logging
+import os
+import shutil
+import pandas as pd
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from excel_streaming import write_excel_streaming
+
+logger = logging.getLogger(__name__)
+
+COLUMNAR_SUFFIX = ".parquet"
+DEFAULT_COMPRESSION = "zstd"
+
+# pandas.api.types.infer_dtype results that Parquet can't store in one column
+_MIXED_INFERRED_TYPES = {'mixed', 'mixed-integer'}
+
+try:
+    import pyarrow  # noqa: F401 - only needed by pandas' parquet engine
+    _PYARROW_AVAILABLE = True
+except ImportError:
+    _PYARROW_AVAILABLE = False
+
+
+def columnar_available() -> bool:
+    """True when pyarrow is installed and Parquet files can be read and written"""
+    return _PYARROW_AVAILABLE
+
+
+def _text_value(value):
+    """Text form of a cell value for a mixed-type column (integer-valued floats lose the '.0')"""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def coerce_mixed_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert object columns holding mixed Python types (e.g. numbers and text read
+    from the same Excel column) to text so Parquet can store them. Missing values
+    stay missing; other columns are untouched.
+    """
+    mixed = [column for column in df.columns
+             if df[column].dtype == object and pd.api.types.infer_dtype(df[column], skipna=True) in _MIXED_INFERRED_TYPES]
+    if not mixed:
+        return df
+
+    df = df.copy(deep=False)
+    for column in mixed:
+        df[column] = df[column].map(lambda value: value if pd.isna(value) else _text_value(value))
+    logger.debug(f"Stored mixed-type columns as text: {mixed}")
+    return df
+
+
+def write_columnar(df: pd.DataFrame, path: Path, coerce_mixed: bool = False,
+                   compression: str = DEFAULT_COMPRESSION) -> Path:
+    """
+    Write a DataFrame to a compressed Parquet file.
+
+    Args:
+        df: Data to write (the index is stored too)
+        path: Destination file
+        coerce_mixed: Store mixed-type object columns as text instead of failing
+        compression: Parquet compression codec
+
+    Raises:
+        ImportError: pyarrow is not installed
+        Exception: from pyarrow when a column can't be stored (e.g. mixed Python types
+            without coerce_mixed)
+    """
+    if not _PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for columnar files (pip install pyarrow)")
+
+    if coerce_mixed:
+        df = coerce_mixed_columns(df)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(path, engine='pyarrow', compression=compression)
+    return path
+
+
+def read_columnar(path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Read a Parquet file written by write_columnar, optionally only some columns"""
+    if not _PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for columnar files (pip install pyarrow)")
+
+    return pd.read_parquet(path, engine='pyarrow', columns=columns)
+
+
+def columnar_columns(path: Path) -> List[str]:
+    """Column names of a Parquet file, read from its schema"""
+    import pyarrow.parquet as pq
+
+    return [name for name in pq.read_schema(path).names if not name.startswith('__index_level_')]
+
+
+def _settled_type(types: List):
+    """One Arrow type for a column typed differently across chunks"""
+    import pyarrow as pa
+
+    types = [column_type for column_type in types if not pa.types.is_null(column_type)]
+    if not types:
+        return pa.null()
+    if all(column_type == types[0] for column_type in types):
+        return types[0]
+    if all(pa.types.is_integer(column_type) or pa.types.is_floating(column_type) for column_type in types):
+        return pa.float64()
+    if all(pa.types.is_timestamp(column_type) for column_type in types):
+        return pa.timestamp('us')
+    return pa.string()
+
+
+class ChunkedColumnarWriter:
+    """
+    Append DataFrame chunks to one Parquet file without holding them in memory.
+
+    Each chunk is written to a part file as it arrives. Chunks parsed separately can
+    type a column differently (all blank in one chunk, numbers in one and text in
+    another), so close() settles one type per column across the parts - integers and
+    floats widen to float, other conflicts become text - and streams the parts into
+    the final file one at a time. Columns are those of the first chunk; later chunks
+    are aligned to them.
+    """
+
+    def __init__(self, path: Path, compression: str = DEFAULT_COMPRESSION):
+        if not _PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for columnar files (pip install pyarrow)")
+        self.path = Path(path)
+        self.compression = compression
+        self.part_dir = self.path.with_name(f".{self.path.name}.parts")
+        self.parts: List[Path] = []
+        self.columns: Optional[List[str]] = None
+        self.rows_written = 0
+
+    def append(self, df: pd.DataFrame) -> None:
+        """Write a chunk to a part file"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self.columns is None:
+            self.columns = [str(column) for column in df.columns]
+            self.part_dir.mkdir(parents=True, exist_ok=True)
+        extra = [column for column in df.columns if column not in self.columns]
+        if extra:
+            logger.warning(f"{self.path.name}: dropping columns not in the first chunk: {extra}")
+        if df.empty:
+            return
+
+        df = coerce_mixed_columns(df.reindex(columns=self.columns))
+        part_path = self.part_dir / f"part_{len(self.parts):05d}{COLUMNAR_SUFFIX}"
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), part_path, compression=self.compression)
+        self.parts.append(part_path)
+        self.rows_written += len(df)
+
+    def close(self) -> Path:
+        """Combine the parts into the output file and remove them"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self.columns is None:
+            raise ValueError(f"No chunks were written to {self.path.name}")
+
+        schemas = [pq.read_schema(part) for part in self.parts]
+        schema = pa.schema([pa.field(column, _settled_type([part_schema.field(column).type for part_schema in schemas]))
+                            for column in self.columns])
+
+        temp_path = self.path.with_name(f".{self.path.name}.writing")
+        with pq.ParquetWriter(temp_path, schema, compression=self.compression) as writer:
+            for part in self.parts:
+                table = pq.read_table(part)
+                columns = []
+                for field in schema:
+                    column = table.column(field.name)
+                    if pa.types.is_dictionary(column.type) and not pa.types.is_dictionary(field.type):
+                        column = column.cast(column.type.value_type)
+                    columns.append(column.cast(field.type))
+                writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+
+        os.replace(temp_path, self.path)
+        shutil.rmtree(self.part_dir, ignore_errors=True)
+        return self.path
+
+    def discard(self) -> None:
+        """Remove the parts without writing the output"""
+        shutil.rmtree(self.part_dir, ignore_errors=True)
+
+
+def columnar_sibling(path: Path) -> Path:
+    """The Parquet file that goes with an Excel or CSV file (same name, .parquet suffix)"""
+    return Path(path).with_suffix(COLUMNAR_SUFFIX)
+
+
+def preferred_source(path: Path) -> Path:
+    """
+    The file to read for a data file: its Parquet sibling when that exists and can be
+    read, otherwise the file itself.
+    """
+    path = Path(path)
+    if path.suffix.lower() == COLUMNAR_SUFFIX or not _PYARROW_AVAILABLE:
+        return path
+    sibling = columnar_sibling(path)
+    return sibling if sibling.exists() else path
+
+
+def save_dataset(df: pd.DataFrame, output_stem: Path, export_excel: bool = True,
+                 log: logging.Logger = logger) -> Dict[str, Optional[Path]]:
+    """
+    Write a dataset as canonical Parquet plus an optional Excel export.
+
+    Mixed-type columns are stored as text in the Parquet file. The Excel export is
+    streamed in chunks, so it doesn't need a second in-memory copy of the workbook.
+    Without pyarrow, or if the Parquet write fails, the Excel file is written
+    regardless of export_excel so the dataset is always saved. When the Excel export
+    is skipped, an older Excel copy at the same path is removed.
+
+    Args:
+        df: Data to save
+        output_stem: Output path without suffix ('.parquet' / '.xlsx' are added)
+        export_excel: Also write the Excel export
+        log: Logger for fallback warnings
+
+    Returns:
+        Dict with the 'columnar' and 'excel' paths written (None when not written)
+    """
+    output_stem = Path(output_stem)
+    saved = {'columnar': None, 'excel': None}
+
+    if _PYARROW_AVAILABLE:
+        try:
+            saved['columnar'] = write_columnar(df, output_stem.with_suffix(COLUMNAR_SUFFIX), coerce_mixed=True)
+        except Exception as e:
+            log.warning(f"Could not write {output_stem.name}{COLUMNAR_SUFFIX} ({e}) - writing Excel instead")
+    else:
+        log.warning(f"pyarrow not installed - writing {output_stem.name} as Excel only")
+
+    excel_path = output_stem.with_suffix('.xlsx')
+    if export_excel or saved['columnar'] is None:
+        write_excel_streaming(df, excel_path)
+        saved['excel'] = excel_path
+    elif excel_path.exists():
+        # An Excel copy from an earlier write would no longer match the Parquet file
+        excel_path.unlink()
+        log.info(f"Removed outdated Excel copy {excel_path.name}")
+
+    return saved
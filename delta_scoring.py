@@ -0,0 +1,171 @@
+"""
+Row-Level Delta Scoring
+
+Month to month most rows of a region's main file are unchanged. This module
+compares the new main file against the previous enhanced output and only sends
+new or changed rows through classification and scoring; every other row carries
+its previous PropertyCategory and priority forward.
+
+Rows are matched on a property key (parcel_keys.property_keys: APN when present,
+otherwise the normalized property address) plus a hash of the columns scoring reads
+(enhanced_property_processor.SCORING_INPUT_COLUMNS). Distress flags are never
+carried - niche lists and skip trace rebuild them every run.
+
+A change log of new, changed and removed properties is produced alongside.
+"""
+
+import logging
+import pandas as pd
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from enhanced_property_processor import (
+    EnhancedPropertyProcessor, SCORING_INPUT_COLUMNS, DISTRESS_FLAG_COLUMNS, ENHANCED_OUTPUT_COLUMNS
+)
+from parcel_keys import canonical_column, property_keys
+from property_processor import NICHE_ONLY_PRIORITY_ID
+
+logger = logging.getLogger(__name__)
+
+# Scoring results copied from the previous output for unchanged rows
+CARRIED_COLUMNS = ['PropertyCategory', 'PriorityCode', 'PriorityId', 'PriorityName']
+
+# Owner occupied scoring compares sale dates to "today" minus these ages (see PropertyPriorityScorer)
+SALE_AGE_THRESHOLD_YEARS = [13, 20]
+
+CHANGE_NEW = 'NEW'
+CHANGE_CHANGED = 'CHANGED'
+CHANGE_REMOVED = 'REMOVED'
+
+
+def scoring_params(processor_config: Dict) -> Dict:
+    """Return the region settings scoring depends on, in a JSON-friendly form"""
+    return {key: str(value) for key, value in sorted(processor_config.items())}
+
+
+def row_hashes(df: pd.DataFrame) -> pd.Series:
+    """Hash the scoring input columns of each row (missing columns hash as blank)"""
+    canonical = pd.DataFrame(
+        {col: canonical_column(df[col]) if col in df.columns else '' for col in SCORING_INPUT_COLUMNS},
+        index=df.index
+    )
+    return pd.util.hash_pandas_object(canonical, index=False)
+
+
+def _threshold_window_mask(sale_dates: pd.Series, previous_run: datetime, now: datetime) -> pd.Series:
+    """
+    Rows whose sale date crossed a date-relative scoring threshold between the previous
+    run and now. Those rows may score differently even though their inputs did not change.
+    """
+    parsed = pd.to_datetime(sale_dates, errors='coerce', format='mixed')
+    mask = pd.Series(False, index=sale_dates.index)
+    for years in SALE_AGE_THRESHOLD_YEARS:
+        low = pd.Timestamp(previous_run) - pd.DateOffset(days=365 * years)
+        high = pd.Timestamp(now) - pd.DateOffset(days=365 * years)
+        mask |= (parsed > low) & (parsed <= high)
+    # Dates that were "in the future" (treated as very old) at the previous run
+    mask |= (parsed > pd.Timestamp(previous_run)) & (parsed <= pd.Timestamp(now))
+    return mask
+
+
+def score_with_delta(main_df: pd.DataFrame, previous_df: pd.DataFrame, processor: EnhancedPropertyProcessor,
+                     previous_run: Optional[datetime] = None) -> Tuple[pd.DataFrame, pd.DataFrame, Dict]:
+    """
+    Score a main region DataFrame, re-scoring only rows that are new or changed
+    since the previous enhanced output.
+
+    Args:
+        main_df: Current main region records (after any recent sales merge)
+        previous_df: Previous enhanced output for the region
+        processor: Enhanced property processor configured for the region
+        previous_run: When the previous output was scored (rows crossing a date-relative
+            scoring threshold since then are re-scored)
+
+    Returns:
+        tuple: (scored_dataframe, change_log_dataframe, counts dict with
+                new/changed/unchanged/rescored/removed)
+    """
+    now = datetime.now()
+    main_df = main_df.reset_index(drop=True)
+
+    # Only rows that came from the main file were scored - niche-only inserts are rebuilt each run
+    if 'PriorityId' in previous_df.columns:
+        previous_df = previous_df[previous_df['PriorityId'] != NICHE_ONLY_PRIORITY_ID]
+    previous_df = previous_df.reset_index(drop=True)
+
+    current = pd.DataFrame({'key': property_keys(main_df), 'hash': row_hashes(main_df)})
+    previous = pd.DataFrame({'key': property_keys(previous_df), 'hash': row_hashes(previous_df)})
+    for col in CARRIED_COLUMNS:
+        previous[col] = previous_df[col]
+
+    # Carry forward rows whose key and scoring inputs both match a previous row
+    carried = current.reset_index().merge(
+        previous.drop_duplicates(subset=['key', 'hash']), on=['key', 'hash'], how='inner'
+    ).set_index('index')
+    matched_mask = current.index.isin(carried.index) & (current['key'] != '').to_numpy()
+
+    crossed_mask = pd.Series(False, index=current.index).to_numpy()
+    if previous_run is not None and 'Last Sale Date' in main_df.columns:
+        crossed_mask = _threshold_window_mask(main_df['Last Sale Date'], previous_run, now).to_numpy()
+
+    previous_keys = set(previous['key']) - {''}
+    carry_mask = matched_mask & ~crossed_mask
+    rescore_mask = ~carry_mask
+    new_mask = ~matched_mask & ~current['key'].isin(previous_keys).to_numpy()
+    changed_mask = ~matched_mask & ~new_mask
+
+    logger.info(f"[DELTA SCORING] {carry_mask.sum():,} unchanged rows carried forward, "
+                f"{rescore_mask.sum():,} rows to score ({new_mask.sum():,} new, {changed_mask.sum():,} changed, "
+                f"{(matched_mask & crossed_mask).sum():,} crossed a sale date threshold)")
+
+    # Score new and changed rows
+    rescored = processor.process_dataframe(main_df[rescore_mask]) if rescore_mask.any() else pd.DataFrame()
+
+    # Build carried rows: original columns + previous scoring results + cleared distress flags
+    carried_rows = main_df[carry_mask].copy()
+    carried_results = carried.loc[carried_rows.index]
+    for col in CARRIED_COLUMNS:
+        carried_rows[col] = carried_results[col].to_numpy()
+    for col in DISTRESS_FLAG_COLUMNS:
+        carried_rows[col] = False
+
+    output_columns = list(main_df.columns) + [col for col in ENHANCED_OUTPUT_COLUMNS if col not in main_df.columns]
+    scored = pd.concat([rescored, carried_rows], sort=False).sort_index()
+    scored = scored.reindex(columns=output_columns).reset_index(drop=True)
+
+    # Change log
+    previous_by_key = previous.drop_duplicates(subset=['key']).set_index('key')
+    new_rows = pd.DataFrame({
+        'ChangeType': CHANGE_NEW,
+        'PropertyKey': current.loc[new_mask, 'key'],
+        'Address': main_df.loc[new_mask, 'Address'] if 'Address' in main_df.columns else '',
+        'PreviousPriorityCode': '',
+        'PriorityCode': rescored['PriorityCode'].reindex(current.index[new_mask]) if not rescored.empty else ''
+    })
+    changed_keys = current.loc[changed_mask, 'key']
+    changed_rows = pd.DataFrame({
+        'ChangeType': CHANGE_CHANGED,
+        'PropertyKey': changed_keys,
+        'Address': main_df.loc[changed_mask, 'Address'] if 'Address' in main_df.columns else '',
+        'PreviousPriorityCode': previous_by_key['PriorityCode'].reindex(changed_keys).to_numpy(),
+        'PriorityCode': rescored['PriorityCode'].reindex(current.index[changed_mask]) if not rescored.empty else ''
+    })
+    removed_previous = previous[(previous['key'] != '') & ~previous['key'].isin(set(current['key']))]
+    removed_previous = removed_previous.drop_duplicates(subset=['key'])
+    removed_rows = pd.DataFrame({
+        'ChangeType': CHANGE_REMOVED,
+        'PropertyKey': removed_previous['key'],
+        'Address': previous_df.loc[removed_previous.index, 'Address'] if 'Address' in previous_df.columns else '',
+        'PreviousPriorityCode': removed_previous['PriorityCode'],
+        'PriorityCode': ''
+    })
+    change_log = pd.concat([new_rows, changed_rows, removed_rows], ignore_index=True)
+
+    counts = {
+        'new': int(new_mask.sum()),
+        'changed': int(changed_mask.sum()),
+        'removed': int(len(removed_rows)),
+        'unchanged': int(carry_mask.sum()),
+        'rescored': int(rescore_mask.sum())
+    }
+    return scored, change_log, counts
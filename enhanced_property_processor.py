@@ -17,15 +17,36 @@ Architecture:
 import pandas as pd
 from datetime import datetime, timedelta
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 from dataclasses import dataclass
 from pathlib import Path
 
 # Import existing classes
 from property_processor import PropertyClassifier, PropertyPriorityScorer, PropertyClassification, PropertyPriority
+from input_adapters import iter_input_chunks, read_input
+from ingest_schema import MAIN_EXPORT_SCHEMA
 
 logger = logging.getLogger(__name__)
 
+# Input columns read by classification and scoring (process_property and the legacy scorer)
+SCORING_INPUT_COLUMNS = [
+    'Owner 1 Last Name', 'Owner 1 First Name', 'Grantor', 'Owner Occupied', 'Address',
+    'Last Sale Date', 'Last Sale Amount', 'Last Cash Buyer'
+]
+
+# Boolean distress flag columns added by enhanced_fields, in output order
+DISTRESS_FLAG_COLUMNS = [
+    'HasLiens', 'HasForeclosure', 'HasCodeEnforcement', 'HasCurrentTax', 'HasTaxHistory',
+    'HasBankruptcy', 'HasCashBuyer', 'HasInterFamily', 'HasLandlord', 'HasProbate', 'HasInherited',
+    'HasSTBankruptcy', 'HasSTForeclosure', 'HasSTLien', 'HasSTJudgment', 'HasSTQuitclaim', 'HasSTDeceased'
+]
+
+# All columns added by enhanced_fields, in output order
+ENHANCED_OUTPUT_COLUMNS = ['PropertyCategory'] + DISTRESS_FLAG_COLUMNS + ['PriorityCode', 'PriorityId', 'PriorityName']
+
+# Rows per chunk when a file is processed in chunks (process_excel_file_chunked)
+DEFAULT_CHUNK_ROWS = 50000
+
 
 @dataclass
 class EnhancedPropertyRecord:
@@ -305,17 +326,19 @@ class EnhancedPropertyProcessor:
     
     def to_dataframe_record(self, enhanced_record: EnhancedPropertyRecord, 
                           original_row: pd.Series) -> Dict[str, Any]:
-        """Convert enhanced record to dataframe row format"""
+        """Convert enhanced record to dataframe row format (original row data plus the enhanced fields)"""
+        record = original_row.to_dict()
+        record.update(self.enhanced_fields(enhanced_record))
+        return record
+    
+    def enhanced_fields(self, enhanced_record: EnhancedPropertyRecord) -> Dict[str, Any]:
+        """The ENHANCED_OUTPUT_COLUMNS values of an enhanced record"""
         
         # Generate legacy priority code
         legacy_code = self.flag_manager.generate_legacy_priority_code(enhanced_record)
         enhanced_record.legacy_priority_code = legacy_code
         
-        # Start with original row data
-        record = original_row.to_dict()
-        
-        # Add enhanced fields
-        record.update({
+        return {
             # Property classification
             'PropertyCategory': enhanced_record.property_category,
             
@@ -342,9 +365,7 @@ class EnhancedPropertyProcessor:
             'PriorityCode': enhanced_record.base_priority_code,  # Clean base code (ABS1, BUY2, DEFAULT)
             'PriorityId': enhanced_record.base_priority_id,     # Numeric priority (1-13)
             'PriorityName': self._generate_priority_name(enhanced_record)
-        })
-        
-        return record
+        }
     
     def _generate_priority_name(self, record: EnhancedPropertyRecord) -> str:
         """Generate human-readable priority name"""
@@ -363,17 +384,14 @@ class EnhancedPropertyProcessor:
     
     def process_excel_file(self, file_path: str) -> pd.DataFrame:
         """
-        Process a single Excel file and return enhanced data with boolean flag architecture.
+        Process a single input file and return enhanced data with boolean flag architecture.
         
         Args:
-            file_path: Path to Excel file
+            file_path: Path to Excel, CSV, Parquet or Feather file
             
         Returns:
             DataFrame with boolean flag columns and separated raw land handling
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
         logger.info(f"[ENHANCED PROCESSING] Starting file: {Path(file_path).name}")
         
         try:
@@ -381,57 +399,117 @@ class EnhancedPropertyProcessor:
             if not Path(file_path).exists():
                 raise FileNotFoundError(f"File not found: {file_path}")
             
-            # Read Excel file 
-            df = pd.read_excel(file_path, dtype={'FIPS': 'category'})
+            # Read input file
+            df = read_input(file_path, schema=MAIN_EXPORT_SCHEMA)
             logger.info(f"[ENHANCED PROCESSING] Loaded {len(df):,} records")
             
-            # Validate required columns
-            required_columns = ['Owner 1 Last Name', 'Owner 1 First Name', 'Address']
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            if missing_columns:
-                raise ValueError(f"Missing required columns: {missing_columns}")
-            
-            # Process each row and collect enhanced records
-            enhanced_records = []
-            total_processed = 0
+            return self.process_dataframe(df)
             
-            for idx, row in df.iterrows():
-                try:
-                    # Process property with enhanced architecture
-                    enhanced_record = self.process_property(row)
-                    
-                    # Convert to dataframe format
-                    record_dict = self.to_dataframe_record(enhanced_record, row)
-                    enhanced_records.append(record_dict)
-                    
-                    total_processed += 1
-                    
-                    # Progress logging every 5000 records
-                    if total_processed % 5000 == 0:
-                        logger.info(f"[ENHANCED PROCESSING] Processed {total_processed:,} records...")
-                        
-                except Exception as row_error:
-                    logger.warning(f"[ENHANCED PROCESSING] Error processing row {idx}: {row_error}")
-                    continue
-            
-            # Create enhanced DataFrame
-            if not enhanced_records:
-                logger.error("[ENHANCED PROCESSING] No records could be processed")
-                return pd.DataFrame()
-            
-            result_df = pd.DataFrame(enhanced_records)
+        except Exception as e:
+            logger.error(f"[ENHANCED PROCESSING] Failed to process {file_path}: {e}")
+            raise
+    
+    def process_excel_file_chunked(self, file_path: str, writer, chunk_size: int = DEFAULT_CHUNK_ROWS,
+                                   row_filter: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+                                   chunk_callback: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None) -> int:
+        """
+        Process a large input file in fixed-size row chunks.
+        
+        The file is streamed (see input_adapters.iter_input_chunks) and each chunk is
+        classified, scored and appended to the writer before the next one is read, so peak
+        memory depends on the chunk size rather than the file size.
+        
+        Args:
+            file_path: Path to Excel, CSV, Parquet or Feather file
+            writer: Receives each processed chunk via append() (e.g. columnar_io.ChunkedColumnarWriter)
+            chunk_size: Rows read per chunk
+            row_filter: Optional function returning the rows of a raw chunk to process
+            chunk_callback: Optional function applied to each processed chunk before it is
+                written (e.g. to set niche flags)
             
-            # Log processing summary
-            developed_count = len(result_df[result_df['PropertyCategory'] == 'DEVELOPED'])
-            raw_land_count = len(result_df[result_df['PropertyCategory'] == 'RAW_LAND'])
+        Returns:
+            Number of records written
+        """
+        logger.info(f"[ENHANCED PROCESSING] Starting file in chunks of {chunk_size:,} rows: {Path(file_path).name}")
+        
+        records_written = 0
+        for chunk in iter_input_chunks(file_path, chunk_size, schema=MAIN_EXPORT_SCHEMA):
+            if row_filter is not None:
+                chunk = row_filter(chunk)
+            if chunk.empty:
+                continue
             
-            logger.info(f"[ENHANCED PROCESSING] Complete:")
-            logger.info(f"  Total processed: {len(result_df):,}")
-            logger.info(f"  Developed properties: {developed_count:,} ({developed_count/len(result_df)*100:.1f}%)")
-            logger.info(f"  Raw land parcels: {raw_land_count:,} ({raw_land_count/len(result_df)*100:.1f}%)")
+            result = self.process_dataframe(chunk)
+            if result.empty:
+                continue
+            if chunk_callback is not None:
+                result = chunk_callback(result)
             
-            return result_df
+            writer.append(result)
+            records_written += len(result)
+            logger.info(f"[ENHANCED PROCESSING] {records_written:,} records written (through row {chunk.index[-1] + 1:,})")
+        
+        return records_written
+    
+    def process_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Classify and score an already loaded DataFrame of property records.
+        
+        Args:
+            df: Property records (main region file columns)
             
-        except Exception as e:
-            logger.error(f"[ENHANCED PROCESSING] Failed to process {file_path}: {e}")
-            raise
\ No newline at end of file
+        Returns:
+            DataFrame with boolean flag columns and separated raw land handling,
+            indexed like the input rows that could be processed
+        """
+        # Validate required columns
+        required_columns = ['Owner 1 Last Name', 'Owner 1 First Name', 'Address']
+        missing_columns = [col for col in required_columns if col not in df.columns]
+        if missing_columns:
+            raise ValueError(f"Missing required columns: {missing_columns}")
+        
+        # Process each row and collect enhanced fields - rows are read from the scoring input
+        # columns only, the other columns are carried over whole
+        enhanced_records = []
+        processed_index = []
+        total_processed = 0
+        
+        scoring_inputs = df[[col for col in SCORING_INPUT_COLUMNS if col in df.columns]]
+        for idx, row in scoring_inputs.iterrows():
+            try:
+                # Process property with enhanced architecture
+                enhanced_record = self.process_property(row)
+                
+                # Convert to dataframe format
+                enhanced_records.append(self.enhanced_fields(enhanced_record))
+                processed_index.append(idx)
+                
+                total_processed += 1
+                
+                # Progress logging every 5000 records
+                if total_processed % 5000 == 0:
+                    logger.info(f"[ENHANCED PROCESSING] Processed {total_processed:,} records...")
+                    
+            except Exception as row_error:
+                logger.warning(f"[ENHANCED PROCESSING] Error processing row {idx}: {row_error}")
+                continue
+        
+        # Create enhanced DataFrame
+        if not enhanced_records:
+            logger.error("[ENHANCED PROCESSING] No records could be processed")
+            return pd.DataFrame()
+        
+        enhanced_df = pd.DataFrame(enhanced_records, index=processed_index, columns=ENHANCED_OUTPUT_COLUMNS)
+        result_df = df.loc[processed_index] if len(processed_index) < len(df) else df
+        result_df = result_df.assign(**{col: enhanced_df[col] for col in ENHANCED_OUTPUT_COLUMNS})
+        
+        # Log processing summary
+        developed_count = len(result_df[result_df['PropertyCategory'] == 'DEVELOPED'])
+        raw_land_count = len(result_df[result_df['PropertyCategory'] == 'RAW_LAND'])
+        
+        logger.info(f"[ENHANCED PROCESSING] Complete:")
+        logger.info(f"  Total processed: {len(result_df):,}")
+        logger.info(f"  Developed properties: {developed_count:,} ({developed_count/len(result_df)*100:.1f}%)")
+        logger.info(f"  Raw land parcels: {raw_land_count:,} ({raw_land_count/len(result_df)*100:.1f}%)")
+        
+        return result_df
\ No newline at end of file
@@ -0,0 +1,328 @@
+"""
+Streaming Excel Access
+
+Helpers for reading workbooks row by row with openpyxl's read-only mode (and
+writing them back with its write-only mode), so large files can be scanned or
+filtered without building a DataFrame of every column.
+
+iter_table_chunks() turns the same row stream into fixed-size DataFrame chunks for
+processing large files in bounded memory.
+
+Large exports are written the same way: write_excel_streaming() appends a DataFrame
+or Parquet file chunk by chunk, so peak memory stays flat as the row count grows
+(DataFrame.to_excel keeps every cell of the workbook in memory until it is saved).
+"""
+
+import csv
+import os
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+from pandas.io.parsers import TextParser
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ColumnScan:
+    """Result of streaming a single column of a worksheet"""
+    columns: List[str]                         # Header row of the worksheet
+    row_count: int = 0                         # Data rows (excluding the header)
+    value_counts: Optional[Counter] = None     # Histogram of non-blank values, None if the column is missing
+    blank_count: int = 0                       # Data rows with a blank value in the column
+
+
+@contextmanager
+def open_worksheet(file_path: Path, sheet_name: Optional[str] = None):
+    """
+    Open a worksheet in read-only (streaming) mode.
+
+    Yields:
+        The named worksheet, or the first worksheet when no name is given
+    """
+    workbook = load_workbook(filename=str(file_path), read_only=True, data_only=True)
+    try:
+        yield workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+    finally:
+        workbook.close()
+
+
+def read_header(worksheet) -> List[str]:
+    """Return the first row of a worksheet as column names (blank headers become '')"""
+    for row in worksheet.iter_rows(min_row=1, max_row=1, values_only=True):
+        return ['' if value is None else str(value) for value in row]
+    return []
+
+
+def iter_column_values(worksheet, column_index: int) -> Iterator:
+    """Yield the values of one column (0-based index) for every data row below the header"""
+    for (value,) in worksheet.iter_rows(min_row=2, min_col=column_index + 1, max_col=column_index + 1,
+                                        values_only=True):
+        yield value
+
+
+def scan_column(file_path: Path, column: str, normalize: Optional[Callable] = None,
+                sheet_name: Optional[str] = None) -> ColumnScan:
+    """
+    Stream one column of a workbook and build a histogram of its values.
+
+    Only the requested column's cells are materialized, so the scan stays cheap even
+    for wide files.
+
+    Args:
+        file_path: Workbook to scan
+        column: Header name of the column to scan
+        normalize: Optional function applied to each value before counting; values that
+            are None or normalize to '' are counted as blank
+        sheet_name: Worksheet to scan (defaults to the first worksheet)
+
+    Returns:
+        ColumnScan with the header, data row count and value histogram
+    """
+    with open_worksheet(file_path, sheet_name) as worksheet:
+        scan = ColumnScan(columns=read_header(worksheet))
+        if column not in scan.columns:
+            # Still count the data rows from the first column
+            scan.row_count = sum(1 for _ in iter_column_values(worksheet, 0)) if scan.columns else 0
+            return scan
+
+        counts = Counter()
+        for value in iter_column_values(worksheet, scan.columns.index(column)):
+            scan.row_count += 1
+            if normalize is not None and value is not None:
+                value = normalize(value)
+            if value is None or value == '':
+                scan.blank_count += 1
+            else:
+                counts[value] += 1
+        scan.value_counts = counts
+
+    return scan
+
+
+def filter_workbook_rows(source_path: Path, destination_path: Path, column: str, keep: Callable[[object], bool],
+                         normalize: Optional[Callable] = None) -> Optional[Dict]:
+    """
+    Copy a workbook row by row, keeping only rows whose value in one column passes a test.
+
+    Rows are streamed from a read-only reader straight into a write-only workbook, so
+    memory stays flat regardless of file size. Completely empty rows are dropped.
+
+    Args:
+        source_path: Workbook to filter (first worksheet)
+        destination_path: Where to write the filtered workbook
+        column: Header name of the column to test
+        keep: Called with the (normalized) column value; rows are kept when it returns True
+        normalize: Optional function applied to non-blank values before testing
+
+    Returns:
+        Dict with 'kept' row count and 'removed' Counter of removed rows per value
+        ('' for blank), or None if the column does not exist
+    """
+    kept = 0
+    removed = Counter()
+
+    with open_worksheet(source_path) as worksheet:
+        header = next(worksheet.iter_rows(min_row=1, max_row=1, values_only=True), ())
+        columns = ['' if value is None else str(value) for value in header]
+        if column not in columns:
+            return None
+        column_index = columns.index(column)
+
+        output_workbook = Workbook(write_only=True)
+        output_sheet = output_workbook.create_sheet(title=worksheet.title)
+        output_sheet.append(header)
+
+        for row in worksheet.iter_rows(min_row=2, values_only=True):
+            if all(value is None for value in row):
+                continue
+            value = row[column_index] if column_index < len(row) else None
+            if value is not None and normalize is not None:
+                value = normalize(value)
+            if value is None:
+                value = ''
+
+            if keep(value):
+                output_sheet.append(row)
+                kept += 1
+            else:
+                removed[value] += 1
+
+        output_workbook.save(str(destination_path))
+
+    return {'kept': kept, 'removed': removed}
+
+
+@contextmanager
+def open_table_rows(file_path: Path):
+    """
+    Stream the rows of an Excel workbook (first worksheet) or CSV file.
+
+    Yields:
+        tuple: (header as list of column names, iterator over data rows as tuples).
+        Completely empty rows are skipped. CSV values are read as text.
+    """
+    file_path = Path(file_path)
+
+    if file_path.suffix.lower() == '.csv':
+        with open(file_path, 'r', newline='', encoding='utf-8-sig') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            rows = (tuple(value if value != '' else None for value in row)
+                    for row in reader if any(value != '' for value in row))
+            yield list(header), rows
+        return
+
+    with open_worksheet(file_path) as worksheet:
+        rows = worksheet.iter_rows(values_only=True)
+        header = ['' if value is None else str(value) for value in next(rows, ())]
+        yield header, (row for row in rows if any(value is not None for value in row))
+
+
+def iter_table_chunks(file_path: Path, chunk_size: int, columns: Optional[List[str]] = None,
+                      dtype: Optional[Dict] = None) -> Iterator[pd.DataFrame]:
+    """
+    Stream a workbook (first worksheet) or CSV file as DataFrames of at most chunk_size rows.
+
+    Values are typed the way pd.read_excel types them (numeric-looking text becomes
+    numbers), chunk by chunk. Chunks are indexed by data row number, continuing from
+    one chunk to the next, so row numbers from a first pass (e.g. over key columns
+    only) identify the same rows in a second pass.
+
+    Args:
+        file_path: Workbook or CSV file
+        chunk_size: Maximum rows per chunk
+        columns: Only keep these columns (ones missing from the file are skipped)
+        dtype: Column dtypes to parse into, as for pd.read_excel
+
+    Yields:
+        DataFrame per chunk
+    """
+    with open_table_rows(file_path) as (header, rows):
+        width = len(header)
+        positions = list(range(width)) if columns is None else [header.index(column) for column in columns
+                                                                if column in header]
+        names = [header[position] for position in positions]
+        dtype = {column: column_dtype for column, column_dtype in (dtype or {}).items() if column in names} or None
+
+        def to_frame(batch: List[list], start: int) -> pd.DataFrame:
+            # Same parser pd.read_excel runs over the cell values
+            df = TextParser([names] + batch, header=0, dtype=dtype).read() if batch else pd.DataFrame(columns=names)
+            df.index = pd.RangeIndex(start, start + len(batch))
+            return df
+
+        start = 0
+        batch = []
+        for row in rows:
+            row = tuple(row[:width]) + (None,) * (width - len(row))
+            batch.append([row[position] for position in positions])
+            if len(batch) == chunk_size:
+                yield to_frame(batch, start)
+                start += len(batch)
+                batch = []
+        if batch or start == 0:
+            yield to_frame(batch, start)
+
+
+class StreamingExcelWriter:
+    """
+    Append-only workbook writer with constant memory use.
+
+    Rows go straight to openpyxl's write-only worksheet (spooled to disk), so only the
+    current row is held in memory. The workbook is written to a temporary name and
+    moved into place on close, so readers never see a half-written file.
+    """
+
+    def __init__(self, path: Path, columns: List[str], sheet_name: str = 'Sheet1'):
+        self.path = Path(path)
+        self.temp_path = self.path.with_name(f".{self.path.name}.writing")
+        self.rows_written = 0
+        self.workbook = Workbook(write_only=True)
+        self.worksheet = self.workbook.create_sheet(title=sheet_name)
+        self.worksheet.append(list(columns))
+
+    def append(self, row) -> None:
+        """Append one data row (sequence of cell values in column order)"""
+        self.worksheet.append(list(row))
+        self.rows_written += 1
+
+    def close(self) -> Path:
+        """Save the workbook and move it to its final path"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.workbook.save(str(self.temp_path))
+        os.replace(self.temp_path, self.path)
+        return self.path
+
+    def discard(self) -> None:
+        """Abandon the workbook without writing it"""
+        self.workbook.close()
+        if self.temp_path.exists():
+            self.temp_path.unlink()
+
+
+def _frame_rows(df) -> Iterator[tuple]:
+    """Rows of a DataFrame as tuples of plain cell values (missing values become empty cells)"""
+    cells = df.astype(object).where(df.notna(), None)
+    return cells.itertuples(index=False, name=None)
+
+
+def _source_chunks(source, chunk_size: int) -> Iterator:
+    """Yield DataFrame chunks from a DataFrame or a Parquet file"""
+    if isinstance(source, (str, Path)):
+        import pyarrow.parquet as pq  # Only needed for Parquet sources
+
+        parquet_file = pq.ParquetFile(str(source))
+        for batch in parquet_file.iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+        return
+
+    for start in range(0, len(source), chunk_size):
+        yield source.iloc[start:start + chunk_size]
+
+
+def write_excel_streaming(source, path: Path, sheet_name: str = 'Sheet1', chunk_size: int = 10000,
+                          columns: Optional[List[str]] = None) -> int:
+    """
+    Write a DataFrame or Parquet file to a single-sheet workbook in constant memory.
+
+    Rows are converted and appended one chunk at a time through StreamingExcelWriter,
+    so peak memory depends on the chunk size rather than the row count. The layout
+    matches DataFrame.to_excel(index=False): one header row in column order, then the
+    data rows.
+
+    Args:
+        source: DataFrame, or path of a Parquet file
+        path: Workbook to write
+        sheet_name: Worksheet title
+        chunk_size: Rows converted per chunk
+        columns: Column order (defaults to the source's column order)
+
+    Returns:
+        Number of data rows written
+    """
+    writer = None
+    try:
+        for chunk in _source_chunks(source, chunk_size):
+            if writer is None:
+                columns = list(columns or chunk.columns)
+                writer = StreamingExcelWriter(path, [str(column) for column in columns], sheet_name)
+            for row in _frame_rows(chunk[columns]):
+                writer.append(row)
+
+        if writer is None:
+            # Empty source - still write the header
+            header = columns or (list(source.columns) if hasattr(source, 'columns') else [])
+            writer = StreamingExcelWriter(path, [str(column) for column in header], sheet_name)
+        writer.close()
+    except Exception:
+        if writer is not None:
+            writer.discard()
+        raise
+
+    return writer.rows_written
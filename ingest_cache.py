@@ -0,0 +1,251 @@
+"""
+Excel Ingest Cache
+
+Vendor workbooks (main region exports, landlords.xlsx, liens.xlsx, ...) are read
+by monthly processing, the property processors and skip trace, often many times
+across runs while the files themselves rarely change. Parsing .xlsx is by far the
+slowest step of loading them.
+
+The ingest cache converts each workbook once into a Parquet file and serves later
+reads from it. Entries are content-addressed: the key is the workbook's SHA-256
+plus the read options used (dtype, header, sheet, ...), so a re-exported file with
+the same name is never served stale data, and the same file read with different
+options gets its own entry.
+
+A workbook that can't be stored as Parquet without changing its values (a column
+mixing text and numbers, for example) is not cached: it is parsed from Excel every
+time, so cached and uncached reads always return the same DataFrame. Parquet does
+not keep categories of numeric values, so 'category' dtype options are applied
+after loading (cached or not) instead of during the parse.
+
+Workbook hashes come from input_fingerprint.fingerprint_file: the cache keeps the
+size/modification time/SHA-256 fingerprint of every workbook it has read (and takes
+fingerprints the region input catalog already has), so an unchanged workbook is
+never re-read just to compute its key.
+
+Entries are evicted oldest-use first once the cache exceeds its size limit, and
+entries unused for longer than the age limit are removed.
+
+Cache location: output/ingest_cache/
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+import pandas as pd
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from columnar_io import COLUMNAR_SUFFIX, columnar_available, read_columnar, write_columnar
+from input_fingerprint import fingerprint_file
+
+logger = logging.getLogger(__name__)
+
+INGEST_CACHE_DIR = Path("output") / "ingest_cache"
+INGEST_CACHE_MAX_MB = 2048       # Least recently used entries are evicted above this size
+INGEST_CACHE_MAX_AGE_DAYS = 90   # Entries not read for this long are evicted
+FINGERPRINTS_FILENAME = "fingerprints.json"
+
+# Bump when the conversion changes so old entries stop matching
+INGEST_CACHE_VERSION = 1
+
+
+def ingest_key(file_hash: str, read_options: Dict) -> str:
+    """Cache key of a workbook's content hash and the read options used to parse it"""
+    payload = json.dumps({'sha256': file_hash, 'options': read_options, 'version': INGEST_CACHE_VERSION,
+                          'pandas': pd.__version__}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _split_category_dtypes(read_options: Dict) -> Tuple[Dict, List[str]]:
+    """Separate 'category' dtype options (applied after loading) from the parse options"""
+    dtype = read_options.get('dtype')
+    if not isinstance(dtype, dict):
+        return read_options, []
+    category_columns = [column for column, column_dtype in dtype.items() if column_dtype == 'category']
+    parse_dtype = {column: column_dtype for column, column_dtype in dtype.items() if column not in category_columns}
+    parse_options = {name: value for name, value in read_options.items() if name != 'dtype'}
+    if parse_dtype:
+        parse_options['dtype'] = parse_dtype
+    return parse_options, category_columns
+
+
+class IngestCache:
+    """Parquet copies of parsed workbooks, shared across runs and tools"""
+
+    def __init__(self, cache_dir: Path = INGEST_CACHE_DIR, max_size_mb: float = INGEST_CACHE_MAX_MB,
+                 max_age_days: float = INGEST_CACHE_MAX_AGE_DAYS, log: logging.Logger = logger):
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.max_age_seconds = max_age_days * 24 * 60 * 60
+        self.log = log
+        self.enabled = columnar_available()
+        self.hits = 0
+        self.misses = 0
+        self._fingerprints: Optional[Dict[str, Dict]] = None
+
+    def _entry_path(self, file_path: Path, key: str) -> Path:
+        return self.cache_dir / f"{file_path.stem}_{key[:20]}{COLUMNAR_SUFFIX}"
+
+    def read_excel(self, file_path: Path, **read_options) -> pd.DataFrame:
+        """
+        Read a workbook like pd.read_excel, from the cache when an entry exists.
+
+        Args:
+            file_path: Workbook to read
+            **read_options: Keyword arguments for pd.read_excel (part of the cache key)
+
+        Returns:
+            Parsed DataFrame
+        """
+        file_path = Path(file_path)
+        parse_options, category_columns = _split_category_dtypes(read_options)
+        df = self._load(file_path, parse_options)
+        for column in category_columns:
+            if column in df.columns:
+                df[column] = df[column].astype('category')
+        return df
+
+    def _load(self, file_path: Path, parse_options: Dict) -> pd.DataFrame:
+        """Parsed workbook from the cache entry for these options, converting it on a miss"""
+        if not self.enabled:
+            return pd.read_excel(file_path, **parse_options)
+
+        key = ingest_key(self.file_hash(file_path), parse_options)
+        entry_path = self._entry_path(file_path, key)
+
+        if entry_path.exists():
+            try:
+                df = read_columnar(entry_path)
+                os.utime(entry_path)  # Last use, for eviction
+                self.hits += 1
+                self.log.info(f"Ingest cache: {file_path.name} served from {entry_path.name}")
+                return df
+            except Exception as e:
+                self.log.warning(f"Ingest cache: unreadable entry {entry_path.name} ({e}) - parsing workbook")
+
+        self.misses += 1
+        df = pd.read_excel(file_path, **parse_options)
+        self._store(file_path, entry_path, df)
+        return df
+
+    def _fingerprint_index(self) -> Dict[str, Dict]:
+        """Stored fingerprints by resolved workbook path (loaded on first use)"""
+        if self._fingerprints is None:
+            self._fingerprints = {}
+            index_path = self.cache_dir / FINGERPRINTS_FILENAME
+            if index_path.exists():
+                try:
+                    with open(index_path, 'r') as f:
+                        self._fingerprints = json.load(f)
+                except (json.JSONDecodeError, OSError) as e:
+                    self.log.warning(f"Ingest cache: ignoring unreadable {index_path.name} ({e})")
+        return self._fingerprints
+
+    def add_fingerprints(self, fingerprints: Dict[Path, Dict]) -> None:
+        """Take fingerprints computed elsewhere (e.g. the region input catalog), keyed by file path"""
+        index = self._fingerprint_index()
+        for file_path, fingerprint in fingerprints.items():
+            index[str(Path(file_path).resolve())] = fingerprint
+
+    def file_hash(self, file_path: Path) -> str:
+        """SHA-256 of a workbook, only read from disk when its size or modification time changed"""
+        index = self._fingerprint_index()
+        path_key = str(Path(file_path).resolve())
+        previous = index.get(path_key)
+        fingerprint = fingerprint_file(file_path, previous)
+        if fingerprint != previous:
+            index[path_key] = fingerprint
+            self._save_fingerprints()
+        return fingerprint['sha256']
+
+    def _save_fingerprints(self) -> None:
+        """Write the fingerprint index, dropping workbooks that no longer exist"""
+        index = {path: fingerprint for path, fingerprint in self._fingerprint_index().items() if Path(path).exists()}
+        self._fingerprints = index
+        index_path = self.cache_dir / FINGERPRINTS_FILENAME
+        # Unique temp name so processes updating the index don't collide (the last writer wins)
+        temp_path = index_path.with_name(f".{index_path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'w') as f:
+                json.dump(index, f)
+            os.replace(temp_path, index_path)
+        except OSError as e:
+            temp_path.unlink(missing_ok=True)
+            self.log.warning(f"Ingest cache: could not save {index_path.name} ({e})")
+
+    def _store(self, file_path: Path, entry_path: Path, df: pd.DataFrame) -> bool:
+        """Write a cache entry; False (and nothing written) if the frame can't be stored as-is"""
+        # Unique temp name so processes converting the same workbook don't collide
+        temp_path = entry_path.with_name(f".{entry_path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            write_columnar(df, temp_path)
+            os.replace(temp_path, entry_path)
+        except Exception as e:
+            temp_path.unlink(missing_ok=True)
+            self.log.info(f"Ingest cache: not caching {file_path.name} ({e})")
+            return False
+
+        self.log.info(f"Ingest cache: stored {file_path.name} ({len(df):,} rows) as {entry_path.name}")
+        self.evict()
+        return True
+
+    def entries(self) -> List[Path]:
+        """Cache entries, least recently used first"""
+        if not self.cache_dir.exists():
+            return []
+        return sorted(self.cache_dir.glob(f"*{COLUMNAR_SUFFIX}"), key=lambda path: path.stat().st_mtime)
+
+    def evict(self, max_size_bytes: Optional[int] = None, max_age_seconds: Optional[float] = None) -> int:
+        """
+        Remove entries older than the age limit, then least recently used entries
+        until the cache fits the size limit.
+
+        Returns:
+            Number of entries removed
+        """
+        max_size_bytes = self.max_size_bytes if max_size_bytes is None else max_size_bytes
+        max_age_seconds = self.max_age_seconds if max_age_seconds is None else max_age_seconds
+
+        removed = 0
+        cutoff = time.time() - max_age_seconds
+        remaining = []
+        for entry in self.entries():
+            stat = entry.stat()
+            if stat.st_mtime < cutoff:
+                entry.unlink(missing_ok=True)
+                removed += 1
+            else:
+                remaining.append((entry, stat.st_size))
+
+        total_size = sum(size for _, size in remaining)
+        for entry, size in remaining:
+            if total_size <= max_size_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total_size -= size
+            removed += 1
+
+        if removed:
+            self.log.info(f"Ingest cache: evicted {removed} entries, {total_size / 1024 / 1024:.1f} MB remaining")
+        return removed
+
+
+_default_cache: Optional[IngestCache] = None
+
+
+def default_ingest_cache() -> IngestCache:
+    """The process-wide cache under output/ingest_cache"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = IngestCache()
+    return _default_cache
+
+
+def read_excel_cached(file_path: Path, **read_options) -> pd.DataFrame:
+    """pd.read_excel through the shared ingest cache"""
+    return default_ingest_cache().read_excel(file_path, **read_options)
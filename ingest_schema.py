@@ -0,0 +1,268 @@
+"""
+Ingest Schemas
+
+Declared column types for each kind of input file: the vendor main export (also
+the layout of recent sales and vendor niche lists), government niche files, the
+skip trace vendor file and county GIS parcel exports. Readers pass the declared
+dtypes to the parser, so columns are parsed straight into their final types and
+come out the same on every run, instead of being inspected and converted after
+loading.
+
+Column kinds:
+- text: names, addresses and identifiers, as Arrow-backed strings (identifiers such
+  as APNs keep leading zeros when read from CSV)
+- category: low-cardinality labels (City, State, FIPS, Y/N fields, ...)
+- count: nullable integers (zip codes, bedrooms, years)
+- amount: whole-dollar amounts as float32 (exact up to $16.7M)
+- money: amounts with cents, kept as float64 so cents survive
+- date: datetime64; values that can't be parsed become missing (and are logged)
+
+Columns not declared keep the type the parser infers. A column whose values don't
+fit its declared type (e.g. a zip code column holding ZIP+4 text) is left as parsed
+with a warning rather than failing the read.
+"""
+
+import logging
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+TEXT = 'text'
+CATEGORY = 'category'
+COUNT = 'count'
+AMOUNT = 'amount'
+MONEY = 'money'
+DATE = 'date'
+
+
+def _text_dtype():
+    """Arrow-backed strings with NaN for missing values (pandas' default str dtype from 3.0)"""
+    try:
+        return pd.StringDtype('pyarrow', na_value=np.nan)
+    except (ImportError, TypeError):
+        # pyarrow missing or pandas older than 2.3 - plain Python strings
+        return object
+
+
+_KIND_DTYPES = {
+    TEXT: _text_dtype(),
+    CATEGORY: 'category',
+    COUNT: 'Int32',
+    AMOUNT: 'float32',
+    MONEY: 'float64',
+}
+
+# Kinds every value can be parsed into, whatever the file holds
+_SAFE_KINDS = {TEXT, CATEGORY}
+
+
+@dataclass(frozen=True, repr=False)
+class SourceSchema:
+    """Declared column kinds of one source type"""
+    name: str
+    columns: Dict[str, str]   # Column name -> kind
+
+    def __repr__(self) -> str:
+        return f"SourceSchema({self.name})"
+
+    def parser_dtypes(self, safe_only: bool = False) -> Dict[str, object]:
+        """
+        dtype map for pd.read_csv / pd.read_excel (dates are parsed separately).
+
+        Args:
+            safe_only: Only text and category columns, which can't fail to parse
+        """
+        return {column: _KIND_DTYPES[kind] for column, kind in self.columns.items()
+                if kind != DATE and (not safe_only or kind in _SAFE_KINDS)}
+
+    def date_columns(self) -> List[str]:
+        """Columns declared as dates"""
+        return [column for column, kind in self.columns.items() if kind == DATE]
+
+    def apply(self, df: pd.DataFrame, source_name: str = '') -> pd.DataFrame:
+        """
+        Convert the declared columns of a loaded frame that aren't in their type yet.
+
+        Columns already parsed into their type are untouched, so after a typed parse
+        only the date columns are converted.
+        """
+        label = source_name or self.name
+        converted = {}
+        for column, kind in self.columns.items():
+            if column not in df.columns:
+                continue
+            values = df[column]
+            if kind == DATE:
+                converted_values = _to_dates(values, column, label)
+            else:
+                target = _KIND_DTYPES[kind]
+                if _has_dtype(values, target):
+                    continue
+                try:
+                    converted_values = values.astype(target)
+                except (ValueError, TypeError) as e:
+                    logger.warning(f"{label}: column '{column}' does not fit {kind} ({e}) - kept as {values.dtype}")
+                    continue
+            if converted_values is not values:
+                converted[column] = converted_values
+
+        if not converted:
+            return df
+        df = df.copy(deep=False)
+        for column, values in converted.items():
+            df[column] = values
+        return df
+
+
+def _has_dtype(values: pd.Series, target) -> bool:
+    try:
+        return values.dtype == target
+    except TypeError:
+        return False
+
+
+def _to_dates(values: pd.Series, column: str, label: str) -> pd.Series:
+    """Parse a date column; unparseable values become NaT and are counted in the log"""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    if pd.api.types.is_numeric_dtype(values) and values.notna().any():
+        # Numbers aren't dates (pd.to_datetime would read them as epoch offsets)
+        logger.warning(f"{label}: date column '{column}' holds numbers - kept as {values.dtype}")
+        return values
+
+    parsed = pd.to_datetime(values, errors='coerce', format='mixed')
+    failed = int((parsed.isna() & values.notna() & values.astype(str).str.strip().ne('')).sum())
+    if failed:
+        logger.warning(f"{label}: {failed:,} values in date column '{column}' could not be parsed")
+    return parsed
+
+
+# Vendor main export - also the layout of recent sales files and vendor niche lists
+MAIN_EXPORT_SCHEMA = SourceSchema('main export', {
+    'Owner 1 Last Name': TEXT,
+    'Owner 1 First Name': TEXT,
+    'Address': TEXT,
+    'City': CATEGORY,
+    'State': CATEGORY,
+    'Zip': COUNT,
+    'County': CATEGORY,
+    'APN': TEXT,
+    'Owner Occupied': CATEGORY,
+    'Mailing Address': TEXT,
+    'Mailing Unit #': TEXT,
+    'Mailing City': CATEGORY,
+    'Mailing State': CATEGORY,
+    'Mailing Zip': COUNT,
+    'Mailing Zip+4': COUNT,
+    'Do Not Mail': CATEGORY,
+    'Property Class': CATEGORY,
+    'Property Type': CATEGORY,
+    'Bedrooms': COUNT,
+    'Building Sqft': COUNT,
+    'Lot Size Sqft': COUNT,
+    'Year Built': COUNT,
+    'Effective Year Built': COUNT,
+    'Vacant': CATEGORY,
+    'HOA Present': CATEGORY,
+    'Total Assessed Value': AMOUNT,
+    'Assessed Land Value': AMOUNT,
+    'Assessed Improvement Value': AMOUNT,
+    'Last Sale Date': DATE,
+    'Last Sale Amount': AMOUNT,
+    'Last Cash Buyer': CATEGORY,
+    'Prior Sale Date': DATE,
+    'Prior Sale Amount': AMOUNT,
+    'Prior Sale Cash Buyer': CATEGORY,
+    'Prior Sale Buyer Name 1': TEXT,
+    'Prior Sale Buyer Name 2': TEXT,
+    'Loan 1 Date': DATE,
+    'Loan 1 Balance': AMOUNT,
+    'Loan 1 Type': CATEGORY,
+    'Loan 1 Lender': TEXT,
+    'Total Open Loans': COUNT,
+    'Est. Remaining balance of Open Loans': AMOUNT,
+    'Est. Value': AMOUNT,
+    'Est. Equity': AMOUNT,
+    'Monthly Rent': MONEY,
+    'Lien Type': CATEGORY,
+    'Lien Date': DATE,
+    'Lien Amount': MONEY,
+    'BK Date': DATE,
+    'Divorce Date': DATE,
+    'Pre-FC Recording Date': DATE,
+    'Pre-FC Unpaid Balance': MONEY,
+    'Pre-FC Default Amount': MONEY,
+    'Pre-FC Auction Date': DATE,
+    'Date Added to List': DATE,
+    'Method of Add': CATEGORY,
+    'ListPriority': CATEGORY,
+    'FIPS': CATEGORY,
+})
+
+# Government niche files (tools/government_data_standardizer.py) use the export layout
+# plus these columns; zips and sale amounts are written as formatted text ('$125,000')
+_GOVERNMENT_NICHE_COLUMNS = {
+    'Parcel ID': TEXT,
+    'Current Owner': TEXT,
+    'Data_Source': CATEGORY,
+    'Case Number': TEXT,
+    'Case Type': CATEGORY,
+    'Status': CATEGORY,
+    'Zip': TEXT,
+    'Mailing Zip': TEXT,
+    'Mailing Zip+4': TEXT,
+    'Last Sale Amount': TEXT,
+}
+
+# Niche types produced by the government data standardizer
+GOVERNMENT_NICHE_TYPES = {'CodeEnforcement', 'CurrentTax', 'Inherited'}
+
+SKIP_TRACE_SCHEMA = SourceSchema('skip trace', {
+    'Property Address': TEXT,
+    'Property APN': TEXT,
+    'Property FIPS': CATEGORY,
+    'Golden Address': TEXT,
+    'Golden City': CATEGORY,
+    'Golden State': CATEGORY,
+    'Golden Zip': TEXT,
+    # Distress dates - a date marks the event, anything else ('No Data') means none
+    'Owner Bankruptcy': DATE,
+    'Owner Foreclosure': DATE,
+    'Lien': DATE,
+    'Judgment': DATE,
+    'Quitclaim': DATE,
+})
+
+# County GIS parcel exports (tools/gis_utils.py); SALEDATE1 stays text because the
+# cleaners filter its placeholder values ('1776/07/04 ...') as strings
+GIS_SCHEMA = SourceSchema('GIS parcels', {
+    'TAXID': TEXT,
+    'LOCADDR': TEXT,
+    'OWNERADDR1': TEXT,
+    'MAILCITY': CATEGORY,
+    'MAILSTATE': CATEGORY,
+    'MAINZIPCOD': TEXT,
+    'PROPERTYDE': CATEGORY,
+    'ZONEDESC': CATEGORY,
+    'LEGALDESC': TEXT,
+    'SALEDATE1': TEXT,
+    'SALEAMT1': AMOUNT,
+    'TOTALVAL1': AMOUNT,
+    'LANDVAL1': AMOUNT,
+    'DWELLINGVA': AMOUNT,
+})
+
+_niche_schemas: Dict[str, SourceSchema] = {}
+
+
+def niche_schema(niche_type: str) -> SourceSchema:
+    """Schema of a niche file of the given type (vendor lists share the main export layout)"""
+    if niche_type not in GOVERNMENT_NICHE_TYPES:
+        return MAIN_EXPORT_SCHEMA
+    if niche_type not in _niche_schemas:
+        _niche_schemas[niche_type] = SourceSchema(f"{niche_type} niche",
+                                                  {**MAIN_EXPORT_SCHEMA.columns, **_GOVERNMENT_NICHE_COLUMNS})
+    return _niche_schemas[niche_type]
@@ -0,0 +1,268 @@
+"""
+Input File Adapters
+
+Region main and niche files arrive as Excel workbooks, CSV exports (vendors and
+county GIS systems, often past Excel's row limit), Parquet or Feather files. This
+module is the one loader every processor reads them through:
+
+- discover_input_files() lists a directory's input files across formats; when the
+  same file exists in several formats (liens.xlsx and liens.parquet), only the
+  preferred one is used - columnar first, Excel last
+- read_input() loads a whole file (Excel through the ingest cache)
+- iter_input_chunks() streams a file in fixed-size row chunks
+
+Both take an optional ingest_schema.SourceSchema, whose declared dtypes are handed
+to the parser so columns are read straight into their final types.
+- scan_input_column() histograms one column for cataloging and FIPS validation
+- filter_input_rows() rewrites a file keeping only rows that pass a test
+
+CSV files are parsed with pandas' C parser, which is much faster than reading a
+workbook; Parquet and Feather files are read column-wise without parsing at all.
+"""
+
+import logging
+import pandas as pd
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+from columnar_io import COLUMNAR_SUFFIX, coerce_mixed_columns
+from excel_streaming import ColumnScan, filter_workbook_rows, iter_table_chunks, scan_column
+from ingest_cache import IngestCache, default_ingest_cache
+from ingest_schema import SourceSchema
+
+logger = logging.getLogger(__name__)
+
+FEATHER_SUFFIX = ".feather"
+CSV_SUFFIX = ".csv"
+EXCEL_SUFFIX = ".xlsx"
+
+# Supported input formats, most preferred first
+INPUT_SUFFIXES = (COLUMNAR_SUFFIX, FEATHER_SUFFIX, CSV_SUFFIX, EXCEL_SUFFIX)
+
+
+def is_input_file(path: Path) -> bool:
+    """True for a supported input file (temporary and lock files like .~x.xlsx or ~$x.xlsx excluded)"""
+    path = Path(path)
+    return path.suffix.lower() in INPUT_SUFFIXES and not path.name.startswith(('.', '~$'))
+
+
+def discover_input_files(directory: Path) -> List[Path]:
+    """
+    Input files of a directory, one per file stem, sorted by name.
+
+    When a stem exists in several formats the most preferred format is returned
+    (see INPUT_SUFFIXES), e.g. a standardized liens.parquet is read instead of the
+    liens.xlsx copy next to it.
+    """
+    directory = Path(directory)
+    if not directory.exists():
+        return []
+
+    preferred: Dict[str, Path] = {}
+    for path in directory.iterdir():
+        if not path.is_file() or not is_input_file(path):
+            continue
+        current = preferred.get(path.stem)
+        if current is None or INPUT_SUFFIXES.index(path.suffix.lower()) < INPUT_SUFFIXES.index(current.suffix.lower()):
+            preferred[path.stem] = path
+
+    return sorted(preferred.values(), key=lambda path: path.name)
+
+
+def _apply_dtypes(df: pd.DataFrame, dtype: Optional[Dict]) -> pd.DataFrame:
+    """Cast the columns of a loaded frame that have a requested dtype"""
+    if not dtype:
+        return df
+    casts = {column: column_dtype for column, column_dtype in dtype.items() if column in df.columns}
+    return df.astype(casts) if casts else df
+
+
+def read_input(file_path: Path, columns: Optional[List[str]] = None, dtype: Optional[Dict] = None,
+               cache: Optional[IngestCache] = None, schema: Optional[SourceSchema] = None) -> pd.DataFrame:
+    """
+    Load an input file of any supported format.
+
+    Args:
+        file_path: Excel, CSV, Parquet or Feather file
+        columns: Only load these columns
+        dtype: Column dtypes (e.g. {'FIPS': 'category'}); for CSV and Excel files they
+            are used while parsing, so text columns such as APNs keep leading zeros
+        cache: Ingest cache for Excel files (defaults to the shared cache)
+        schema: Declared column types of the source (dtype entries take precedence)
+
+    Returns:
+        DataFrame of the file's rows
+    """
+    if schema is None:
+        return _read_file(Path(file_path), columns, dtype, cache)
+
+    try:
+        df = _read_file(Path(file_path), columns, {**schema.parser_dtypes(), **(dtype or {})}, cache)
+    except (ValueError, TypeError) as e:
+        # Some column doesn't fit its declared type - parse only the types that can't
+        # fail, and convert the rest column by column
+        logger.warning(f"{Path(file_path).name}: typed parse failed ({e}) - converting columns individually")
+        df = _read_file(Path(file_path), columns, {**schema.parser_dtypes(safe_only=True), **(dtype or {})}, cache)
+    return schema.apply(df, Path(file_path).name)
+
+
+def _read_file(file_path: Path, columns: Optional[List[str]], dtype: Optional[Dict],
+               cache: Optional[IngestCache]) -> pd.DataFrame:
+    suffix = file_path.suffix.lower()
+
+    if suffix == COLUMNAR_SUFFIX:
+        return _apply_dtypes(pd.read_parquet(file_path, engine='pyarrow', columns=columns), dtype)
+    if suffix == FEATHER_SUFFIX:
+        return _apply_dtypes(pd.read_feather(file_path, columns=columns), dtype)
+    if suffix == CSV_SUFFIX:
+        return pd.read_csv(file_path, usecols=columns, dtype=dtype, low_memory=False)
+    if suffix == EXCEL_SUFFIX:
+        read_options = {'dtype': dtype} if dtype else {}
+        if columns is not None:
+            read_options['usecols'] = columns
+        return (cache or default_ingest_cache()).read_excel(file_path, **read_options)
+    raise ValueError(f"Unsupported input format: {file_path.name}")
+
+
+def iter_input_chunks(file_path: Path, chunk_size: int, columns: Optional[List[str]] = None,
+                      dtype: Optional[Dict] = None, schema: Optional[SourceSchema] = None) -> Iterator[pd.DataFrame]:
+    """
+    Stream an input file of any supported format in chunks of at most chunk_size rows.
+
+    Chunks are indexed by row number, continuing from one chunk to the next (see
+    excel_streaming.iter_table_chunks). Columns missing from the file are skipped.
+    With a schema, CSV chunks are parsed with its text and category dtypes (a later
+    chunk can't fail mid-file) and every chunk is then converted to the declared types.
+
+    Yields:
+        DataFrame per chunk
+    """
+    if schema is None:
+        yield from _iter_file_chunks(Path(file_path), chunk_size, columns, dtype)
+        return
+
+    dtype = {**schema.parser_dtypes(safe_only=True), **(dtype or {})}
+    for chunk in _iter_file_chunks(Path(file_path), chunk_size, columns, dtype):
+        yield schema.apply(chunk, Path(file_path).name)
+
+
+def _iter_file_chunks(file_path: Path, chunk_size: int, columns: Optional[List[str]],
+                      dtype: Optional[Dict]) -> Iterator[pd.DataFrame]:
+    suffix = file_path.suffix.lower()
+
+    if suffix == EXCEL_SUFFIX:
+        yield from iter_table_chunks(file_path, chunk_size, columns, dtype)
+        return
+
+    if suffix == CSV_SUFFIX:
+        usecols = None if columns is None else (lambda column: column in columns)
+        with pd.read_csv(file_path, usecols=usecols, dtype=dtype, chunksize=chunk_size) as reader:
+            yield from reader
+        return
+
+    if suffix not in (COLUMNAR_SUFFIX, FEATHER_SUFFIX):
+        raise ValueError(f"Unsupported input format: {file_path.name}")
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    start = 0
+    if suffix == COLUMNAR_SUFFIX:
+        parquet_file = pq.ParquetFile(file_path)
+        if columns is not None:
+            columns = [column for column in columns if column in parquet_file.schema_arrow.names]
+        batches = parquet_file.iter_batches(batch_size=chunk_size, columns=columns)
+    else:
+        # Feather (Arrow IPC) files are memory-mapped, so slicing doesn't load the whole file
+        table = pa.ipc.open_file(pa.memory_map(str(file_path))).read_all()
+        if columns is not None:
+            table = table.select([column for column in columns if column in table.column_names])
+        batches = (table.slice(offset, chunk_size) for offset in range(0, table.num_rows, chunk_size))
+
+    for batch in batches:
+        chunk = batch.to_pandas()
+        chunk.index = pd.RangeIndex(start, start + len(chunk))
+        start += len(chunk)
+        yield _apply_dtypes(chunk, dtype)
+
+
+def input_columns(file_path: Path) -> List[str]:
+    """Column names of an input file, without reading its rows"""
+    file_path = Path(file_path)
+    suffix = file_path.suffix.lower()
+    if suffix == COLUMNAR_SUFFIX:
+        import pyarrow.parquet as pq
+        return list(pq.read_schema(file_path).names)
+    if suffix == FEATHER_SUFFIX:
+        import pyarrow as pa
+        return list(pa.ipc.open_file(pa.memory_map(str(file_path))).schema.names)
+    if suffix == CSV_SUFFIX:
+        return list(pd.read_csv(file_path, nrows=0).columns)
+    return list(next(iter_table_chunks(file_path, 1)).columns)
+
+
+def scan_input_column(file_path: Path, column: str, normalize: Optional[Callable] = None) -> ColumnScan:
+    """
+    Histogram one column of an input file (see excel_streaming.scan_column).
+
+    Workbooks are streamed cell by cell; other formats load only the one column.
+    """
+    file_path = Path(file_path)
+    if file_path.suffix.lower() == EXCEL_SUFFIX:
+        return scan_column(file_path, column, normalize=normalize)
+
+    columns = input_columns(file_path)
+    scan = ColumnScan(columns=columns)
+    if column not in columns:
+        scan.row_count = len(read_input(file_path, columns=columns[:1])) if columns else 0
+        return scan
+
+    # CSV values are read as text, as the workbook scan sees text cells
+    values = read_input(file_path, columns=[column], dtype={column: str} if file_path.suffix.lower() == CSV_SUFFIX
+                        else None)[column]
+    scan.row_count = len(values)
+    values = values.dropna()
+    if normalize is not None:
+        values = values.map(normalize)
+    values = values[values != '']
+    scan.blank_count = scan.row_count - len(values)
+    scan.value_counts = Counter(values.tolist())
+    return scan
+
+
+def filter_input_rows(source_path: Path, destination_path: Path, column: str, keep: Callable[[object], bool],
+                      normalize: Optional[Callable] = None) -> Optional[Dict]:
+    """
+    Write a copy of an input file keeping only rows whose value in one column passes a test.
+
+    Workbooks are streamed row by row (see excel_streaming.filter_workbook_rows); other
+    formats are filtered in memory and written back in the same format.
+
+    Returns:
+        Dict with 'kept' row count and 'removed' Counter of removed rows per value
+        ('' for blank), or None if the column does not exist
+    """
+    source_path = Path(source_path)
+    suffix = source_path.suffix.lower()
+    if suffix == EXCEL_SUFFIX:
+        return filter_workbook_rows(source_path, destination_path, column, keep, normalize)
+
+    # Text columns stay text when a CSV is rewritten
+    df = read_input(source_path, dtype=str if suffix == CSV_SUFFIX else None)
+    if column not in df.columns:
+        return None
+
+    values = df[column].map(lambda value: '' if pd.isna(value) else (normalize(value) if normalize else value))
+    kept_mask = values.map(keep).astype(bool)
+    removed = Counter(values[~kept_mask].tolist())
+    kept = df[kept_mask]
+
+    if suffix == CSV_SUFFIX:
+        kept.to_csv(destination_path, index=False)
+    elif suffix == COLUMNAR_SUFFIX:
+        coerce_mixed_columns(kept).to_parquet(destination_path, engine='pyarrow', index=False)
+    else:
+        coerce_mixed_columns(kept).reset_index(drop=True).to_feather(destination_path)
+
+    return {'kept': len(kept), 'removed': removed}
@@ -0,0 +1,167 @@
+"""
+Input Fingerprinting
+
+This module fingerprints a region's input files (size, modification time and
+content hash) and records them, together with the outputs they produced, in a
+per-region run manifest. The monthly processor compares a fresh fingerprint
+against the manifest to decide whether a region's previous enhanced output can
+be reused instead of recomputing it.
+
+The manifest also records the run options that shape the output (Excel export,
+delta scoring, chunked processing) and the month folder it was written to, so a
+run with different options or in a new month reprocesses even when no input
+file changed.
+
+Manifest location: output/<region_key>/input_manifest.json
+"""
+
+import json
+import hashlib
+import logging
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "input_manifest.json"
+HASH_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+
+def hash_file(file_path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fingerprint_file(file_path: Path, previous: Optional[Dict] = None) -> Dict:
+    """
+    Fingerprint a single file.
+
+    When a previous fingerprint has the same size and modification time the content
+    hash is reused instead of re-reading the file.
+
+    Returns:
+        Dict with size, mtime and sha256
+    """
+    stat = Path(file_path).stat()
+    if previous and previous.get('size') == stat.st_size and previous.get('mtime') == stat.st_mtime:
+        return {'size': stat.st_size, 'mtime': stat.st_mtime, 'sha256': previous['sha256']}
+
+    return {'size': stat.st_size, 'mtime': stat.st_mtime, 'sha256': hash_file(file_path)}
+
+
+def fingerprint_region_inputs(region_dir: Path, previous_inputs: Optional[Dict[str, Dict]] = None) -> Dict[str, Dict]:
+    """
+    Fingerprint every input file in a region directory plus its config.json.
+
+    Args:
+        region_dir: Region directory (regions/<region_key>)
+        previous_inputs: Fingerprints from the last manifest, used to skip rehashing
+
+    Returns:
+        Dict mapping file name to fingerprint
+    """
+    from input_adapters import discover_input_files  # input_adapters imports this module via ingest_cache
+
+    previous_inputs = previous_inputs or {}
+    input_files = discover_input_files(region_dir) + [region_dir / "config.json"]
+
+    fingerprints = {}
+    for input_file in input_files:
+        if input_file.exists():
+            fingerprints[input_file.name] = fingerprint_file(input_file, previous_inputs.get(input_file.name))
+    return fingerprints
+
+
+def diff_fingerprints(previous: Dict[str, Dict], current: Dict[str, Dict]) -> List[str]:
+    """Return the names of files that were added, removed or whose content changed"""
+    changed = []
+    for name in sorted(set(previous) | set(current)):
+        if name not in previous:
+            changed.append(f"{name} (new)")
+        elif name not in current:
+            changed.append(f"{name} (removed)")
+        elif previous[name].get('sha256') != current[name].get('sha256'):
+            changed.append(name)
+    return changed
+
+
+class RegionRunManifest:
+    """Reads and writes the per-region record of inputs and the outputs they produced"""
+
+    def __init__(self, region_key: str, output_root: Path = Path("output")):
+        self.region_key = region_key
+        self.path = Path(output_root) / region_key / MANIFEST_FILENAME
+
+    def load(self) -> Optional[Dict]:
+        """Load the manifest, or None if it doesn't exist or can't be read"""
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Ignoring unreadable input manifest {self.path}: {e}")
+            return None
+
+    def save(self, inputs: Dict[str, Dict], outputs: Dict[str, str], result: Dict,
+             scoring_params: Optional[Dict] = None, run_options: Optional[Dict] = None,
+             output_month: Optional[str] = None) -> None:
+        """Record the inputs of a successful run together with its outputs, options and result summary"""
+        manifest = {
+            'region_key': self.region_key,
+            'recorded_at': datetime.now().isoformat(timespec='seconds'),
+            'inputs': inputs,
+            'outputs': outputs,
+            'result': result,
+            'scoring_params': scoring_params or {},
+            'run_options': run_options or {},
+            'output_month': output_month
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+    def check_reuse(self, current_inputs: Dict[str, Dict], manifest: Optional[Dict] = None,
+                    run_options: Optional[Dict] = None, output_month: Optional[str] = None) -> Dict:
+        """
+        Decide whether the previous run's outputs can be reused for the current inputs.
+
+        Args:
+            current_inputs: Fresh fingerprints of the region's input files
+            manifest: Previously loaded manifest (loaded from disk when omitted)
+            run_options: Options of the current run; reuse needs the recorded ones to match
+            output_month: Month folder (YYYY_MM) the current run writes to; reuse needs
+                the previous output to be from the same month
+
+        Returns:
+            Dict with 'reuse' (bool), 'reason' (str) and, when reusable, 'manifest'
+        """
+        manifest = manifest if manifest is not None else self.load()
+        if not manifest:
+            return {'reuse': False, 'reason': 'no previous run recorded'}
+
+        changed = diff_fingerprints(manifest.get('inputs', {}), current_inputs)
+        if changed:
+            return {'reuse': False, 'reason': f"inputs changed: {', '.join(changed)}"}
+
+        if manifest.get('output_month') != output_month:
+            return {'reuse': False,
+                    'reason': f"output month changed: {manifest.get('output_month')} -> {output_month}"}
+
+        previous_options = manifest.get('run_options', {})
+        changed_options = [f"{name} {previous_options.get(name)} -> {(run_options or {}).get(name)}"
+                           for name in sorted(set(previous_options) | set(run_options or {}))
+                           if previous_options.get(name) != (run_options or {}).get(name)]
+        if changed_options:
+            return {'reuse': False, 'reason': f"run options changed: {', '.join(changed_options)}"}
+
+        missing = [path for path in manifest.get('outputs', {}).values() if not Path(path).exists()]
+        if missing:
+            return {'reuse': False, 'reason': f"previous output missing: {', '.join(missing)}"}
+
+        return {'reuse': True, 'reason': f"inputs unchanged since {manifest.get('recorded_at')}", 'manifest': manifest}
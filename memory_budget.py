@@ -0,0 +1,94 @@
+"""
+Memory Budget
+
+Approximate memory accounting for a region run with --max-memory. DataFrame sizes
+are measured with memory_usage(deep=True); the in-memory pipeline holds a few copies
+of the main frame at its peak (loaded frame, working and passthrough frames, scored
+frame, rejoined output), so a main file is only processed in memory when that many
+copies fit the budget. Otherwise the run streams the main file in chunks sized to the
+budget (monthly_processing_v2._process_main_chunked), and the workbook cache spills
+parsed niche files to temporary Parquet files once its share of the budget is used.
+
+The numbers are estimates - Python objects, the parser and pyarrow buffers add to
+them - so the budget should leave headroom below the machine's RAM.
+"""
+
+import logging
+import pandas as pd
+from pathlib import Path
+from typing import Optional
+
+from input_adapters import iter_input_chunks
+from ingest_schema import SourceSchema
+
+logger = logging.getLogger(__name__)
+
+# Copies of the main frame the in-memory pipeline holds at its peak
+PIPELINE_COPY_FACTOR = 4
+
+# Share of the budget the workbook cache may hold before spilling parsed files to disk
+WORKBOOK_CACHE_SHARE = 0.25
+
+# Rows parsed to estimate the size of a file's rows
+SAMPLE_ROWS = 2000
+
+# Smallest chunk used when the budget is very tight
+MIN_CHUNK_ROWS = 1000
+
+
+class MemoryBudgetExceeded(MemoryError):
+    """A stage would need more memory than the run's budget allows"""
+
+
+def frame_bytes(df: pd.DataFrame) -> int:
+    """Approximate memory held by a DataFrame, including string contents"""
+    return int(df.memory_usage(deep=True).sum())
+
+
+class MemoryBudget:
+    """Memory limit of one region run and the decisions derived from it"""
+
+    def __init__(self, max_mb: float, log: logging.Logger = logger):
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.log = log
+
+    @property
+    def max_mb(self) -> float:
+        return self.max_bytes / 1024 / 1024
+
+    @property
+    def workbook_cache_bytes(self) -> int:
+        """Bytes of parsed files the workbook cache may keep in memory"""
+        return int(self.max_bytes * WORKBOOK_CACHE_SHARE)
+
+    def row_bytes(self, file_path: Path, schema: Optional[SourceSchema] = None) -> float:
+        """Average in-memory bytes per row of a file, measured on its first rows"""
+        sample = next(iter_input_chunks(file_path, SAMPLE_ROWS, schema=schema), None)
+        if sample is None or sample.empty:
+            return 0.0
+        return frame_bytes(sample) / len(sample)
+
+    def fits_in_memory(self, nbytes: int) -> bool:
+        """True when the in-memory pipeline's copies of a frame this size fit the budget"""
+        return nbytes * PIPELINE_COPY_FACTOR <= self.max_bytes
+
+    def chunk_rows(self, row_bytes: float, default_rows: int) -> int:
+        """Rows per chunk whose pipeline copies fit the budget (at most default_rows)"""
+        if row_bytes <= 0:
+            return default_rows
+        rows = int(self.max_bytes / (row_bytes * PIPELINE_COPY_FACTOR))
+        return max(MIN_CHUNK_ROWS, min(default_rows, rows))
+
+    def check(self, label: str, df: pd.DataFrame) -> None:
+        """
+        Log a frame's size against the budget.
+
+        Raises:
+            MemoryBudgetExceeded: the in-memory pipeline's copies of the frame don't fit
+        """
+        nbytes = frame_bytes(df)
+        self.log.info(f"Memory budget: {label} {nbytes / 1024 / 1024:.1f} MB "
+                      f"(x{PIPELINE_COPY_FACTOR} of {self.max_mb:,.0f} MB budget)")
+        if not self.fits_in_memory(nbytes):
+            raise MemoryBudgetExceeded(f"{label} takes {nbytes / 1024 / 1024:.1f} MB, more than the "
+                                       f"{self.max_mb:,.0f} MB budget allows for in-memory processing")
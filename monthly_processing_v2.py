@@ -7,19 +7,46 @@ standardized file naming, and organized output structure.
 Usage:
     python monthly_processing_v2.py --region roanoke_city_va
     python monthly_processing_v2.py --all-regions  
+    python monthly_processing_v2.py --all-regions --jobs 4 --auto-clean-fips
     python monthly_processing_v2.py --list-regions
 """
 
 import logging
+import numpy as np
 import pandas as pd
 import argparse
+import contextlib
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
-import re
+from typing import Callable, Dict, List, Optional, Tuple
 
 from multi_region_config import MultiRegionConfigManager
-from enhanced_property_processor import EnhancedPropertyProcessor, DistressFlagManager
+from batch_job_store import BatchJobStore
+from input_fingerprint import RegionRunManifest, fingerprint_region_inputs
+from delta_scoring import score_with_delta, scoring_params
+from region_catalog import normalize_fips_value
+from excel_streaming import write_excel_streaming
+from input_adapters import filter_input_rows, iter_input_chunks, read_input
+from ingest_schema import MAIN_EXPORT_SCHEMA, niche_schema
+from ingest_cache import IngestCache
+from columnar_io import (COLUMNAR_SUFFIX, ChunkedColumnarWriter, columnar_available, columnar_columns, read_columnar,
+                         save_dataset, write_columnar)
+from region_stats import STATS_INPUT_COLUMNS, compute_region_stats, stats_sheets, write_stats_json
+from parcel_dedup import PARCEL_KEY_INPUT_COLUMNS, dedupe_parcels
+from owner_locations import OWNER_KEY_INPUT_COLUMNS, assign_primary_locations, assign_primary_locations_columnar
+from address_normalizer import normalize_addresses
+from parcel_keys import MISSING_PARCEL_ID, ParcelIndex
+from column_projection import ROW_ID_COLUMN, PassthroughColumns, project_columns
+from output_dataset import publish_output, run_month
+from property_history import update_history_from_output
+from memory_budget import MemoryBudget
+from stage_checkpoints import STAGE_NAMES, StageCheckpointStore, scored_main_key, stage_descriptions, stage_key
+from enhanced_property_processor import (DEFAULT_CHUNK_ROWS, SCORING_INPUT_COLUMNS, EnhancedPropertyProcessor,
+                                         DistressFlagManager)
 
 # Set up logging
 logging.basicConfig(
@@ -34,62 +61,160 @@ logger = logging.getLogger(__name__)
 # Constants
 NICHE_ONLY_PRIORITY_ID = 99
 VERY_OLD_DATE_STR = '1850-01-01'
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+WORKBOOK_CACHE_SPILL_MB = 256  # Parsed workbooks larger than this are spilled to a temporary Parquet file
 
-def _detect_niche_type_from_filename(filename: str) -> str:
-    """Detect niche type from filename"""
-    filename_lower = filename.lower()
-    
-    if 'lien' in filename_lower:
-        return 'Liens'
-    elif 'foreclosure' in filename_lower or 'preforeclosure' in filename_lower:
-        return 'PreForeclosure'
-    elif 'bankrupt' in filename_lower:
-        return 'Bankruptcy'
-    elif 'landlord' in filename_lower or 'tired' in filename_lower:
-        return 'Landlord'
-    elif ('tax' in filename_lower and 'delinq' in filename_lower) or ('delinq' in filename_lower):
-        # Distinguish between current city tax delinquencies and historical vendor data
-        if 'current' in filename_lower or filename_lower.startswith(('roanoke_', 'lynchburg_', 'norfolk_')):
-            return 'CurrentTax'  # Higher priority - direct from locality
-        else:
-            return 'TaxHistory'  # Lower priority - historical vendor data
-    elif 'probate' in filename_lower:
-        return 'Probate'
-    elif 'interfamily' in filename_lower or 'family' in filename_lower:
-        return 'InterFamily'
-    elif 'cash' in filename_lower and 'buyer' in filename_lower:
-        return 'CashBuyer'
-    elif 'vacant' in filename_lower:
-        return 'Vacant'
-    elif 'code' in filename_lower and 'enforcement' in filename_lower:
-        return 'CodeEnforcement'
-    elif 'inherited' in filename_lower or 'inherit' in filename_lower:
-        return 'Inherited'
-    else:
-        return 'Other'
+# Mapping from niche types to boolean flag column names
+NICHE_FLAG_COLUMNS = {
+    'Liens': 'HasLiens',
+    'PreForeclosure': 'HasForeclosure',
+    'CodeEnforcement': 'HasCodeEnforcement', 
+    'CurrentTax': 'HasCurrentTax',
+    'TaxHistory': 'HasTaxHistory',
+    'Bankruptcy': 'HasBankruptcy',
+    'CashBuyer': 'HasCashBuyer',
+    'InterFamily': 'HasInterFamily',
+    'Landlord': 'HasLandlord',
+    'Probate': 'HasProbate',
+    'Inherited': 'HasInherited'
+}
+
+# Main file columns copied into niche-only records inserted by _update_main_with_niche
+NICHE_INSERT_COLUMNS = ['Address', 'Mailing Address', 'Last Sale Date', 'Last Sale Amount', 'Owner 1 Last Name',
+                        'Owner 1 First Name', 'City', 'State', 'Zip']
+
+# Main file columns the in-memory stages read after loading: scoring, delta keys, niche merging,
+# owner keys and statistics. The other columns are held aside until the output is saved.
+WORKING_INPUT_COLUMNS = list(dict.fromkeys(
+    SCORING_INPUT_COLUMNS + PARCEL_KEY_INPUT_COLUMNS + NICHE_INSERT_COLUMNS + OWNER_KEY_INPUT_COLUMNS
+    + STATS_INPUT_COLUMNS
+))
+
+# Configuration manager for parallel worker processes (set by _init_region_worker)
+_worker_config_manager: Optional[MultiRegionConfigManager] = None
+
+def _create_region_logger(region_key: str, log_file: Path) -> Tuple[logging.Logger, logging.FileHandler]:
+    """
+    Create a logger dedicated to one region that writes to the region's own log file.
+
+    Each region gets a child logger (e.g. monthly_processing_v2.roanoke_city_va) so
+    regions running side by side never share a FileHandler. Records still propagate
+    to the console handler.
 
-def _normalize_address(address_str) -> str:
-    """Normalize address for matching"""
-    if pd.isna(address_str) or address_str == '':
-        return ''
+    Returns:
+        tuple: (region_logger, file_handler) - caller must close the handler when done
+    """
+    region_logger = logging.getLogger(f"{__name__}.{region_key}")
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    region_logger.addHandler(file_handler)
+    return region_logger, file_handler
+
+def _close_region_logger(region_logger: logging.Logger, file_handler: logging.FileHandler) -> None:
+    """Detach and close a region log handler created by _create_region_logger"""
+    region_logger.removeHandler(file_handler)
+    file_handler.close()
+
+class RunWorkbookCache:
+    """
+    Parsed input files (workbooks, CSV, Parquet or Feather) for a single process_region run.
+    
+    Every input file is parsed at most once per run and the DataFrame is served to each
+    consumer. A parse is keyed by the file's path, size, modification time and read
+    options, so a file rewritten during the run (e.g. by FIPS cleanup) is parsed again.
+    DataFrames larger than the spill threshold, or that would take the frames held in
+    memory past the memory limit (--max-memory), are written to a temporary Parquet file
+    and dropped from memory until requested again. Memory use is reported to the run log.
     
-    # Convert to string and normalize
-    addr = str(address_str).upper().strip()
+    Workbook parses go through the persistent ingest cache, so a workbook already
+    converted by an earlier run (or another tool) is loaded from Parquet instead of Excel.
+    """
+    
+    def __init__(self, log: logging.Logger = logger, spill_threshold_mb: float = WORKBOOK_CACHE_SPILL_MB,
+                 memory_limit_bytes: Optional[int] = None):
+        self.log = log
+        self.spill_threshold_bytes = int(spill_threshold_mb * 1024 * 1024)
+        self.memory_limit_bytes = memory_limit_bytes
+        self.spill_dir: Optional[Path] = None
+        self.frames: Dict[Tuple, pd.DataFrame] = {}
+        self.spilled: Dict[Tuple, Path] = {}
+        self.ingest = IngestCache(log=log)
+        self.sizes: Dict[Tuple, int] = {}
+        self.hits = 0
+        self.misses = 0
     
-    # Remove common variations
-    addr = addr.replace(' ST,', ' ST')
-    addr = addr.replace(' AVE,', ' AVE') 
-    addr = addr.replace(' RD,', ' RD')
-    addr = addr.replace(' DR,', ' DR')
-    addr = addr.replace(' BLVD,', ' BLVD')
+    @staticmethod
+    def _cache_key(file_path: Path, read_options: Dict) -> Tuple:
+        stat = file_path.stat()
+        return (str(file_path.resolve()), stat.st_size, stat.st_mtime_ns, repr(sorted(read_options.items())))
+    
+    def read_input(self, file_path: Path, **read_options) -> pd.DataFrame:
+        """
+        Return the parsed input file, parsing it only on first use (read options as for
+        input_adapters.read_input).
+        
+        Callers get a shallow copy, so adding or replacing columns never alters the cached frame.
+        """
+        file_path = Path(file_path)
+        key = self._cache_key(file_path, read_options)
+        
+        if key in self.frames:
+            self.hits += 1
+            return self.frames[key].copy(deep=False)
+        
+        if key in self.spilled:
+            self.hits += 1
+            return read_columnar(self.spilled[key])
+        
+        self.misses += 1
+        df = read_input(file_path, cache=self.ingest, **read_options)
+        size = int(df.memory_usage(deep=True).sum())
+        self.sizes[key] = size
+        
+        over_limit = self.memory_limit_bytes is not None and self.memory_bytes() + size > self.memory_limit_bytes
+        if (size > self.spill_threshold_bytes or over_limit) and self._spill(key, file_path, df):
+            self.log.info(f"Workbook cache: loaded {file_path.name} ({len(df):,} rows, {size / 1024 / 1024:.1f} MB) "
+                          f"- spilled to {self.spilled[key].name}")
+        else:
+            self.frames[key] = df
+            self.log.info(f"Workbook cache: loaded {file_path.name} ({len(df):,} rows, {size / 1024 / 1024:.1f} MB) "
+                          f"- {self.memory_bytes() / 1024 / 1024:.1f} MB held in memory")
+        return df.copy(deep=False)
+    
+    def _spill(self, key: Tuple, file_path: Path, df: pd.DataFrame) -> bool:
+        """Write a large frame to a temporary Parquet file; False if it has to stay in memory"""
+        if not columnar_available():
+            self.log.warning(f"Workbook cache: pyarrow not installed - keeping {file_path.name} in memory")
+            return False
+        try:
+            if self.spill_dir is None:
+                self.spill_dir = Path(tempfile.mkdtemp(prefix="workbook_cache_"))
+            spill_path = self.spill_dir / f"{len(self.spilled):03d}_{file_path.stem}.parquet"
+            write_columnar(df, spill_path)
+        except Exception as e:
+            self.log.warning(f"Workbook cache: could not spill {file_path.name} ({e}) - keeping it in memory")
+            return False
+        self.spilled[key] = spill_path
+        return True
     
-    # Remove trailing commas and extra spaces
-    addr = addr.replace(',', ' ').strip()
+    def memory_bytes(self) -> int:
+        """Bytes held by cached DataFrames in memory"""
+        return sum(self.sizes[key] for key in self.frames)
     
-    # Collapse multiple spaces
-    addr = re.sub(r'\s+', ' ', addr)
+    def log_summary(self) -> None:
+        """Report cache use and memory accounting to the run log"""
+        spilled_bytes = sum(self.sizes[key] for key in self.spilled)
+        self.log.info(f"Workbook cache: {self.misses} workbooks loaded ({self.ingest.hits} from the ingest cache), "
+                      f"{self.hits} served from cache, {self.memory_bytes() / 1024 / 1024:.1f} MB in memory, "
+                      f"{len(self.spilled)} spilled ({spilled_bytes / 1024 / 1024:.1f} MB)")
     
-    return addr
+    def close(self) -> None:
+        """Release cached frames and delete spill files"""
+        self.frames.clear()
+        self.spilled.clear()
+        if self.spill_dir is not None:
+            shutil.rmtree(self.spill_dir, ignore_errors=True)
+            self.spill_dir = None
 
 def _append_unique_records(main_df: pd.DataFrame, recent_sales_df: pd.DataFrame) -> tuple:
     """
@@ -105,8 +230,8 @@ def _append_unique_records(main_df: pd.DataFrame, recent_sales_df: pd.DataFrame)
     main_df_temp = main_df.copy()
     recent_sales_temp = recent_sales_df.copy()
     
-    main_df_temp['_NormalizedAddress'] = main_df_temp['Address'].apply(_normalize_address)
-    recent_sales_temp['_NormalizedAddress'] = recent_sales_temp['Address'].apply(_normalize_address)
+    main_df_temp['_NormalizedAddress'] = normalize_addresses(main_df_temp['Address'])
+    recent_sales_temp['_NormalizedAddress'] = normalize_addresses(recent_sales_temp['Address'])
     
     # Filter out records with empty addresses
     recent_sales_clean = recent_sales_temp[recent_sales_temp['_NormalizedAddress'] != ''].copy()
@@ -130,121 +255,120 @@ def _append_unique_records(main_df: pd.DataFrame, recent_sales_df: pd.DataFrame)
     
     return main_df, records_added
 
-def _cleanup_fips_mismatches(region_dir: Path, expected_fips: str, fips_mismatches: List[Dict]) -> bool:
+def _cleanup_fips_mismatches(region_dir: Path, expected_fips: str, fips_mismatches: List[Dict],
+                             log: logging.Logger = logger) -> bool:
     """
     Clean files by removing records that don't match the expected FIPS code.
     
+    The original file is backed up by a plain file copy, then rows are passed
+    through a filter into a new file of the same format that replaces the original.
+    
     Args:
         region_dir: Path to the region directory
         expected_fips: The correct FIPS code for this region
         fips_mismatches: List of files with FIPS mismatches
+        log: Logger to report errors to (defaults to the module logger)
         
     Returns:
         bool: True if cleanup succeeded, False otherwise
     """
+    expected = normalize_fips_value(expected_fips)
+    
     try:
         for mismatch in fips_mismatches:
             file_path = region_dir / mismatch['file']
             backup_path = region_dir / f"{mismatch['file']}.backup"
+            # Dot-prefixed, so a crash mid-write never looks like an input file
+            temp_path = region_dir / f".{mismatch['file']}.cleaning"
             
             print(f"  Processing: {mismatch['file']}")
             
             try:
-                # Read the original file
-                df = pd.read_excel(file_path)
-                original_count = len(df)
-                
                 # Create backup
-                df.to_excel(backup_path, index=False)
+                shutil.copy2(file_path, backup_path)
                 print(f"    Backup created: {backup_path.name}")
                 
-                # Filter to keep only expected FIPS
-                if 'FIPS' not in df.columns:
+                # Filter records
+                cleanup = filter_input_rows(file_path, temp_path, 'FIPS', keep=lambda fips: fips == expected,
+                                            normalize=normalize_fips_value)
+                if cleanup is None:
                     print(f"    WARNING: No FIPS column found in {mismatch['file']}")
                     continue
                 
-                # Filter records
-                filtered_df = df[df['FIPS'].astype(str) == str(expected_fips)].copy()
-                filtered_count = len(filtered_df)
-                removed_count = original_count - filtered_count
+                filtered_count = cleanup['kept']
+                removed_count = sum(cleanup['removed'].values())
                 
                 if filtered_count == 0:
+                    temp_path.unlink()
                     print(f"    ERROR: No records would remain after filtering {mismatch['file']}")
                     return False
                 
-                # Save cleaned file
-                filtered_df.to_excel(file_path, index=False)
-                print(f"    Cleaned: {original_count:,} -> {filtered_count:,} records ({removed_count:,} removed)")
+                # Replace the original with the cleaned file
+                os.replace(temp_path, file_path)
+                removed_detail = ", ".join(f"{fips or '(blank)'}: {count:,}" for fips, count in cleanup['removed'].most_common())
+                print(f"    Cleaned: {filtered_count + removed_count:,} -> {filtered_count:,} records ({removed_count:,} removed)")
+                print(f"    Removed by FIPS: {removed_detail}")
+                log.info(f"Cleaned {mismatch['file']}: kept {filtered_count:,}, removed by FIPS {dict(cleanup['removed'])}")
                 
             except Exception as file_error:
+                if temp_path.exists():
+                    temp_path.unlink()
                 print(f"    ERROR cleaning {mismatch['file']}: {file_error}")
-                logger.error(f"Error cleaning {mismatch['file']}: {file_error}")
+                log.error(f"Error cleaning {mismatch['file']}: {file_error}")
                 return False
         
         return True
         
     except Exception as e:
         print(f"ERROR in cleanup process: {e}")
-        logger.error(f"Error in FIPS cleanup process: {e}")
+        log.error(f"Error in FIPS cleanup process: {e}")
         return False
 
-def _update_main_with_niche(main_df: pd.DataFrame, niche_df: pd.DataFrame, niche_type: str) -> tuple:
+def _update_main_with_niche(main_df: pd.DataFrame, niche_df: pd.DataFrame, niche_type: str,
+                            log: logging.Logger = logger, passthrough: Optional[PassthroughColumns] = None,
+                            parcels: Optional[ParcelIndex] = None) -> tuple:
     """
     Update main region DataFrame with niche data using boolean flag architecture.
     
+    A niche record matches main records with the same parcel (APN, or Parcel ID in
+    government niche files, compared as integer ids from parcels) or the same
+    normalized address. When main_df is a projected working frame, the inserted
+    records' values for the passthrough columns are added to passthrough.
+    
     Returns:
         tuple: (updated_main_df, updates_count, inserts_count)
     """
     updates_count = 0
     inserts_count = 0
     
-    # Mapping from niche types to boolean flag column names
-    niche_flag_columns = {
-        'Liens': 'HasLiens',
-        'PreForeclosure': 'HasForeclosure',
-        'CodeEnforcement': 'HasCodeEnforcement', 
-        'CurrentTax': 'HasCurrentTax',
-        'TaxHistory': 'HasTaxHistory',
-        'Bankruptcy': 'HasBankruptcy',
-        'CashBuyer': 'HasCashBuyer',
-        'InterFamily': 'HasInterFamily',
-        'Landlord': 'HasLandlord',
-        'Probate': 'HasProbate',
-        'Inherited': 'HasInherited'
-    }
-    
     # Get the boolean flag column for this niche type
-    flag_column = niche_flag_columns.get(niche_type)
+    flag_column = NICHE_FLAG_COLUMNS.get(niche_type)
     if not flag_column:
-        logger.warning(f"Unknown niche type for boolean flags: {niche_type}")
+        log.warning(f"Unknown niche type for boolean flags: {niche_type}")
         return main_df, 0, 0
     
     # Normalize addresses for matching
-    main_df['_NormalizedAddress'] = main_df['Address'].apply(_normalize_address)
-    niche_df['_NormalizedAddress'] = niche_df['Address'].apply(_normalize_address)
-    
-    # Create dictionary mapping addresses to main DataFrame indices for fast lookup
-    main_address_map = main_df.groupby('_NormalizedAddress').groups
+    main_df['_NormalizedAddress'] = normalize_addresses(main_df['Address'])
+    niche_df['_NormalizedAddress'] = normalize_addresses(niche_df['Address'])
     
     # Separate niche records into updates and inserts
     niche_df_clean = niche_df[niche_df['_NormalizedAddress'] != ''].copy()
     
-    # Vectorized matching - find which niche addresses exist in main
-    existing_addresses = niche_df_clean['_NormalizedAddress'].isin(main_address_map.keys())
+    # Parcels of the niche file get integer ids; main parcels are looked up against them
+    parcels = parcels if parcels is not None else ParcelIndex()
+    niche_ids = parcels.frame_ids(niche_df_clean, register=True)
+    main_ids = parcels.frame_ids(main_df)
     
-    # Process updates in bulk
-    update_addresses = niche_df_clean[existing_addresses]['_NormalizedAddress'].unique()
+    # Vectorized matching - niche records whose parcel or address exists in main
+    niche_addresses = niche_df_clean['_NormalizedAddress']
+    existing_addresses = (niche_addresses.isin(main_df['_NormalizedAddress']).to_numpy() |
+                          np.isin(niche_ids, main_ids[main_ids != MISSING_PARCEL_ID]))
     
-    for address in update_addresses:
-        if address in main_address_map:
-            main_indices = main_address_map[address]
-            
-            # Update all main records with this address by setting boolean flag
-            for main_idx in main_indices:
-                # Set the boolean flag for this niche type
-                if not main_df.loc[main_idx, flag_column]:  # Only count if not already set
-                    main_df.loc[main_idx, flag_column] = True
-                    updates_count += 1
+    # Process updates in bulk: set the flag on every main record matching a niche record
+    main_hits = (main_df['_NormalizedAddress'].isin(niche_addresses).to_numpy() |
+                 np.isin(main_ids, niche_ids[niche_ids != MISSING_PARCEL_ID]))
+    updates_count = int((main_hits & ~main_df[flag_column].astype(bool).to_numpy()).sum())  # Only count if not already set
+    main_df.loc[main_hits, flag_column] = True
     
     # Process inserts in bulk
     insert_records = niche_df_clean[~existing_addresses].copy()
@@ -298,6 +422,10 @@ def _update_main_with_niche(main_df: pd.DataFrame, niche_df: pd.DataFrame, niche
         # Set the specific boolean flag for this niche type
         new_records[flag_column] = True
         
+        # Values of the columns held outside the working frame go to the passthrough columns
+        if passthrough is not None and ROW_ID_COLUMN in main_df.columns:
+            new_records[ROW_ID_COLUMN] = passthrough.add_rows(insert_records)
+        
         # Concatenate new records to main DataFrame with proper error handling
         try:
             # Validate column compatibility before concatenation
@@ -325,24 +453,24 @@ def _update_main_with_niche(main_df: pd.DataFrame, niche_df: pd.DataFrame, niche
             # Remove columns that don't exist in main DataFrame from new_records
             extra_cols = new_cols - main_cols
             if extra_cols:
-                logger.debug(f"Removing columns not in main DataFrame: {extra_cols}")
+                log.debug(f"Removing columns not in main DataFrame: {extra_cols}")
                 new_records = new_records.drop(columns=list(extra_cols))
             
             # Now check for any remaining incompatibilities
             new_cols = set(new_records.columns)
             if not new_cols.issubset(main_cols):
                 remaining_cols = new_cols - main_cols
-                logger.warning(f"New records still have columns not in main DataFrame: {remaining_cols}")
+                log.warning(f"New records still have columns not in main DataFrame: {remaining_cols}")
             
             # Perform concatenation with memory and index safety
             main_df = pd.concat([main_df, new_records], ignore_index=True, sort=False)
             inserts_count = len(insert_records)
             
         except pd.errors.OutOfMemoryError:
-            logger.error(f"Out of memory during concatenation of {len(insert_records)} records")
+            log.error(f"Out of memory during concatenation of {len(insert_records)} records")
             raise MemoryError(f"Insufficient memory to add {len(insert_records)} niche records")
         except Exception as concat_error:
-            logger.error(f"Failed to concatenate niche records: {concat_error}")
+            log.error(f"Failed to concatenate niche records: {concat_error}")
             raise ValueError(f"Data structure mismatch during concatenation: {concat_error}")
     
     # Clean up temporary column from both DataFrames
@@ -353,13 +481,346 @@ def _update_main_with_niche(main_df: pd.DataFrame, niche_df: pd.DataFrame, niche
     
     return main_df, updates_count, inserts_count
 
-def process_region(region_key: str, config_manager: MultiRegionConfigManager, auto_clean_fips: bool = False) -> Dict:
+def _load_main_data(main_file: Path, recent_sales_files: List[Path], workbooks: RunWorkbookCache,
+                    log: logging.Logger = logger) -> tuple:
+    """
+    Load the main region file, append unique recent sales and drop duplicate parcels.
+    
+    Returns:
+        tuple: (main DataFrame, audit DataFrame of dropped duplicate rows)
+    """
+    # 1. MERGE RECENT SALES WITH MAIN FILE (if any)
+    if recent_sales_files:
+        print("\\nSTEP 1: Merging Recent Sales with Main File")
+        print("-" * 50)
+
+        # Load main file
+        print(f"Loading main file: {main_file.name} ({main_file.stat().st_size:,} bytes)")
+        main_df = workbooks.read_input(main_file, schema=MAIN_EXPORT_SCHEMA)
+        print(f"Main file loaded: {len(main_df):,} records")
+
+        total_added = 0
+        for recent_file in recent_sales_files:
+            try:
+                print(f"Processing recent sales: {recent_file.name}")
+                recent_df = workbooks.read_input(recent_file, schema=MAIN_EXPORT_SCHEMA)
+
+                if recent_df.empty:
+                    print(f"   WARNING: Empty recent sales file: {recent_file.name}")
+                    continue
+
+                print(f"   Loaded {len(recent_df):,} recent sales records")
+
+                # Merge unique records
+                main_df, added_count = _append_unique_records(main_df, recent_df)
+                total_added += added_count
+
+                print(f"   SUCCESS: {added_count:,} unique records added from recent sales")
+
+            except Exception as e:
+                print(f"   ERROR: Failed to process recent sales file {recent_file.name}: {e}")
+                log.error(f"Failed to process recent sales file {recent_file.name}: {e}")
+
+        print(f"\\nMERGE SUMMARY:")
+        print(f"   Original main file records: {len(main_df) - total_added:,}")
+        print(f"   Recent sales records added: {total_added:,}")
+        print(f"   Combined dataset size: {len(main_df):,}")
+
+        # Process the combined dataset
+        print("\\nSTEP 2: Processing Combined Dataset")
+        print("-" * 50)
+
+    else:
+        # No recent sales files, process main file normally
+        print("\\nSTEP 1: Processing Main Region File")
+        print("-" * 50)
+        print(f"Processing main file: {main_file.name} ({main_file.stat().st_size:,} bytes)")
+        main_df = workbooks.read_input(main_file, schema=MAIN_EXPORT_SCHEMA)
+
+    # Drop duplicate parcels before scoring (legacy rule: keep the row with an address, then the earliest sale)
+    main_df, dedup_audit = dedupe_parcels(main_df)
+    if not dedup_audit.empty:
+        print(f"Parcel dedup: {len(dedup_audit):,} duplicate rows dropped, {len(main_df):,} unique records remain")
+        log.info(f"Parcel dedup dropped {len(dedup_audit):,} rows")
+    
+    return main_df, dedup_audit
+
+def _merge_niche_files(main_result: pd.DataFrame, niche_files: List[Path], catalog, workbooks: RunWorkbookCache,
+                       log: logging.Logger = logger, passthrough: Optional[PassthroughColumns] = None,
+                       parcels: Optional[ParcelIndex] = None) -> tuple:
+    """
+    Apply every niche file to the scored main DataFrame (see _update_main_with_niche
+    for passthrough and parcels).
+    
+    Returns:
+        tuple: (updated main DataFrame, records updated, records inserted)
+    """
+    total_updates = 0
+    total_inserts = 0
+    
+    if niche_files:
+        for niche_file in niche_files:
+            try:
+                print(f"Processing niche: {niche_file.name}")
+
+                # Validate niche file
+                if not niche_file.exists() or niche_file.stat().st_size == 0:
+                    print(f"   WARNING: Skipping empty or missing file: {niche_file.name}")
+                    continue
+
+                # Niche type detected from the filename when the file was cataloged
+                niche_type = catalog.entries[niche_file.name]['niche_type']
+
+                # Read niche file straight into the declared dtypes of its type
+                try:
+                    niche_df = workbooks.read_input(niche_file, schema=niche_schema(niche_type))
+                except Exception as read_error:
+                    print(f"   ERROR: Cannot read {niche_file.name}: {read_error}")
+                    log.error(f"Cannot read {niche_file.name}: {read_error}")
+                    continue
+
+                if niche_df.empty:
+                    print(f"   WARNING: Empty niche file: {niche_file.name}")
+                    continue
+
+                print(f"   Loaded {len(niche_df):,} niche records")
+
+                # Update main region with niche data
+                try:
+                    main_result, updates, inserts = _update_main_with_niche(main_result, niche_df, niche_type, log,
+                                                                            passthrough, parcels)
+
+                    total_updates += updates
+                    total_inserts += inserts
+
+                    print(f"   SUCCESS: {niche_type}: {updates:,} updated, {inserts:,} inserted")
+                except Exception as update_error:
+                    print(f"   ERROR: Failed to process {niche_type} data: {update_error}")
+                    log.error(f"Failed to process {niche_type} data from {niche_file.name}: {update_error}")
+
+            except Exception as e:
+                print(f"   ERROR: Unexpected error processing {niche_file.name}: {e}")
+                log.error(f"Unexpected error processing {niche_file.name}: {e}")
+
+        print(f"\\nNICHE PROCESSING SUMMARY:")
+        print(f"   Total Updated Records: {total_updates:,}")
+        print(f"   Total Inserted Records: {total_inserts:,}")
+        print(f"   Final Record Count: {len(main_result):,}")
+
+    else:
+        print("No niche files found")
+    
+    return main_result, total_updates, total_inserts
+
+def _build_niche_key_index(niche_files: List[Path], catalog, workbooks: RunWorkbookCache, parcels: ParcelIndex,
+                           log: logging.Logger = logger) -> tuple:
+    """
+    Load the niche files and index their normalized addresses and parcel ids by distress flag.
+    
+    Returns:
+        tuple: (set of normalized addresses per flag column, array of parcel ids per flag
+        column, list of (niche DataFrame, normalized addresses, parcel ids, niche type) in
+        file order for inserting unmatched records)
+    """
+    keys_by_flag: Dict[str, set] = {}
+    ids_by_flag: Dict[str, np.ndarray] = {}
+    niche_frames = []
+    
+    for niche_file in niche_files:
+        if not niche_file.exists() or niche_file.stat().st_size == 0:
+            print(f"   WARNING: Skipping empty or missing file: {niche_file.name}")
+            continue
+        
+        niche_type = catalog.entries[niche_file.name]['niche_type']
+        flag_column = NICHE_FLAG_COLUMNS.get(niche_type)
+        if not flag_column:
+            log.warning(f"Unknown niche type for boolean flags: {niche_type}")
+            continue
+        
+        try:
+            niche_df = workbooks.read_input(niche_file, schema=niche_schema(niche_type))
+        except Exception as read_error:
+            print(f"   ERROR: Cannot read {niche_file.name}: {read_error}")
+            log.error(f"Cannot read {niche_file.name}: {read_error}")
+            continue
+        if niche_df.empty or 'Address' not in niche_df.columns:
+            print(f"   WARNING: Empty niche file or no Address column: {niche_file.name}")
+            continue
+        
+        addresses = normalize_addresses(niche_df['Address'])
+        niche_ids = parcels.frame_ids(niche_df, register=True)
+        keys_by_flag.setdefault(flag_column, set()).update(addresses[addresses != ''])
+        ids_by_flag[flag_column] = np.union1d(ids_by_flag.get(flag_column, []),
+                                              niche_ids[niche_ids != MISSING_PARCEL_ID]).astype(np.int64)
+        niche_frames.append((niche_df, addresses, niche_ids, niche_type))
+        print(f"   Indexed {niche_type}: {len(niche_df):,} records from {niche_file.name}")
+    
+    return keys_by_flag, ids_by_flag, niche_frames
+
+def _process_main_chunked(main_file: Path, recent_sales_files: List[Path], niche_files: List[Path], catalog,
+                          workbooks: RunWorkbookCache, processor: EnhancedPropertyProcessor, output_stem: Path,
+                          chunk_size: int = DEFAULT_CHUNK_ROWS, export_excel: bool = True,
+                          parcels: Optional[ParcelIndex] = None, log: logging.Logger = logger) -> Dict:
+    """
+    Score the main file in bounded memory, writing straight to the Parquet output.
+    
+    Same steps as the in-memory pipeline, arranged so only one chunk of the main file
+    is held at a time:
+    1. A first pass reads only the parcel key columns to pick the rows parcel dedup keeps
+       (recent sales files, which are small, are merged into this key frame)
+    2. Niche files are indexed by normalized address and parcel id per distress flag
+    3. Each main file chunk is classified, scored, flagged from the niche index and
+       appended to the output
+    4. Niche records that matched no main record are inserted with the in-memory merge,
+       against the (small) frame of inserted records only
+    5. A second pass over the output picks one primary location per owner from the
+       owner key columns and writes IsPrimaryLocation and OwnerPropertyCount back
+    
+    Returns:
+        Dict with 'columnar' and 'excel' output paths, 'dedup_audit' (key columns of the
+        dropped rows), 'updates', 'inserts' and 'owners' (primary locations)
+    """
+    print(f"\\nSTEP 1: Streaming main file in chunks of {chunk_size:,} rows: {main_file.name} "
+          f"({main_file.stat().st_size:,} bytes)")
+    print("-" * 50)
+    
+    # 1. Parcel dedup decided from the key columns only
+    key_frame = pd.concat(iter_input_chunks(main_file, chunk_size, columns=PARCEL_KEY_INPUT_COLUMNS,
+                                            schema=MAIN_EXPORT_SCHEMA))
+    main_rows = len(key_frame)
+    for recent_file in recent_sales_files:
+        recent_df = workbooks.read_input(recent_file, schema=MAIN_EXPORT_SCHEMA)
+        key_frame, added_count = _append_unique_records(key_frame, recent_df)
+        print(f"   {added_count:,} unique records added from recent sales: {recent_file.name}")
+    key_columns = [column for column in PARCEL_KEY_INPUT_COLUMNS if column in key_frame.columns]
+    deduped, dedup_audit = dedupe_parcels(key_frame[key_columns])
+    kept_rows = deduped.index
+    recent_rows = key_frame.iloc[main_rows:]
+    recent_rows = recent_rows[recent_rows.index.isin(kept_rows)]
+    del key_frame, deduped
+    if not dedup_audit.empty:
+        print(f"Parcel dedup: {len(dedup_audit):,} duplicate rows dropped")
+    
+    # 2. Niche address and parcel index
+    print("Indexing niche lists...")
+    parcels = parcels if parcels is not None else ParcelIndex()
+    keys_by_flag, ids_by_flag, niche_frames = _build_niche_key_index(niche_files, catalog, workbooks, parcels, log)
+    niche_keys = set().union(*keys_by_flag.values()) if keys_by_flag else set()
+    matched_keys = set()
+    matched_ids = set()
+    updates = 0
+    
+    def apply_niche_flags(chunk: pd.DataFrame) -> pd.DataFrame:
+        nonlocal updates
+        addresses = normalize_addresses(chunk['Address'])
+        chunk_ids = parcels.frame_ids(chunk)
+        for flag_column, keys in keys_by_flag.items():
+            hits = addresses.isin(keys).to_numpy() | np.isin(chunk_ids, ids_by_flag[flag_column])
+            updates += int((hits & ~chunk[flag_column].astype(bool).to_numpy()).sum())
+            chunk.loc[hits, flag_column] = True
+        matched_keys.update(addresses[addresses.isin(niche_keys)])
+        matched_ids.update(chunk_ids[chunk_ids != MISSING_PARCEL_ID].tolist())
+        return chunk
+    
+    # 3. Score the main file chunk by chunk (then the recent sales records)
+    writer = ChunkedColumnarWriter(Path(output_stem).with_suffix(COLUMNAR_SUFFIX))
+    try:
+        processor.process_excel_file_chunked(main_file, writer, chunk_size,
+                                             row_filter=lambda chunk: chunk[chunk.index.isin(kept_rows)],
+                                             chunk_callback=apply_niche_flags)
+        if not recent_rows.empty:
+            recent_result = processor.process_dataframe(recent_rows)
+            if not recent_result.empty:
+                writer.append(apply_niche_flags(recent_result))
+        print(f"Main region processed - {writer.rows_written:,} records, {updates:,} niche flags set")
+        
+        # 4. Niche-only records, merged file by file as in the in-memory pipeline
+        inserted = pd.DataFrame(columns=writer.columns)
+        inserts = 0
+        matched_id_array = np.fromiter(matched_ids, dtype=np.int64, count=len(matched_ids))
+        for niche_df, addresses, niche_ids, niche_type in niche_frames:
+            unmatched = niche_df[~addresses.isin(matched_keys).to_numpy() & ~np.isin(niche_ids, matched_id_array)].copy()
+            inserted, niche_updates, niche_inserts = _update_main_with_niche(inserted, unmatched, niche_type, log,
+                                                                             parcels=parcels)
+            updates += niche_updates
+            inserts += niche_inserts
+            print(f"   {niche_type}: {niche_inserts:,} niche-only records inserted")
+        writer.append(inserted)
+        
+        columnar_output = writer.close()
+    except Exception:
+        writer.discard()
+        raise
+    log.info(f"Chunked processing wrote {writer.rows_written:,} records to {columnar_output.name}")
+    
+    # 5. One primary location per owner, decided over the whole output
+    owner_count = assign_primary_locations_columnar(columnar_output, chunk_size)
+    
+    # Excel export streamed from the Parquet file
+    excel_output = Path(output_stem).with_suffix('.xlsx')
+    if export_excel:
+        write_excel_streaming(columnar_output, excel_output)
+    else:
+        excel_output.unlink(missing_ok=True)
+        excel_output = None
+    
+    return {'columnar': columnar_output, 'excel': excel_output, 'dedup_audit': dedup_audit,
+            'updates': updates, 'inserts': inserts, 'owners': owner_count}
+
+def _plan_main_chunks(budget: MemoryBudget, main_file: Path, recent_sales_files: List[Path], catalog,
+                      log: logging.Logger = logger) -> tuple:
+    """
+    Decide whether the main data fits the memory budget for in-memory processing.
+    
+    The size is estimated from the rows of the main and recent sales files (from the
+    input catalog) and the measured size of the main file's first rows.
+    
+    Returns:
+        tuple: (rows per chunk, or None to process in memory; estimated bytes per row)
+    """
+    row_bytes = budget.row_bytes(main_file, MAIN_EXPORT_SCHEMA)
+    rows = sum(catalog.entries[f.name].get('row_count', 0) for f in [main_file] + recent_sales_files)
+    estimate_mb = row_bytes * rows / 1024 / 1024
+    
+    if budget.fits_in_memory(int(row_bytes * rows)):
+        log.info(f"Memory budget: main data estimated at {estimate_mb:,.1f} MB ({rows:,} rows) - processing in memory")
+        return None, row_bytes
+    
+    chunk_rows = budget.chunk_rows(row_bytes, DEFAULT_CHUNK_ROWS)
+    print(f"Memory budget: main data estimated at {estimate_mb:,.1f} MB ({rows:,} rows), too large for the "
+          f"{budget.max_mb:,.0f} MB budget - streaming in chunks of {chunk_rows:,} rows")
+    log.info(f"Memory budget: main data estimated at {estimate_mb:,.1f} MB - chunked mode, {chunk_rows:,} rows per chunk")
+    return chunk_rows, row_bytes
+
+def process_region(region_key: str, config_manager: MultiRegionConfigManager, auto_clean_fips: bool = False,
+                   interactive: bool = True, stage_callback: Optional[Callable[[str], None]] = None,
+                   force: bool = False, delta: bool = False, from_stage: Optional[str] = None,
+                   export_excel: bool = True, chunk_size: Optional[int] = None,
+                   max_memory_mb: Optional[float] = None) -> Dict:
     """
     Process a single region's files.
     
     Args:
         region_key: Region identifier (e.g., 'roanoke_city_va')
         config_manager: Configuration manager instance
+        auto_clean_fips: Clean FIPS mismatches without prompting
+        interactive: Allow prompting on stdin; when False (parallel workers) FIPS
+            mismatches are refused unless auto_clean_fips is set
+        stage_callback: Optional callable notified with each processing stage name
+            (see batch_job_store.PROCESSING_STATES)
+        force: Reprocess even when the inputs are unchanged since the last successful run
+        delta: Score only rows that are new or changed since the previous enhanced output
+            and carry the rest forward (see delta_scoring)
+        from_stage: Recompute this pipeline stage and everything after it instead of using
+            checkpoints (see stage_checkpoints.STAGE_NAMES); implies force
+        export_excel: Also write the enhanced output as Excel next to the canonical Parquet file
+        chunk_size: Stream the main file in chunks of this many rows so memory is bounded by
+            the chunk size (see _process_main_chunked). Checkpoints and delta scoring need the
+            whole frame and are not used.
+        max_memory_mb: Approximate memory budget (see memory_budget). Main data too large for
+            it is streamed in chunks sized to the budget, the workbook cache spills to disk
+            past its share, and running out of memory in the in-memory pipeline retries the
+            region in chunked mode instead of failing.
         
     Returns:
         Dictionary with processing results
@@ -376,9 +837,19 @@ def process_region(region_key: str, config_manager: MultiRegionConfigManager, au
     
     # Set up region-specific logging with region name
     log_file = output_dir / f"{region_code}_processing_{datetime.now().strftime('%Y%m%d_%H%M')}.log"
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-    logger.addHandler(file_handler)
+    region_logger, file_handler = _create_region_logger(region_key, log_file)
+    region_logger.info(f"Processing region {region_key} ({config.region_name})")
+    budget = MemoryBudget(max_memory_mb, region_logger) if max_memory_mb else None
+    workbooks = RunWorkbookCache(region_logger, memory_limit_bytes=budget.workbook_cache_bytes if budget else None)
+    checkpoints = StageCheckpointStore(region_key, from_stage=from_stage, log=region_logger)
+    force = force or from_stage is not None
+    main_row_bytes = 0.0
+    memory_fallback = False
+    
+    def report_stage(stage: str) -> None:
+        region_logger.info(f"Stage: {stage}")
+        if stage_callback:
+            stage_callback(stage)
     
     try:
         print(f"Region: {config.region_name}")
@@ -390,20 +861,47 @@ def process_region(region_key: str, config_manager: MultiRegionConfigManager, au
         print(f"Output Directory: {output_dir}")
         print()
         
+        # Reuse the previous outputs when no input file changed since the last successful run
+        manifest = RegionRunManifest(region_key)
+        previous_run = manifest.load()
+        catalog = config_manager.get_input_catalog(region_key)
+        known_fingerprints = {**(previous_run.get('inputs', {}) if previous_run else {}), **catalog.fingerprints()}
+        input_fingerprints = fingerprint_region_inputs(region_dir, known_fingerprints)
+        # Options that change what gets written; a run with other options or in a new month reprocesses.
+        # Scores depend on the run date (ownership cutoffs, date windows), so a later day reprocesses too.
+        scoring_date = datetime.now().date()
+        run_options = {'export_excel': export_excel, 'delta': delta, 'chunk_size': chunk_size,
+                       'scoring_date': scoring_date.isoformat()}
+        reuse = manifest.check_reuse(input_fingerprints, previous_run, run_options, output_dir.name)
+        
+        if reuse['reuse'] and not force:
+            region_logger.info(f"Reusing previous output for {region_key}: {reuse['reason']}")
+            print(f"Inputs unchanged - reusing previous output ({reuse['reason']})")
+            print(f"   Enhanced output: {previous_run['result'].get('output_file')}")
+            print("   Use --force to reprocess")
+            return {**previous_run['result'], 'success': True, 'reused': True}
+        
+        if force:
+            region_logger.info(f"Reprocessing {region_key}: forced ({reuse['reason']})")
+        else:
+            region_logger.info(f"Reprocessing {region_key}: {reuse['reason']}")
+        
         # Validate region files
+        report_stage('validating_files')
         validation = config_manager.validate_region_files(region_key)
         if not validation['valid']:
             print("ERROR: Region validation failed!")
             print(f"  Has Config: {validation['has_config']}")
             print(f"  Has Main File: {validation['has_main_file']}")
-            print(f"  Has Excel Files: {validation['has_excel_files']}")
+            print(f"  Has Input Files: {validation['has_input_files']}")
             print(f"  Total Files: {validation['total_files']}")
             return {'success': False, 'error': 'Region validation failed'}
         
-        print(f"Region validation passed - found {validation['total_files']} Excel files")
+        print(f"Region validation passed - found {validation['total_files']} input files")
         
         # Validate FIPS codes in all files
         print("Validating FIPS codes...")
+        report_stage('validating_fips')
         fips_validation = config_manager.validate_fips_codes(region_key)
         
         if not fips_validation['all_valid']:
@@ -416,9 +914,12 @@ def process_region(region_key: str, config_manager: MultiRegionConfigManager, au
                 print(f"  Missing FIPS column in: {', '.join(fips_validation['missing_fips_column'])}")
             
             if fips_validation['fips_mismatches']:
-                print("  FIPS code mismatches:")
+                print(f"  FIPS code mismatches ({fips_validation['mismatched_rows']:,} rows):")
                 for mismatch in fips_validation['fips_mismatches']:
-                    print(f"    {mismatch['file']}: expected {mismatch['expected']}, found {mismatch['found']}")
+                    found = ", ".join(f"{fips} ({count:,} rows)" for fips, count in mismatch['mismatch_counts'].items())
+                    print(f"    {mismatch['file']}: expected {mismatch['expected']} ({mismatch['matching_rows']:,} rows), "
+                          f"found {found}")
+                    region_logger.warning(f"FIPS mismatch in {mismatch['file']}: {mismatch['mismatch_counts']}")
             
             # Offer cleanup option
             print("\nWould you like to automatically clean the files to remove records with incorrect FIPS codes?")
@@ -430,12 +931,15 @@ def process_region(region_key: str, config_manager: MultiRegionConfigManager, au
             if auto_clean_fips:
                 print("Auto-clean enabled - cleaning files automatically...")
                 response = 'yes'
+            elif not interactive:
+                print("Cannot prompt in parallel mode - rerun with --auto-clean-fips to clean automatically")
+                response = 'no'
             else:
                 response = input("\nClean files automatically? (y/n): ").lower().strip()
             
             if response in ['y', 'yes']:
                 print("\nCleaning files...")
-                cleanup_success = _cleanup_fips_mismatches(region_dir, fips_validation['region_fips'], fips_validation['fips_mismatches'])
+                cleanup_success = _cleanup_fips_mismatches(region_dir, fips_validation['region_fips'], fips_validation['fips_mismatches'], region_logger)
                 
                 if cleanup_success:
                     print("Files cleaned successfully! Re-validating...")
@@ -456,206 +960,188 @@ def process_region(region_key: str, config_manager: MultiRegionConfigManager, au
         
         print(f"FIPS validation passed - all {fips_validation['files_checked']} files match region {fips_validation['region_fips']}")
         
-        # Find Excel files
-        excel_files = list(region_dir.glob("*.xlsx"))
+        # Find input files (catalog is refreshed in case FIPS cleanup rewrote any)
+        report_stage('loading_main')
+        catalog = config_manager.get_input_catalog(region_key)
+        input_files = catalog.input_files()
+        
+        # Find main region file (most rows or specifically named)
+        main_file = catalog.main_file()
         
-        # Find main region file (largest or specifically named)
-        main_file = None
-        for excel_file in excel_files:
-            if 'main_region' in excel_file.name.lower():
-                main_file = excel_file
-                break
+        def file_sha256(path: Path) -> str:
+            return catalog.entries[path.name]['fingerprint']['sha256']
         
-        if main_file is None:
-            # Fall back to largest file
-            main_file = max(excel_files, key=lambda f: f.stat().st_size)
+        # The catalog has already hashed every input file, so parses don't hash them again
+        workbooks.ingest.add_fingerprints({path: catalog.entries[path.name]['fingerprint'] for path in input_files})
         
         # Find recent sales files
-        recent_sales_files = [f for f in excel_files if 'recent' in f.name.lower() and 'sales' in f.name.lower()]
+        recent_sales_files = [f for f in input_files if 'recent' in f.name.lower() and 'sales' in f.name.lower()]
         
-        # 1. MERGE RECENT SALES WITH MAIN FILE (if any)
-        if recent_sales_files:
-            print("\\nSTEP 1: Merging Recent Sales with Main File")
-            print("-" * 50)
+        # Create enhanced property processor with region-specific settings
+        processor_config = {
+            'region_input_date1': config.region_input_date1,
+            'region_input_date2': config.region_input_date2,
+            'region_input_amount1': config.region_input_amount1,
+            'region_input_amount2': config.region_input_amount2
+        }
+        processor = EnhancedPropertyProcessor(processor_config)
+        current_scoring_params = scoring_params(processor_config)
+        
+        niche_files = [f for f in input_files if f != main_file and f not in recent_sales_files]
+        change_log = None
+        delta_counts = None
+        
+        # With a memory budget, main data whose in-memory copies wouldn't fit is streamed in chunks
+        if budget is not None and chunk_size is None:
+            chunk_size, main_row_bytes = _plan_main_chunks(budget, main_file, recent_sales_files, catalog,
+                                                           region_logger)
+        
+        if chunk_size is not None:
+            # Bounded-memory mode: the main file is streamed in chunks straight to the Parquet output
+            if delta:
+                print("Delta scoring is not available in chunked mode - scoring all records")
+            report_stage('scoring')
+            chunked = _process_main_chunked(main_file, recent_sales_files, niche_files, catalog, workbooks, processor,
+                                            output_dir / f"{region_code}_main_region_enhanced_{datetime.now().strftime('%Y%m%d')}",
+                                            chunk_size, export_excel,
+                                            ParcelIndex(strip_suffix=config.parcel_strip_suffix), region_logger)
+            main_output, excel_output = chunked['columnar'], chunked['excel']
+            dedup_audit, total_updates, total_inserts = chunked['dedup_audit'], chunked['updates'], chunked['inserts']
+            for saved_path in filter(None, [main_output, excel_output]):
+                print(f"Enhanced main region saved: {saved_path.name}")
             
-            # Load main file
-            print(f"Loading main file: {main_file.name} ({main_file.stat().st_size:,} bytes)")
-            main_df = pd.read_excel(main_file)
-            print(f"Main file loaded: {len(main_df):,} records")
+            # Statistics only need a few columns of the output
+            report_stage('saving_outputs')
+            output_columns = columnar_columns(main_output)
+            main_result = read_columnar(main_output, columns=[column for column in STATS_INPUT_COLUMNS
+                                                              if column in output_columns])
+            owner_count = chunked['owners']
+        else:
+            # 1. LOAD MAIN DATA (main file + recent sales, deduplicated) - checkpointed stage
+            main_data_key = stage_key('main_data', {
+                'main_file': [main_file.name, file_sha256(main_file)],
+                'recent_sales_files': [[f.name, file_sha256(f)] for f in recent_sales_files]
+            })
+            checkpoint = checkpoints.load('main_data', main_data_key)
+            if checkpoint is not None:
+                main_df, dedup_audit = checkpoint[0]['main_df'], checkpoint[0]['dedup_audit']
+                print(f"\\nSTEP 1: Main data reused from checkpoint - {len(main_df):,} records")
+            else:
+                main_df, dedup_audit = _load_main_data(main_file, recent_sales_files, workbooks, region_logger)
+                checkpoints.save('main_data', main_data_key, {'main_df': main_df, 'dedup_audit': dedup_audit})
             
-            total_added = 0
-            for recent_file in recent_sales_files:
-                try:
-                    print(f"Processing recent sales: {recent_file.name}")
-                    recent_df = pd.read_excel(recent_file)
-                    
-                    if recent_df.empty:
-                        print(f"   WARNING: Empty recent sales file: {recent_file.name}")
-                        continue
-                    
-                    print(f"   Loaded {len(recent_df):,} recent sales records")
-                    
-                    # Merge unique records
-                    main_df, added_count = _append_unique_records(main_df, recent_df)
-                    total_added += added_count
-                    
-                    print(f"   SUCCESS: {added_count:,} unique records added from recent sales")
-                    
-                except Exception as e:
-                    print(f"   ERROR: Failed to process recent sales file {recent_file.name}: {e}")
-                    logger.error(f"Failed to process recent sales file {recent_file.name}: {e}")
-            
-            print(f"\\nMERGE SUMMARY:")
-            print(f"   Original main file records: {len(main_df) - total_added:,}")
-            print(f"   Recent sales records added: {total_added:,}")
-            print(f"   Combined dataset size: {len(main_df):,}")
-            
-            # Create enhanced property processor with region-specific settings
-            processor_config = {
-                'region_input_date1': config.region_input_date1,
-                'region_input_date2': config.region_input_date2,
-                'region_input_amount1': config.region_input_amount1,
-                'region_input_amount2': config.region_input_amount2
-            }
-            processor = EnhancedPropertyProcessor(processor_config)
-            
-            # Process the combined dataset
-            print("\\nSTEP 2: Processing Combined Dataset")
-            print("-" * 50)
+            if budget is not None:
+                budget.check('main data', main_df)
             
-            # Save combined dataset to temporary file for processing
-            temp_combined_file = region_dir / "temp_combined_main.xlsx"
-            try:
-                main_df.to_excel(temp_combined_file, index=False)
-                main_result = processor.process_excel_file(str(temp_combined_file))
-                # Clean up temporary file
-                temp_combined_file.unlink()
-            except Exception as e:
-                # Clean up temporary file if it exists
-                if temp_combined_file.exists():
-                    temp_combined_file.unlink()
-                raise e
+            # Stages work on the columns they read; the others are rejoined when the output is saved
+            main_df, passthrough = project_columns(main_df, WORKING_INPUT_COLUMNS)
             
-        else:
-            # No recent sales files, process main file normally
-            print("\\nSTEP 1: Processing Main Region File")
+            report_stage('scoring')
+            # Scores depend on the run date (ownership cutoffs, date windows), so the key includes it
+            scored_key = scored_main_key(main_data_key, current_scoring_params, scoring_date)
+            checkpoint = checkpoints.load('scored_main', scored_key)
+            if checkpoint is not None:
+                main_result = checkpoint[0]['main_result']
+                print("Scored main records reused from checkpoint (main data and scoring settings unchanged)")
+            elif delta:
+                previous_output = Path(previous_run['outputs']['main_output']) if previous_run else None
+                if previous_output is None or not previous_output.exists():
+                    print("Delta scoring: no previous enhanced output - scoring all records")
+                    region_logger.info("Delta scoring unavailable: no previous enhanced output")
+                elif previous_run.get('scoring_params') != current_scoring_params:
+                    print("Delta scoring: region scoring settings changed - scoring all records")
+                    region_logger.info("Delta scoring unavailable: scoring settings changed since previous run")
+                else:
+                    print(f"Delta scoring against previous output: {previous_output.name}")
+                    if previous_output.suffix == COLUMNAR_SUFFIX:
+                        previous_df = read_columnar(previous_output)
+                    else:
+                        previous_df = workbooks.read_input(previous_output)
+                    main_result, change_log, delta_counts = score_with_delta(
+                        main_df, previous_df, processor, datetime.fromisoformat(previous_run['recorded_at']))
+                    print(f"   Carried forward: {delta_counts['unchanged']:,}, re-scored: {delta_counts['rescored']:,}")
+                    print(f"   New: {delta_counts['new']:,}, changed: {delta_counts['changed']:,}, "
+                          f"removed: {delta_counts['removed']:,}")
+                    region_logger.info(f"Delta scoring: {delta_counts}")
+            
+            if checkpoint is None:
+                if delta_counts is None:
+                    main_result = processor.process_dataframe(main_df).reset_index(drop=True)
+                checkpoints.save('scored_main', scored_key, {'main_result': main_result})
+            
+            print(f"SUCCESS: Main region processed - {len(main_result):,} records")
+            
+            # 2. PROCESS NICHE LISTS
+            if recent_sales_files:
+                print("\\nSTEP 3: Processing Niche Lists (Updating Combined Dataset)")
+            else:
+                print("\\nSTEP 2: Processing Niche Lists (Updating Main Region)")
             print("-" * 50)
-            print(f"Processing main file: {main_file.name} ({main_file.stat().st_size:,} bytes)")
             
-            # Create enhanced property processor with region-specific settings
-            processor_config = {
-                'region_input_date1': config.region_input_date1,
-                'region_input_date2': config.region_input_date2,
-                'region_input_amount1': config.region_input_amount1,
-                'region_input_amount2': config.region_input_amount2
-            }
-            processor = EnhancedPropertyProcessor(processor_config)
+            report_stage('merging_niches')
             
-            # Process main file
-            main_result = processor.process_excel_file(str(main_file))
-        
-        print(f"SUCCESS: Main region processed - {len(main_result):,} records")
-        
-        # 2. PROCESS NICHE LISTS
-        if recent_sales_files:
-            print("\\nSTEP 3: Processing Niche Lists (Updating Combined Dataset)")
-        else:
-            print("\\nSTEP 2: Processing Niche Lists (Updating Main Region)")
-        print("-" * 50)
-        
-        niche_files = [f for f in excel_files if f != main_file and f not in recent_sales_files]
-        total_updates = 0
-        total_inserts = 0
-        
-        if niche_files:
-            for niche_file in niche_files:
-                try:
-                    print(f"Processing niche: {niche_file.name}")
-                    
-                    # Validate niche file
-                    if not niche_file.exists() or niche_file.stat().st_size == 0:
-                        print(f"   WARNING: Skipping empty or missing file: {niche_file.name}")
-                        continue
-                    
-                    # Determine niche type from filename
-                    niche_type = _detect_niche_type_from_filename(str(niche_file.name))
-                    
-                    # Read niche file with validation and memory optimization
-                    try:
-                        niche_df = pd.read_excel(niche_file, dtype={'FIPS': 'category'})
-                        
-                        # Optimize memory usage for niche files with safety limits
-                        protected_columns = {'Owner 1 Last Name', 'Owner 1 First Name', 'Address', 'Mailing Address'}
-                        string_columns = niche_df.select_dtypes(include=['object']).columns
-                        
-                        # Apply safe dtype optimization with limits
-                        for col in string_columns:
-                            if col not in protected_columns:
-                                try:
-                                    unique_ratio = niche_df[col].nunique() / len(niche_df)
-                                    max_categories = niche_df[col].nunique()
-                                    
-                                    # Safety checks before category conversion
-                                    if (unique_ratio < 0.5 and 
-                                        max_categories < 10000 and  # Prevent excessive category creation
-                                        niche_df[col].memory_usage(deep=True) > 1024 * 1024):  # Only optimize if >1MB
-                                        
-                                        niche_df[col] = niche_df[col].astype('category')
-                                        logger.debug(f"Converted column '{col}' to category (unique_ratio={unique_ratio:.3f}, categories={max_categories})")
-                                    
-                                except Exception as dtype_error:
-                                    logger.warning(f"Failed to optimize column '{col}': {dtype_error}")
-                                    # Continue without optimization for this column
-                                
-                    except Exception as read_error:
-                        print(f"   ERROR: Cannot read {niche_file.name}: {read_error}")
-                        logger.error(f"Cannot read {niche_file.name}: {read_error}")
-                        continue
-                    
-                    if niche_df.empty:
-                        print(f"   WARNING: Empty niche file: {niche_file.name}")
-                        continue
-                        
-                    print(f"   Loaded {len(niche_df):,} niche records")
-                    
-                    # Update main region with niche data
-                    try:
-                        main_result, updates, inserts = _update_main_with_niche(main_result, niche_df, niche_type)
-                        
-                        total_updates += updates
-                        total_inserts += inserts
-                        
-                        print(f"   SUCCESS: {niche_type}: {updates:,} updated, {inserts:,} inserted")
-                    except Exception as update_error:
-                        print(f"   ERROR: Failed to process {niche_type} data: {update_error}")
-                        logger.error(f"Failed to process {niche_type} data from {niche_file.name}: {update_error}")
-                    
-                except Exception as e:
-                    print(f"   ERROR: Unexpected error processing {niche_file.name}: {e}")
-                    logger.error(f"Unexpected error processing {niche_file.name}: {e}")
-                    
-            print(f"\\nNICHE PROCESSING SUMMARY:")
-            print(f"   Total Updated Records: {total_updates:,}")
-            print(f"   Total Inserted Records: {total_inserts:,}")
-            print(f"   Final Record Count: {len(main_result):,}")
+            niche_key = stage_key('niche_merge', {
+                'scored_main': scored_key,
+                'niche_files': [[f.name, file_sha256(f), catalog.entries[f.name]['niche_type']] for f in niche_files],
+                'parcel_strip_suffix': config.parcel_strip_suffix
+            })
+            checkpoint = checkpoints.load('niche_merge', niche_key)
+            if checkpoint is not None:
+                main_result = checkpoint[0]['main_result']
+                if 'niche_passthrough' in checkpoint[0]:
+                    passthrough.restore_inserted(checkpoint[0]['niche_passthrough'])
+                total_updates, total_inserts = checkpoint[1]['total_updates'], checkpoint[1]['total_inserts']
+                print(f"Niche merge reused from checkpoint - {total_updates:,} updated, {total_inserts:,} inserted")
+            else:
+                parcels = ParcelIndex(strip_suffix=config.parcel_strip_suffix)
+                main_result, total_updates, total_inserts = _merge_niche_files(main_result, niche_files, catalog,
+                                                                               workbooks, region_logger, passthrough,
+                                                                               parcels)
+                checkpoints.save('niche_merge', niche_key, {'main_result': main_result,
+                                                            'niche_passthrough': passthrough.inserted_frame()},
+                                 {'total_updates': total_updates, 'total_inserts': total_inserts})
             
-        else:
-            print("No niche files found")
-        
-        # 3. SAVE RESULTS
-        print("\\nSTEP 3: Saving Results")
-        print("-" * 50)
+            # One primary location per owner (best priority, then most distress flags)
+            main_result = assign_primary_locations(main_result)
+            owner_count = int(main_result['IsPrimaryLocation'].sum())
+            
+            # 3. SAVE RESULTS
+            report_stage('saving_outputs')
+            print("\\nSTEP 3: Saving Results")
+            print("-" * 50)
+            
+            # Save enhanced main region file with region name (Parquet is canonical, Excel an optional export)
+            try:
+                saved = save_dataset(passthrough.rejoin(main_result),
+                                     output_dir / f"{region_code}_main_region_enhanced_{datetime.now().strftime('%Y%m%d')}",
+                                     export_excel, region_logger)
+                main_output = saved['columnar'] or saved['excel']
+                excel_output = saved['excel']
+                for saved_path in filter(None, saved.values()):
+                    print(f"Enhanced main region saved: {saved_path.name}")
+            except Exception as e:
+                error_msg = f"Failed to save main output file: {e}"
+                print(f"ERROR: {error_msg}")
+                region_logger.error(error_msg)
+                return {'success': False, 'error': error_msg}
         
-        # Save enhanced main region file with region name
+        # Add this month's output to the multi-month dataset (output/enhanced_dataset/)
         try:
-            main_output = output_dir / f"{region_code}_main_region_enhanced_{datetime.now().strftime('%Y%m%d')}.xlsx"
-            main_result.to_excel(main_output, index=False)
-            print(f"Enhanced main region saved: {main_output.name}")
+            if publish_output(main_output, region_key):
+                print(f"Output dataset updated: {region_key} {run_month(main_output)}")
         except Exception as e:
-            error_msg = f"Failed to save main output file: {e}"
-            print(f"ERROR: {error_msg}")
-            logger.error(error_msg)
-            return {'success': False, 'error': error_msg}
+            print(f"WARNING: Could not add output to the output dataset: {e}")
+            region_logger.warning(f"Could not publish {main_output.name} to the output dataset: {e}")
+        
+        # Record owner, mailing, sale, priority and flag changes in the region's property history
+        if main_output.suffix == COLUMNAR_SUFFIX:
+            try:
+                history_counts = update_history_from_output(region_key, main_output, run_month(main_output))
+                print(f"Property history: {history_counts['new']:,} new, {history_counts['changed']:,} changed, "
+                      f"{history_counts['removed']:,} removed")
+            except Exception as e:
+                print(f"WARNING: Could not update the property history: {e}")
+                region_logger.warning(f"Could not update the property history from {main_output.name}: {e}")
         
         # Save optional summary report with region name
         summary_output = output_dir / f"{region_code}_processing_summary_{datetime.now().strftime('%Y%m%d')}.xlsx"
@@ -669,11 +1155,16 @@ def process_region(region_key: str, config_manager: MultiRegionConfigManager, au
             'original_records': len(main_result) - total_inserts,
             'updated_records': total_updates,
             'inserted_records': total_inserts,
-            'niche_files_processed': len(niche_files)
+            'niche_files_processed': len(niche_files),
+            'duplicate_rows_dropped': len(dedup_audit),
+            'owners': owner_count
         }
+        if delta_counts is not None:
+            summary_data.update({f'delta_{key}': value for key, value in delta_counts.items()})
         
-        # Priority distribution
-        priority_dist = main_result['PriorityCode'].value_counts().head(10)
+        # Cross-tabs, match sources and data quality in one pass; the priority distribution is derived from them
+        region_stats = compute_region_stats(main_result)
+        priority_dist = pd.Series(region_stats['priority_totals'], dtype='int64').head(10)
         
         # Create summary report DataFrame
         priority_data = []
@@ -692,17 +1183,47 @@ def process_region(region_key: str, config_manager: MultiRegionConfigManager, au
                 pd.DataFrame([summary_data]).to_excel(writer, sheet_name='Summary', index=False)
                 # Priority distribution sheet
                 pd.DataFrame(priority_data).to_excel(writer, sheet_name='Priority_Distribution', index=False)
+                # Statistics sheets
+                for sheet_name, sheet_df in stats_sheets(region_stats).items():
+                    sheet_df.to_excel(writer, sheet_name=sheet_name, index=False)
             
             print(f"Summary report saved: {summary_output.name}")
         except Exception as e:
             print(f"Warning: Could not save summary report: {e}")
         
+        # Audit of the duplicate parcel rows dropped before scoring
+        dedup_audit_output = output_dir / f"{region_code}_dedup_audit_{datetime.now().strftime('%Y%m%d')}.xlsx"
+        if not dedup_audit.empty:
+            try:
+                write_excel_streaming(dedup_audit, dedup_audit_output, sheet_name='Dropped_Duplicates')
+                print(f"Dedup audit saved: {dedup_audit_output.name}")
+            except Exception as e:
+                print(f"Warning: Could not save dedup audit: {e}")
+        
+        # Machine-readable copy of the statistics
+        stats_output = output_dir / f"{region_code}_region_stats_{datetime.now().strftime('%Y%m%d')}.json"
+        try:
+            write_stats_json(region_stats, stats_output, region_key=region_key,
+                             processing_date=summary_data['processing_date'])
+        except Exception as e:
+            print(f"Warning: Could not save statistics file: {e}")
+        
+        # Save change log of new, changed and removed properties (delta scoring only)
+        if change_log is not None:
+            change_log_output = output_dir / f"{region_code}_change_log_{datetime.now().strftime('%Y%m%d')}.xlsx"
+            try:
+                write_excel_streaming(change_log, change_log_output, sheet_name='Changes')
+                print(f"Change log saved: {change_log_output.name}")
+            except Exception as e:
+                print(f"Warning: Could not save change log: {e}")
+        
         print("\\nFINAL SUMMARY")
         print("=" * 70)
         print(f"Region: {config.region_name}")
         print(f"Total Records: {len(main_result):,}")
         print(f"Updated with Niche Data: {total_updates:,}")
         print(f"New from Niche Lists: {total_inserts:,}")
+        print(f"Unique Owners (primary locations): {owner_count:,}")
         
         print(f"\\nTOP PRIORITY CODES:")
         for priority, count in priority_dist.items():
@@ -712,28 +1233,208 @@ def process_region(region_key: str, config_manager: MultiRegionConfigManager, au
         print(f"\\nOutput saved to: {output_dir}")
         print("=" * 70)
         
-        # Clean up logging handler
-        logger.removeHandler(file_handler)
-        file_handler.close()
+        region_logger.info(f"Completed {region_key}: {len(main_result):,} records written to {main_output.name}")
         
-        return {
+        result = {
             'success': True,
             'region_name': config.region_name,
             'total_records': len(main_result),
             'updated_records': total_updates,
             'inserted_records': total_inserts,
+            'duplicate_rows_dropped': len(dedup_audit),
             'output_file': str(main_output)
         }
+        if excel_output is not None:
+            result['excel_file'] = str(excel_output)
+        if delta_counts is not None:
+            result['delta'] = delta_counts
+        
+        # Record the inputs this output was built from (re-fingerprinted, FIPS cleanup may have rewritten files)
+        outputs = {'main_output': str(main_output)}
+        if excel_output is not None and excel_output != main_output:
+            outputs['excel_output'] = str(excel_output)
+        if summary_output.exists():
+            outputs['summary_output'] = str(summary_output)
+        if stats_output.exists():
+            outputs['stats_output'] = str(stats_output)
+        if not dedup_audit.empty and dedup_audit_output.exists():
+            outputs['dedup_audit_output'] = str(dedup_audit_output)
+        manifest.save(fingerprint_region_inputs(region_dir, input_fingerprints), outputs,
+                      {key: value for key, value in result.items() if key != 'success'}, current_scoring_params,
+                      run_options, output_dir.name)
+        
+        return result
+        
+    except MemoryError as e:
+        if budget is None or chunk_size is not None:
+            region_logger.error(f"Processing failed for {region_key}: out of memory ({e})")
+            print(f"\\nERROR: Processing failed - out of memory ({e})")
+            return {'success': False, 'error': f"Out of memory: {e}"}
+        region_logger.warning(f"Out of memory in the in-memory pipeline ({e}) - retrying in chunked mode")
+        print(f"\\nWARNING: Out of memory ({e}) - retrying with the main file streamed in chunks")
+        memory_fallback = True
         
     except Exception as e:
-        logger.error(f"Processing failed for {region_key}: {e}")
+        region_logger.error(f"Processing failed for {region_key}: {e}")
         print(f"\\nERROR: Processing failed - {e}")
         
-        # Clean up logging handler
-        logger.removeHandler(file_handler)
-        file_handler.close()
-        
         return {'success': False, 'error': str(e)}
+    
+    finally:
+        # Release cached workbooks and clean up logging handler (covers early returns as well)
+        if workbooks.misses:
+            workbooks.log_summary()
+        workbooks.close()
+        _close_region_logger(region_logger, file_handler)
+    
+    # Reached only after running out of memory: everything in memory has been released,
+    # so run the region again streaming the main file from disk
+    if memory_fallback:
+        return process_region(region_key, config_manager, auto_clean_fips, interactive, stage_callback,
+                              force=True, export_excel=export_excel,
+                              chunk_size=budget.chunk_rows(main_row_bytes, DEFAULT_CHUNK_ROWS),
+                              max_memory_mb=max_memory_mb)
+
+def _init_region_worker(regions_dir: str) -> None:
+    """Initialize a parallel worker process with its own configuration manager"""
+    global _worker_config_manager
+    _worker_config_manager = MultiRegionConfigManager(regions_dir)
+
+def _process_tracked_region(region_key: str, config_manager: MultiRegionConfigManager, auto_clean_fips: bool,
+                            interactive: bool, job_store_path: Optional[str] = None,
+                            batch_id: Optional[int] = None, force: bool = False, delta: bool = False,
+                            from_stage: Optional[str] = None, export_excel: bool = True,
+                            chunk_size: Optional[int] = None, max_memory_mb: Optional[float] = None) -> Dict:
+    """
+    Process one region, recording its job state in the batch job store when a batch is active.
+    """
+    job_store = BatchJobStore(Path(job_store_path)) if job_store_path and batch_id is not None else None
+    stage_callback = None
+    
+    if job_store:
+        attempt = job_store.mark_running(batch_id, region_key)
+        logger.info(f"Batch {batch_id}: starting {region_key} (attempt {attempt})")
+        stage_callback = lambda stage: job_store.record_stage(batch_id, region_key, stage)
+    
+    try:
+        result = process_region(region_key, config_manager, auto_clean_fips,
+                                interactive=interactive, stage_callback=stage_callback, force=force,
+                                delta=delta, from_stage=from_stage, export_excel=export_excel,
+                                chunk_size=chunk_size, max_memory_mb=max_memory_mb)
+    except BaseException as e:
+        # Record the failure before propagating (e.g. KeyboardInterrupt, MemoryError)
+        if job_store:
+            job_store.mark_finished(batch_id, region_key, {'success': False, 'error': f"Interrupted: {e!r}"})
+        raise
+    
+    result['region_key'] = region_key
+    if job_store:
+        job_store.mark_finished(batch_id, region_key, result)
+    return result
+
+def _run_region_job(region_key: str, auto_clean_fips: bool, job_store_path: Optional[str] = None,
+                    batch_id: Optional[int] = None, force: bool = False, delta: bool = False,
+                    from_stage: Optional[str] = None, export_excel: bool = True,
+                    chunk_size: Optional[int] = None, max_memory_mb: Optional[float] = None) -> Dict:
+    """
+    Process one region inside a worker process.
+    
+    Console output for the region is captured in its own transcript file under
+    output/<region>/YYYY_MM/ so parallel regions don't interleave on screen.
+    """
+    output_dir = _worker_config_manager.create_output_directory(region_key)
+    region_code = _worker_config_manager.get_region_config(region_key).region_code.lower()
+    console_file = output_dir / f"{region_code}_console_{datetime.now().strftime('%Y%m%d_%H%M')}.txt"
+    
+    with open(console_file, 'w', encoding='utf-8') as console_out, contextlib.redirect_stdout(console_out):
+        result = _process_tracked_region(region_key, _worker_config_manager, auto_clean_fips, False,
+                                         job_store_path, batch_id, force, delta, from_stage,
+                                         export_excel, chunk_size, max_memory_mb)
+    
+    result['console_file'] = str(console_file)
+    return result
+
+def process_regions_parallel(region_keys: List[str], config_manager: MultiRegionConfigManager,
+                             auto_clean_fips: bool = False, jobs: int = 2,
+                             job_store_path: Optional[str] = None, batch_id: Optional[int] = None,
+                             force: bool = False, delta: bool = False,
+                             from_stage: Optional[str] = None, export_excel: bool = True,
+                             chunk_size: Optional[int] = None, max_memory_mb: Optional[float] = None) -> List[Dict]:
+    """
+    Process several regions concurrently in a process pool.
+    
+    Each worker process builds its own configuration manager and region loggers, so
+    nothing is shared between regions except the read-only region configs on disk.
+    The interactive FIPS prompt is disabled in workers (see process_region).
+    
+    Args:
+        region_keys: Regions to process
+        config_manager: Configuration manager (used for its regions directory)
+        auto_clean_fips: Clean FIPS mismatches without prompting
+        jobs: Maximum number of worker processes
+        job_store_path: Batch job store database to record job state in (optional)
+        batch_id: Batch the region jobs belong to (required with job_store_path)
+        force: Reprocess regions even when their inputs are unchanged
+        delta: Score only new or changed rows against each region's previous output
+        from_stage: Recompute from this pipeline stage onward in every region
+        export_excel: Also write each enhanced output as Excel
+        chunk_size: Stream each main file in chunks of this many rows (bounded memory)
+        max_memory_mb: Memory budget of the whole run, split evenly between the workers
+        
+    Returns:
+        List of per-region result dicts in the same order as region_keys
+    """
+    jobs = max(1, min(jobs, len(region_keys)))
+    results_by_region: Dict[str, Dict] = {}
+    worker_memory_mb = max_memory_mb / jobs if max_memory_mb else None
+    
+    print(f"Running {len(region_keys)} regions with {jobs} parallel workers")
+    if worker_memory_mb:
+        print(f"Memory budget per worker: {worker_memory_mb:,.0f} MB")
+    print("Per-region console output and logs are written to output/<region>/YYYY_MM/")
+    
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_region_worker,
+                             initargs=(str(config_manager.regions_dir),)) as executor:
+        futures = {executor.submit(_run_region_job, region_key, auto_clean_fips, job_store_path, batch_id,
+                                   force, delta, from_stage, export_excel, chunk_size, worker_memory_mb): region_key
+                   for region_key in region_keys}
+        
+        for future in as_completed(futures):
+            region_key = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # Worker died (e.g. out of memory) - record the failure and keep going
+                logger.error(f"Worker failed for {region_key}: {e}")
+                result = {'success': False, 'region_key': region_key, 'error': f"Worker failed: {e}"}
+                if job_store_path and batch_id is not None:
+                    BatchJobStore(Path(job_store_path)).mark_finished(batch_id, region_key, result)
+            
+            results_by_region[region_key] = result
+            status = ("REUSED" if result.get('reused') else "DONE") if result.get('success', False) else "FAILED"
+            detail = f"{result.get('total_records', 0):,} records" if result.get('success', False) else result.get('error', 'Unknown error')
+            print(f"[{status}] {region_key}: {detail}")
+    
+    return [results_by_region[region_key] for region_key in region_keys]
+
+def _run_region_batch(region_keys: List[str], config_manager: MultiRegionConfigManager, auto_clean_fips: bool,
+                      jobs: int, job_store: BatchJobStore, batch_id: int, force: bool = False,
+                      delta: bool = False, from_stage: Optional[str] = None,
+                      export_excel: bool = True, chunk_size: Optional[int] = None,
+                      max_memory_mb: Optional[float] = None) -> List[Dict]:
+    """Run a set of region jobs sequentially or in parallel, recording each in the job store"""
+    if jobs > 1 and len(region_keys) > 1:
+        return process_regions_parallel(region_keys, config_manager, auto_clean_fips, jobs,
+                                        str(job_store.db_path), batch_id, force, delta, from_stage, export_excel,
+                                        chunk_size, max_memory_mb)
+    
+    results = []
+    for region_key in region_keys:
+        print(f"\\nStarting {region_key}...")
+        results.append(_process_tracked_region(region_key, config_manager, auto_clean_fips, True,
+                                               str(job_store.db_path), batch_id, force, delta, from_stage,
+                                               export_excel, chunk_size, max_memory_mb))
+    return results
 
 def main():
     """Main entry point"""
@@ -744,7 +1445,19 @@ def main():
 Examples:
   python monthly_processing_v2.py --region roanoke_city_va
   python monthly_processing_v2.py --all-regions  
+  python monthly_processing_v2.py --all-regions --jobs 4 --auto-clean-fips
+  python monthly_processing_v2.py --all-regions --resume --retries 2
+  python monthly_processing_v2.py --region roanoke_city_va --force
+  python monthly_processing_v2.py --region roanoke_city_va --delta
+  python monthly_processing_v2.py --region roanoke_city_va --from-stage niche_merge
+  python monthly_processing_v2.py --all-regions --no-excel
+  python monthly_processing_v2.py --region roanoke_city_va --chunk-size 50000
+  python monthly_processing_v2.py --all-regions --max-memory 4096
+  python monthly_processing_v2.py --batch-status
   python monthly_processing_v2.py --list-regions
+
+Pipeline stages (checkpointed under output/<region>/checkpoints/):
+  """ + "\n  ".join(stage_descriptions()) + """
         """
     )
     
@@ -752,8 +1465,30 @@ Examples:
     group.add_argument("--region", help="Process specific region (e.g., roanoke_city_va)")
     group.add_argument("--all-regions", action="store_true", help="Process all regions")
     group.add_argument("--list-regions", action="store_true", help="List available regions")
+    group.add_argument("--batch-status", action="store_true", help="Show job states of the latest --all-regions batch")
     
     parser.add_argument("--auto-clean-fips", action="store_true", help="Automatically clean files with FIPS mismatches")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Number of regions to process in parallel with --all-regions (default: 1)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Resume the latest --all-regions batch, skipping regions that already succeeded")
+    parser.add_argument("--retries", type=int, default=0,
+                        help="Times to retry failed regions within an --all-regions run (default: 0)")
+    parser.add_argument("--force", action="store_true",
+                        help="Reprocess regions even when their input files are unchanged since the last run")
+    parser.add_argument("--delta", action="store_true",
+                        help="Only score rows that are new or changed since the previous enhanced output")
+    parser.add_argument("--from-stage", choices=STAGE_NAMES,
+                        help="Recompute from this pipeline stage onward instead of reusing checkpoints (implies --force)")
+    parser.add_argument("--no-excel", action="store_true",
+                        help="Write the enhanced output as Parquet only, without the Excel export")
+    parser.add_argument("--chunk-size", type=int, nargs='?', const=DEFAULT_CHUNK_ROWS,
+                        help="Stream large main files in chunks of this many rows for bounded memory "
+                             f"(default when given without a value: {DEFAULT_CHUNK_ROWS:,}); "
+                             "skips checkpoints, delta scoring and IsPrimaryLocation")
+    parser.add_argument("--max-memory", type=float, metavar="MB",
+                        help="Approximate memory budget in MB (split between --jobs workers): main files too large "
+                             "for it are streamed in chunks and cached input files are spilled to disk")
     
     args = parser.parse_args()
     
@@ -771,9 +1506,19 @@ Examples:
             
             print(f"\\nTotal regions configured: {len(config_manager.configs)}")
             
+        elif args.batch_status:
+            job_store = BatchJobStore()
+            batch_id = job_store.latest_batch_id()
+            if batch_id is None:
+                print("No batch runs recorded yet")
+            else:
+                job_store.print_status(batch_id)
+            
         elif args.region:
             # Process single region
-            result = process_region(args.region, config_manager, args.auto_clean_fips)
+            result = process_region(args.region, config_manager, args.auto_clean_fips, force=args.force,
+                                    delta=args.delta, from_stage=args.from_stage, export_excel=not args.no_excel,
+                                    chunk_size=args.chunk_size, max_memory_mb=args.max_memory)
             
             if result['success']:
                 print("\\n[SUCCESS] Processing completed successfully!")
@@ -786,20 +1531,57 @@ Examples:
             print("\\n[BATCH] PROCESSING ALL REGIONS")
             print("=" * 70)
             
-            results = []
-            for region_key in config_manager.configs.keys():
-                print(f"\\nStarting {region_key}...")
-                result = process_region(region_key, config_manager, args.auto_clean_fips)
-                results.append(result)
+            job_store = BatchJobStore()
+            region_keys = list(config_manager.configs.keys())
+            batch_id = job_store.latest_batch_id() if args.resume else None
+            
+            if batch_id is not None:
+                resume_keys = set(job_store.regions_to_resume(batch_id))
+                skipped = [key for key in region_keys if key not in resume_keys]
+                region_keys = [key for key in region_keys if key in resume_keys]
+                print(f"Resuming batch {batch_id}: skipping {len(skipped)} succeeded regions, "
+                      f"{len(region_keys)} regions left to run")
+            else:
+                if args.resume:
+                    print("No previous batch found - starting a new batch")
+                batch_id = job_store.create_batch(region_keys, {'jobs': args.jobs, 'auto_clean_fips': args.auto_clean_fips,
+                                                                 'force': args.force, 'delta': args.delta,
+                                                                 'from_stage': args.from_stage, 'no_excel': args.no_excel,
+                                                                 'chunk_size': args.chunk_size,
+                                                                 'max_memory': args.max_memory})
+                print(f"Batch {batch_id}: {len(region_keys)} regions queued (job store: {job_store.db_path})")
+            
+            results = _run_region_batch(region_keys, config_manager, args.auto_clean_fips, args.jobs,
+                                        job_store, batch_id, args.force, args.delta, args.from_stage,
+                                        not args.no_excel, args.chunk_size, args.max_memory)
+            
+            # Retry failed regions in place, replacing their earlier results
+            for retry in range(1, args.retries + 1):
+                failed_keys = [r['region_key'] for r in results if not r.get('success', False)]
+                if not failed_keys:
+                    break
+                print(f"\n[RETRY {retry}/{args.retries}] Retrying {len(failed_keys)} failed regions: {', '.join(failed_keys)}")
+                retried = {r['region_key']: r for r in _run_region_batch(failed_keys, config_manager, args.auto_clean_fips,
+                                                                          args.jobs, job_store, batch_id,
+                                                                          args.force, args.delta, args.from_stage,
+                                                                          not args.no_excel, args.chunk_size,
+                                                                          args.max_memory)}
+                results = [retried.get(r['region_key'], r) for r in results]
+            
+            job_store.finish_batch(batch_id)
             
             # Summary of all regions
             print("\\n\\n[SUMMARY] BATCH PROCESSING SUMMARY")
             print("=" * 70)
+            print(f"Batch ID: {batch_id} (see --batch-status)")
             
             successful = [r for r in results if r.get('success', False)]
             failed = [r for r in results if not r.get('success', False)]
             
             print(f"Successfully processed: {len(successful)} regions")
+            reused = [r for r in successful if r.get('reused')]
+            if reused:
+                print(f"   Reused unchanged outputs: {len(reused)} regions")
             print(f"Failed: {len(failed)} regions")
             
             if successful:
@@ -809,7 +1591,7 @@ Examples:
             if failed:
                 print(f"\\n[FAILED] Failed regions:")
                 for result in failed:
-                    print(f"  - {result.get('region_name', 'Unknown')}: {result.get('error', 'Unknown error')}")
+                    print(f"  - {result.get('region_name', result.get('region_key', 'Unknown'))}: {result.get('error', 'Unknown error')}")
     
     except Exception as e:
         logger.error(f"Application error: {e}")
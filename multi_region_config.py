@@ -14,6 +14,8 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass
 import logging
 
+from region_catalog import RegionInputCatalog, EMPTY_FILE_ERROR
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -29,6 +31,7 @@ class RegionConfig:
     market_type: str
     description: str
     notes: str
+    parcel_strip_suffix: bool = False  # Fold lettered split parcels into their base parcel (parcel_keys)
     
     def __post_init__(self):
         """Validate configuration after creation"""
@@ -112,7 +115,8 @@ class MultiRegionConfigManager:
             region_input_amount2=amount2,
             market_type=data.get('market_type', 'Unknown'),
             description=data.get('description', ''),
-            notes=data.get('notes', '')
+            notes=data.get('notes', ''),
+            parcel_strip_suffix=bool(data.get('parcel_strip_suffix', False))
         )
     
     def get_region_config(self, region_key: str) -> RegionConfig:
@@ -143,24 +147,29 @@ class MultiRegionConfigManager:
         
         return self.regions_dir / region_key
     
+    def get_input_catalog(self, region_key: str) -> RegionInputCatalog:
+        """Return the region's input catalog, refreshed for any changed workbooks"""
+        catalog = RegionInputCatalog(region_key, self.get_region_directory(region_key))
+        catalog.refresh()
+        return catalog
+    
     def validate_region_files(self, region_key: str) -> Dict[str, bool]:
         """Validate that required files exist for a region"""
         region_dir = self.get_region_directory(region_key)
+        catalog = self.get_input_catalog(region_key)
         
-        # Check for Excel files
-        excel_files = list(region_dir.glob("*.xlsx"))
-        has_excel = len(excel_files) > 0
+        # Check for input files (Excel, CSV, Parquet or Feather)
+        has_inputs = len(catalog.entries) > 0
         
-        # Check for main region file (specifically named or any Excel files as fallback)
-        main_files = list(region_dir.glob("main_region.*"))
-        has_main = len(main_files) > 0 or has_excel
+        # Check for main region file (specifically named or the input file with the most rows as fallback)
+        has_main = catalog.main_file() is not None
         
         return {
             'has_config': (region_dir / "config.json").exists(),
             'has_main_file': has_main,
-            'has_excel_files': has_excel,
-            'total_files': len(excel_files),
-            'valid': has_main and has_excel
+            'has_input_files': has_inputs,
+            'total_files': len(catalog.entries),
+            'valid': has_main and has_inputs
         }
     
     def create_output_directory(self, region_key: str) -> Path:
@@ -177,11 +186,14 @@ class MultiRegionConfigManager:
         """
         Validate that all Excel files in region match the expected FIPS code.
         
+        FIPS values come from the region input catalog, which streams the FIPS column
+        of every row of each file and is only re-read when a file changes.
+        
         Returns:
-            Dict with validation results including file-specific FIPS checks
+            Dict with validation results including file-specific FIPS checks, exact
+            mismatch counts per FIPS value and a FIPS histogram across all files
         """
         config = self.get_region_config(region_key)
-        region_dir = self.get_region_directory(region_key)
         
         validation_results = {
             'region_fips': config.fips_code,
@@ -190,63 +202,52 @@ class MultiRegionConfigManager:
             'files_invalid': [],
             'missing_fips_column': [],
             'fips_mismatches': [],
+            'fips_histogram': {},
+            'mismatched_rows': 0,
             'all_valid': True
         }
         
-        # Check all Excel files in the region
-        excel_files = list(region_dir.glob("*.xlsx"))
+        # Check all Excel files in the region using the cached FIPS distribution of each file
+        catalog = self.get_input_catalog(region_key)
+        expected_fips = str(config.fips_code).strip()
         
-        for excel_file in excel_files:
-            try:
-                # Check file accessibility first
-                if not excel_file.exists() or excel_file.stat().st_size == 0:
-                    logger.warning(f"Skipping empty or missing file: {excel_file.name}")
-                    continue
-                
-                # Read just the first few rows to check FIPS
-                try:
-                    df_sample = pd.read_excel(excel_file, nrows=10)
-                except Exception as read_error:
-                    logger.error(f"Cannot read Excel file {excel_file.name}: {read_error}")
-                    validation_results['files_invalid'].append(f"{excel_file.name} (read error: {read_error})")
-                    validation_results['all_valid'] = False
-                    continue
-                
-                validation_results['files_checked'] += 1
-                
-                if 'FIPS' not in df_sample.columns:
-                    validation_results['missing_fips_column'].append(excel_file.name)
-                    validation_results['all_valid'] = False
-                    continue
-                
-                # Check if FIPS values match expected
-                # Normalize both values to handle number vs string comparison
-                try:
-                    file_fips_codes = df_sample['FIPS'].dropna().astype(str).str.strip().unique()
-                    expected_fips = str(config.fips_code).strip()
-                    
-                    # Check if any FIPS codes don't match expected
-                    mismatched_fips = [fips for fips in file_fips_codes if fips != expected_fips]
-                    
-                    if mismatched_fips:
-                        validation_results['fips_mismatches'].append({
-                            'file': excel_file.name,
-                            'expected': config.fips_code,
-                            'found': list(file_fips_codes)
-                        })
-                        validation_results['files_invalid'].append(excel_file.name)
-                        validation_results['all_valid'] = False
-                    else:
-                        validation_results['files_valid'] += 1
-                except Exception as fips_error:
-                    logger.error(f"Error processing FIPS data in {excel_file.name}: {fips_error}")
-                    validation_results['files_invalid'].append(f"{excel_file.name} (FIPS processing error)")
-                    validation_results['all_valid'] = False
-                    
-            except Exception as e:
-                logger.error(f"Unexpected error validating {excel_file.name}: {e}")
-                validation_results['files_invalid'].append(f"{excel_file.name} (unexpected error)")
+        for file_name, entry in catalog.entries.items():
+            if entry['read_error'] == EMPTY_FILE_ERROR:
+                logger.warning(f"Skipping empty or missing file: {file_name}")
+                continue
+            
+            if entry['read_error']:
+                logger.error(f"Cannot read Excel file {file_name}: {entry['read_error']}")
+                validation_results['files_invalid'].append(f"{file_name} (read error: {entry['read_error']})")
+                validation_results['all_valid'] = False
+                continue
+            
+            validation_results['files_checked'] += 1
+            
+            if entry['fips_counts'] is None:
+                validation_results['missing_fips_column'].append(file_name)
+                validation_results['all_valid'] = False
+                continue
+            
+            # Check if any FIPS codes in the file don't match expected
+            file_fips_codes = list(entry['fips_counts'])
+            for fips, count in entry['fips_counts'].items():
+                validation_results['fips_histogram'][fips] = validation_results['fips_histogram'].get(fips, 0) + count
+            mismatch_counts = {fips: count for fips, count in entry['fips_counts'].items() if fips != expected_fips}
+            
+            if mismatch_counts:
+                validation_results['fips_mismatches'].append({
+                    'file': file_name,
+                    'expected': config.fips_code,
+                    'found': file_fips_codes,
+                    'mismatch_counts': mismatch_counts,
+                    'matching_rows': entry['fips_counts'].get(expected_fips, 0)
+                })
+                validation_results['mismatched_rows'] += sum(mismatch_counts.values())
+                validation_results['files_invalid'].append(file_name)
                 validation_results['all_valid'] = False
+            else:
+                validation_results['files_valid'] += 1
         
         return validation_results
 
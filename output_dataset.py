@@ -0,0 +1,234 @@
+"""
+Enhanced Output Dataset
+
+Each monthly run (and each skip trace update) publishes its enhanced output into one
+Parquet dataset partitioned by region and month:
+
+    output/enhanced_dataset/region=<region_key>/month=<YYYY_MM>/part-0.parquet
+
+A re-run in the same month replaces that month's partition. query_dataset() scans
+the dataset with its filters pushed down: region and month filters skip whole
+partitions, and PriorityCode and distress flag filters are checked against Parquet
+row-group statistics before rows are read. Questions across months and regions
+("which properties have been tax delinquent for 3+ months") are answered without
+opening any Excel workbook.
+"""
+
+import logging
+import os
+import re
+import shutil
+import pandas as pd
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from columnar_io import COLUMNAR_SUFFIX
+from parcel_keys import property_keys
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    _PYARROW_AVAILABLE = True
+except ImportError:
+    _PYARROW_AVAILABLE = False
+
+DATASET_ROOT = Path("output") / "enhanced_dataset"
+PART_FILE_NAME = "part-0.parquet"
+
+# Partition columns added to every queried row
+REGION_FIELD = 'region'
+MONTH_FIELD = 'month'
+
+_MONTH_PATTERN = re.compile(r'^\d{4}_\d{2}$')
+
+
+def normalize_month(month: str) -> str:
+    """Month in partition form, 'YYYY_MM' ('2025-09' is accepted too)"""
+    normalized = str(month).strip().replace('-', '_')
+    if not _MONTH_PATTERN.match(normalized):
+        raise ValueError(f"Month must look like YYYY_MM or YYYY-MM, got {month!r}")
+    return normalized
+
+
+def run_month(output_file: Path) -> str:
+    """Month of an output file in output/<region>/YYYY_MM/, otherwise the current month"""
+    folder = Path(output_file).parent.name
+    return folder if _MONTH_PATTERN.match(folder) else datetime.now().strftime('%Y_%m')
+
+
+def partition_dir(region_key: str, month: str, dataset_root: Path = DATASET_ROOT) -> Path:
+    """Directory of one region/month partition"""
+    return Path(dataset_root) / f"{REGION_FIELD}={region_key}" / f"{MONTH_FIELD}={normalize_month(month)}"
+
+
+def publish_output(output_file: Path, region_key: str, month: Optional[str] = None,
+                   dataset_root: Path = DATASET_ROOT) -> Optional[Path]:
+    """
+    Copy a Parquet enhanced output into its region/month partition, replacing the
+    partition's previous contents.
+
+    Args:
+        output_file: Canonical enhanced output (.parquet; Excel-only outputs are skipped)
+        region_key: Region the output belongs to
+        month: Partition month (defaults to the month folder the output was written to)
+        dataset_root: Dataset location
+
+    Returns:
+        Path of the published partition file, or None when the output isn't Parquet
+    """
+    output_file = Path(output_file)
+    if output_file.suffix != COLUMNAR_SUFFIX:
+        logger.warning(f"Not publishing {output_file.name} to the output dataset: only Parquet outputs are published")
+        return None
+
+    target_dir = partition_dir(region_key, month or run_month(output_file), dataset_root)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    target = target_dir / PART_FILE_NAME
+    # Copy beside the target, then swap - dataset scans skip dot files, so a query never sees a partial copy
+    temp_file = target_dir / f".{PART_FILE_NAME}.tmp"
+    shutil.copyfile(output_file, temp_file)
+    os.replace(temp_file, target)
+
+    logger.info(f"Published {output_file.name} to the output dataset as {region_key} {target_dir.name}")
+    return target
+
+
+def partition_files(dataset_root: Path = DATASET_ROOT) -> List[Path]:
+    """All published partition files"""
+    return sorted(Path(dataset_root).glob(f"{REGION_FIELD}=*/{MONTH_FIELD}=*/{PART_FILE_NAME}"))
+
+
+def _partition_schema() -> 'pa.Schema':
+    """Types of the partition columns (both kept as text)"""
+    return pa.schema([pa.field(REGION_FIELD, pa.string()), pa.field(MONTH_FIELD, pa.string())])
+
+
+def _dataset_schema(files: List[Path]) -> 'pa.Schema':
+    """
+    One schema for all partitions. Columns missing from some months read as null;
+    a column stored with different types in different months (e.g. Zip as integers one
+    month and ZIP+4 text the next) is widened where possible, otherwise read as text.
+    """
+    fields = {}
+    for file in files:
+        for field in pq.read_schema(file):
+            if field.name.startswith('__'):  # Stored pandas index
+                continue
+            known = fields.get(field.name)
+            if known is None or known.type == field.type:
+                fields[field.name] = field
+                continue
+            try:
+                fields[field.name] = pa.unify_schemas([pa.schema([known]), pa.schema([field])],
+                                                      promote_options='permissive').field(0)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                fields[field.name] = pa.field(field.name, pa.string())
+    return pa.schema(list(fields.values()) + list(_partition_schema()))
+
+
+def dataset_columns(dataset_root: Path = DATASET_ROOT) -> List[str]:
+    """Column names across all published partitions, including region and month"""
+    files = partition_files(dataset_root)
+    return _dataset_schema(files).names if files and _PYARROW_AVAILABLE else []
+
+
+def query_dataset(regions: Optional[Iterable[str]] = None, months: Optional[Iterable[str]] = None,
+                  since: Optional[str] = None, until: Optional[str] = None,
+                  priority_codes: Optional[Iterable[str]] = None, flags: Optional[Iterable[str]] = None,
+                  columns: Optional[List[str]] = None, dataset_root: Path = DATASET_ROOT) -> pd.DataFrame:
+    """
+    Read rows of the output dataset, filtering during the scan.
+
+    Args:
+        regions: Region keys to include (all when None)
+        months: Months to include, 'YYYY_MM' (all when None)
+        since: First month to include
+        until: Last month to include
+        priority_codes: PriorityCode values to include
+        flags: Distress flag columns that must all be True (e.g. ['HasCurrentTax'])
+        columns: Output columns to read (all when None); region and month are always included
+        dataset_root: Dataset location
+
+    Returns:
+        Matching rows with 'region' and 'month' columns (empty when nothing is published)
+
+    Raises:
+        ImportError: pyarrow is not installed
+        ValueError: a filter or requested column doesn't exist in the dataset
+    """
+    if not _PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required to query the output dataset")
+
+    files = partition_files(dataset_root)
+    if not files:
+        return pd.DataFrame(columns=(columns or []) + [REGION_FIELD, MONTH_FIELD])
+
+    schema = _dataset_schema(files)
+    flags = list(flags or [])
+    unknown = [column for column in flags + list(columns or []) + (['PriorityCode'] if priority_codes else [])
+               if column not in schema.names]
+    if unknown:
+        raise ValueError(f"Columns not in the output dataset: {unknown}")
+
+    conditions = []
+    if regions is not None:
+        conditions.append(ds.field(REGION_FIELD).isin(list(regions)))
+    if months is not None:
+        conditions.append(ds.field(MONTH_FIELD).isin([normalize_month(month) for month in months]))
+    if since is not None:
+        conditions.append(ds.field(MONTH_FIELD) >= normalize_month(since))
+    if until is not None:
+        conditions.append(ds.field(MONTH_FIELD) <= normalize_month(until))
+    if priority_codes is not None:
+        conditions.append(ds.field('PriorityCode').isin(list(priority_codes)))
+    for flag in flags:
+        conditions.append(ds.field(flag) == True)  # noqa: E712 - builds a dataset expression
+
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+
+    dataset = ds.dataset(str(dataset_root), format='parquet', schema=schema,
+                         partitioning=ds.partitioning(_partition_schema(), flavor='hive'))
+    read_columns = None
+    if columns is not None:
+        read_columns = [column for column in columns if column not in (REGION_FIELD, MONTH_FIELD)]
+        read_columns += [REGION_FIELD, MONTH_FIELD]
+    return dataset.to_table(columns=read_columns, filter=expression).to_pandas()
+
+
+def flagged_properties(flag: str, min_months: int = 1, regions: Optional[Iterable[str]] = None,
+                       since: Optional[str] = None, until: Optional[str] = None,
+                       dataset_root: Path = DATASET_ROOT) -> pd.DataFrame:
+    """
+    Properties carrying a distress flag in at least min_months published months.
+
+    Properties are matched across months by APN, or by normalized address when the
+    APN is blank (parcel_keys.property_keys).
+
+    Returns:
+        DataFrame with region, PropertyKey, Address, months (number of months flagged),
+        first_month and last_month, most months first
+    """
+    available = dataset_columns(dataset_root)
+    rows = query_dataset(regions=regions, since=since, until=until, flags=[flag],
+                         columns=[column for column in ('APN', 'Address') if column in available],
+                         dataset_root=dataset_root)
+    result_columns = [REGION_FIELD, 'PropertyKey', 'Address', 'months', 'first_month', 'last_month']
+    if rows.empty:
+        return pd.DataFrame(columns=result_columns)
+
+    rows['PropertyKey'] = property_keys(rows)
+    if 'Address' not in rows.columns:
+        rows['Address'] = ''
+    rows = rows[rows['PropertyKey'] != '']
+    summary = rows.sort_values(MONTH_FIELD).groupby([REGION_FIELD, 'PropertyKey'], as_index=False).agg(
+        Address=('Address', 'last'), months=(MONTH_FIELD, 'nunique'),
+        first_month=(MONTH_FIELD, 'min'), last_month=(MONTH_FIELD, 'max'))
+    summary = summary[summary['months'] >= min_months]
+    return summary.sort_values(['months', REGION_FIELD, 'PropertyKey'], ascending=[False, True, True],
+                               ignore_index=True)[result_columns]
@@ -0,0 +1,173 @@
+"""
+Owner Primary Location Selection
+
+Marks one property per owner as the primary location, replacing the legacy
+GetFinalizedNicheList WHILE loop that maintained Location.IsPrimaryLocation row by
+row. Owners are identified by normalized mailing address plus owner name; within an
+owner's properties the primary location is the one with the best (lowest)
+PriorityId, then the most distress flags, then the first record.
+
+Adds two columns:
+- IsPrimaryLocation: True for exactly one record per owner
+- OwnerPropertyCount: number of records sharing the owner key
+
+Mailing by primary location sends one piece per owner instead of one per property.
+Chunked runs add the columns to the Parquet output in two streamed passes (see
+assign_primary_locations_columnar): owner keys and ranks are built batch by batch
+from the key columns, then the output is rewritten with the two columns appended.
+"""
+
+import logging
+import os
+import pandas as pd
+from pathlib import Path
+from typing import List, Tuple
+
+from address_normalizer import normalize_addresses
+from columnar_io import DEFAULT_COMPRESSION
+from enhanced_property_processor import DISTRESS_FLAG_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# Used when PriorityId is missing, ranks below every real priority
+UNRANKED_PRIORITY_ID = 999
+
+# Input columns owner_keys reads
+OWNER_KEY_INPUT_COLUMNS = ['Mailing Address', 'Owner 1 Last Name', 'Owner 1 First Name']
+
+
+def _normalized_text(df: pd.DataFrame, column: str) -> pd.Series:
+    """Upper-case a text column, turn commas into spaces and collapse whitespace ('' if missing)"""
+    if column not in df.columns:
+        return pd.Series('', index=df.index)
+    text = df[column].astype(str).where(df[column].notna(), '').str.upper()
+    return text.str.replace(',', ' ', regex=False).str.replace(r'\s+', ' ', regex=True).str.strip()
+
+
+def owner_keys(df: pd.DataFrame) -> pd.Series:
+    """
+    Owner key per record: normalized mailing address plus owner name.
+
+    Records with neither a mailing address nor an owner name get a blank key.
+    """
+    if 'Mailing Address' in df.columns:
+        mailing = normalize_addresses(df['Mailing Address'])
+    else:
+        mailing = pd.Series('', index=df.index)
+    name = (_normalized_text(df, 'Owner 1 Last Name') + ' ' + _normalized_text(df, 'Owner 1 First Name')).str.strip()
+    keys = mailing + '|' + name
+    return keys.where((mailing != '') | (name != ''), '')
+
+
+def owner_ranks(df: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
+    """
+    Owner key and primary location rank per record (lower rank wins).
+
+    The rank is PriorityId first, with more distress flags breaking ties.
+    """
+    keys = owner_keys(df)
+    flag_columns = [column for column in DISTRESS_FLAG_COLUMNS if column in df.columns]
+    flag_count = df[flag_columns].fillna(False).astype(bool).sum(axis=1) if flag_columns else 0
+
+    # Single sortable rank: PriorityId first, more distress flags breaks ties
+    priority_id = pd.to_numeric(df['PriorityId'], errors='coerce').fillna(UNRANKED_PRIORITY_ID) \
+        if 'PriorityId' in df.columns else pd.Series(UNRANKED_PRIORITY_ID, index=df.index)
+    return keys, priority_id * (len(flag_columns) + 1) - flag_count
+
+
+def primary_locations(keys: pd.Series, rank: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """
+    IsPrimaryLocation and OwnerPropertyCount from owner keys and ranks.
+
+    Records without an owner key are treated as single-property owners.
+    """
+    keyed = keys != ''
+    grouped = rank[keyed].groupby(keys[keyed], sort=False)
+
+    # idxmin returns the first record among equal ranks
+    is_primary = pd.Series(~keyed.to_numpy(), index=keys.index)
+    is_primary[grouped.idxmin().values] = True
+    property_count = grouped.transform('size').reindex(keys.index).fillna(1).astype('int64')
+
+    multi = (property_count > 1) & is_primary
+    logger.info(f"Primary locations: {int(is_primary.sum()):,} owners, "
+                f"{int(multi.sum()):,} with more than one property")
+    return is_primary, property_count
+
+
+def assign_primary_locations(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add IsPrimaryLocation and OwnerPropertyCount to an enhanced region DataFrame.
+
+    Records without an owner key are treated as single-property owners.
+
+    Args:
+        df: Enhanced DataFrame with PriorityId and distress flag columns
+
+    Returns:
+        The same DataFrame with the two columns set
+    """
+    df['IsPrimaryLocation'], df['OwnerPropertyCount'] = primary_locations(*owner_ranks(df))
+    return df
+
+
+def assign_primary_locations_columnar(path: Path, batch_rows: int) -> int:
+    """
+    Add IsPrimaryLocation and OwnerPropertyCount to a Parquet output in bounded memory.
+
+    A first pass reads only the owner key and rank columns, batch by batch; the second
+    streams the file into a replacement with the two columns appended, so the output
+    has the same columns as an in-memory run.
+
+    Args:
+        path: Parquet file of an enhanced region (rewritten in place)
+        batch_rows: Rows read per batch
+
+    Returns:
+        Number of primary locations (owners)
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = Path(path)
+    parquet_file = pq.ParquetFile(path)
+    names = parquet_file.schema_arrow.names
+    rank_columns = [column for column in OWNER_KEY_INPUT_COLUMNS + ['PriorityId'] + DISTRESS_FLAG_COLUMNS
+                    if column in names]
+
+    # 1. Owner keys and ranks, with row positions as the index
+    keys: List[pd.Series] = []
+    ranks: List[pd.Series] = []
+    offset = 0
+    for batch in parquet_file.iter_batches(batch_size=batch_rows, columns=rank_columns):
+        chunk = batch.to_pandas()
+        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+        chunk_keys, chunk_rank = owner_ranks(chunk)
+        keys.append(chunk_keys)
+        ranks.append(chunk_rank)
+        offset += len(chunk)
+    is_primary, property_count = primary_locations(pd.concat(keys) if keys else pd.Series(dtype=object),
+                                                   pd.concat(ranks) if ranks else pd.Series(dtype=float))
+    del keys, ranks
+
+    # 2. Rewrite the file with the two columns appended
+    source_schema = parquet_file.schema_arrow
+    output_names = [name for name in names if name not in ('IsPrimaryLocation', 'OwnerPropertyCount')]
+    schema = pa.schema([source_schema.field(name) for name in output_names]
+                       + [pa.field('IsPrimaryLocation', pa.bool_()), pa.field('OwnerPropertyCount', pa.int64())])
+    temp_path = path.with_name(f".{path.name}.writing")
+    offset = 0
+    try:
+        with pq.ParquetWriter(temp_path, schema, compression=DEFAULT_COMPRESSION) as writer:
+            for batch in parquet_file.iter_batches(batch_size=batch_rows, columns=output_names):
+                rows = slice(offset, offset + batch.num_rows)
+                columns = batch.columns + [pa.array(is_primary.to_numpy()[rows], pa.bool_()),
+                                           pa.array(property_count.to_numpy()[rows], pa.int64())]
+                writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+                offset += batch.num_rows
+    except Exception:
+        temp_path.unlink(missing_ok=True)
+        raise
+    parquet_file.close()
+    os.replace(temp_path, path)
+    return int(is_primary.sum())
@@ -0,0 +1,76 @@
+"""
+Parcel Deduplication
+
+Removes duplicate parcels from the main region data before classification and
+scoring, using the rule of the legacy ProcessUploadLog procedure:
+
+    ROW_NUMBER() OVER (PARTITION BY LocationPrimaryId
+                       ORDER BY CASE WHEN LocationAddress1 = '' THEN 1 ELSE 0 END,
+                                LocationSellDate ASC)
+
+i.e. per parcel keep the row with a property address, then the earliest sale date.
+As in SQL Server, a missing sale date sorts before any date. The parcel key is the
+same APN-or-address key delta scoring uses to identify properties.
+
+Deduplicating first means scoring, niche matching and the output scale with unique
+parcels instead of raw export rows, and a duplicated parcel no longer multiplies
+its niche matches.
+"""
+
+import logging
+import pandas as pd
+from typing import Tuple
+
+from parcel_keys import property_keys
+
+logger = logging.getLogger(__name__)
+
+# Input columns that decide which duplicate is kept
+PARCEL_KEY_INPUT_COLUMNS = ['APN', 'Address', 'Last Sale Date']
+
+# Columns added to the dropped rows in the audit output
+PARCEL_KEY_COLUMN = 'DedupParcelKey'
+KEPT_ROW_COLUMN = 'DedupKeptRow'
+
+
+def dedupe_parcels(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Keep one row per parcel key.
+
+    Rows without a parcel key (no APN and no address) are always kept. Kept rows
+    retain their original order and index.
+
+    Args:
+        df: Raw main region DataFrame
+
+    Returns:
+        tuple: (deduplicated DataFrame, audit DataFrame of the dropped rows with their
+        parcel key and the index of the row kept in their place)
+    """
+    keys = property_keys(df)
+    if 'Address' in df.columns:
+        blank_address = df['Address'].isna() | df['Address'].astype(str).str.strip().eq('')
+    else:
+        blank_address = pd.Series(True, index=df.index)
+    if 'Last Sale Date' in df.columns:
+        sale_dates = pd.to_datetime(df['Last Sale Date'], errors='coerce', format='mixed')
+    else:
+        sale_dates = pd.Series(pd.NaT, index=df.index)
+
+    order = pd.DataFrame({'key': keys, 'blank_address': blank_address.astype(int), 'sale_date': sale_dates})
+    order = order[order['key'] != '']
+    order = order.sort_values(['key', 'blank_address', 'sale_date'], na_position='first', kind='stable')
+
+    duplicate = order['key'].duplicated(keep='first')
+    dropped_index = order.index[duplicate]
+    kept_row = pd.Series(order.index[~duplicate], index=order.loc[~duplicate, 'key'])
+
+    audit = df.loc[dropped_index].copy()
+    audit[PARCEL_KEY_COLUMN] = keys.loc[dropped_index]
+    audit[KEPT_ROW_COLUMN] = audit[PARCEL_KEY_COLUMN].map(kept_row)
+    if audit.empty:
+        return df, audit
+
+    logger.info(f"Parcel dedup: dropped {len(dropped_index):,} duplicate rows across "
+                f"{audit[PARCEL_KEY_COLUMN].nunique():,} parcels")
+    return df.drop(index=dropped_index), audit.sort_values([KEPT_ROW_COLUMN, PARCEL_KEY_COLUMN], kind='stable')
@@ -0,0 +1,167 @@
+"""
+Parcel Keys
+
+Parcel identifiers arrive under different names and in different formats:
+- APN in main region exports and niche lists ('313-0419')
+- Property APN in the skip trace vendor file
+- TAXID in county GIS parcel exports ('3130419')
+- Parcel ID in standardized government niche files ('3130419A')
+
+parcel_keys() reduces all of them to one canonical text form: upper case, float
+artifacts from spreadsheets removed ('3130419.0'), separators (dashes, dots, spaces,
+slashes) removed and leading zeros stripped, so '313-0419', '313.0419' and '03130419'
+are the same parcel. Letter suffixes mark split parcels and are kept unless the
+region sets parcel_strip_suffix in its config.json, which folds '3130419A' into
+'3130419'; base_parcel_keys() gives the suffix-free form for fallback matching.
+
+ParcelIndex maps canonical keys to dense integer ids, so joins between a large main
+frame and niche, skip trace or GIS parcels compare integers: the (small) side being
+matched against registers its keys, the other side is looked up with one vectorized
+index lookup and unknown parcels get MISSING_PARCEL_ID.
+
+property_keys() is the row identity shared by parcel dedup, delta scoring, the output
+dataset and property history: 'APN:<apn>' when a row has an APN, otherwise
+'ADDR:<normalized address>'. canonical_column() renders cell values the same way
+whether they come from an input file or a re-read output.
+"""
+
+import re
+import numbers
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from typing import Optional
+
+from address_normalizer import normalize_addresses
+
+# Parcel identifier column of each source, in lookup order
+PARCEL_ID_COLUMNS = ['APN', 'Property APN', 'TAXID', 'Parcel ID']
+
+# Id of a missing or unknown parcel key
+MISSING_PARCEL_ID = -1
+
+_FLOAT_ARTIFACT_PATTERN = re.compile(r'\.0+$')
+_SEPARATOR_PATTERN = re.compile(r'[^0-9A-Z]')
+_LEADING_ZERO_PATTERN = re.compile(r'^0+(?=.)')
+_SUFFIX_PATTERN = re.compile(r'(?<=[0-9])[A-Z]+$')
+
+
+def parcel_id_column(df: pd.DataFrame) -> Optional[str]:
+    """Name of the parcel identifier column of a frame (None when it has none)"""
+    return next((column for column in PARCEL_ID_COLUMNS if column in df.columns), None)
+
+
+def parcel_keys(ids: pd.Series, strip_suffix: bool = False) -> pd.Series:
+    """
+    Canonical parcel keys of a Series of parcel identifiers ('' when missing).
+
+    Args:
+        ids: Parcel identifiers as read (text or numbers)
+        strip_suffix: Drop trailing letters after the digits ('3130419A' -> '3130419')
+    """
+    codes, uniques = pd.factorize(ids, use_na_sentinel=True)
+    if len(uniques) == 0:
+        return pd.Series('', index=ids.index, dtype=object)
+
+    # Each distinct identifier is normalized once
+    text = pd.Series(uniques, dtype=object).astype(str).str.upper().str.strip()
+    text = text.str.replace(_FLOAT_ARTIFACT_PATTERN, '', regex=True)
+    text = text.str.replace(_SEPARATOR_PATTERN, '', regex=True)
+    if strip_suffix:
+        text = text.str.replace(_SUFFIX_PATTERN, '', regex=True)
+    text = text.str.replace(_LEADING_ZERO_PATTERN, '', regex=True)
+    text = text.where(~text.isin(['NAN', 'NONE', '0']), '')
+
+    # Code -1 (missing) picks the trailing ''
+    lookup = np.append(text.to_numpy(dtype=object), '')
+    return pd.Series(lookup[codes], index=ids.index, dtype=object)
+
+
+def base_parcel_keys(keys: pd.Series) -> pd.Series:
+    """Canonical keys with any letter suffix removed (for matching split parcels to their base parcel)"""
+    return keys.str.replace(_SUFFIX_PATTERN, '', regex=True)
+
+
+class ParcelIndex:
+    """Dense integer ids of the canonical parcel keys seen in one region run"""
+
+    def __init__(self, strip_suffix: bool = False):
+        self.strip_suffix = strip_suffix
+        self.keys = pd.Index([], dtype=object)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def key_ids(self, keys: pd.Series, register: bool = False) -> np.ndarray:
+        """Ids of canonical keys (see ids); with register, unseen keys get new ids"""
+        if register:
+            new_keys = pd.unique(keys[(keys != '') & ~keys.isin(self.keys)])
+            if len(new_keys):
+                self.keys = self.keys.append(pd.Index(new_keys, dtype=object))
+        key_ids = self.keys.get_indexer(keys)
+        key_ids[(keys == '').to_numpy()] = MISSING_PARCEL_ID
+        return key_ids.astype(np.int64)
+
+    def ids(self, parcel_ids: pd.Series, register: bool = False) -> np.ndarray:
+        """
+        Integer ids of raw parcel identifiers.
+
+        Args:
+            parcel_ids: Parcel identifiers as read
+            register: Give unseen parcels new ids (otherwise they get MISSING_PARCEL_ID)
+
+        Returns:
+            int64 array aligned with parcel_ids
+        """
+        return self.key_ids(parcel_keys(parcel_ids, self.strip_suffix), register)
+
+    def frame_ids(self, df: pd.DataFrame, register: bool = False) -> np.ndarray:
+        """Ids from a frame's parcel identifier column (all missing when it has none)"""
+        column = parcel_id_column(df)
+        if column is None:
+            return np.full(len(df), MISSING_PARCEL_ID, dtype=np.int64)
+        return self.ids(df[column], register)
+
+
+def _canonical_value(value) -> str:
+    """Render a cell value the same way whether it came from the main file or a re-read output"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ''
+    if isinstance(value, bool):
+        return str(value)
+    if isinstance(value, numbers.Number):
+        return repr(float(value))
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return pd.Timestamp(value).isoformat()
+    return str(value).strip()
+
+
+def canonical_column(series: pd.Series) -> pd.Series:
+    """Vectorized _canonical_value for the common column dtypes"""
+    if pd.api.types.is_bool_dtype(series):
+        return series.astype(str)
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype('float64').map(repr).where(series.notna(), '')
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.map(lambda value: value.isoformat() if pd.notna(value) else '')
+    return series.map(_canonical_value)
+
+
+def property_keys(df: pd.DataFrame) -> pd.Series:
+    """
+    Build the property key for each row: 'APN:<apn>' when an APN is present,
+    otherwise 'ADDR:<normalized address>'. Rows with neither get a blank key.
+    """
+    if 'Address' in df.columns:
+        addresses = normalize_addresses(df['Address'])
+    else:
+        addresses = pd.Series('', index=df.index)
+    keys = ('ADDR:' + addresses).where(addresses != '', '')
+
+    if 'APN' in df.columns:
+        apns = df['APN'].map(_canonical_value)
+        # Integer-valued APNs read as floats ("1234.0") should match their text form
+        apns = apns.str.replace(r'\.0$', '', regex=True)
+        keys = ('APN:' + apns).where(apns != '', keys)
+
+    return keys
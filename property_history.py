@@ -0,0 +1,202 @@
+"""
+Property Change History
+
+Each monthly enhanced output is a standalone snapshot. This module keeps a per-region
+history of property state across months as versions with valid-from/valid-to months
+(a type 2 slowly changing dimension), so questions like "when did this property first
+get a lien flag", "when did the owner change" or "when did it leave the foreclosure
+list" can be answered.
+
+Properties are keyed like delta scoring: APN when present, otherwise the normalized
+property address (parcel_keys.property_keys). Tracked attributes are the owner,
+mailing address, last sale date, priority and distress flags, stored as text.
+
+Each run hash-joins the new snapshot against the current versions: properties whose
+attribute hash is unchanged are left alone; changed properties get their current
+version closed and a new one opened; new properties get a first version; properties
+missing from the snapshot have their version closed. A run adds only the versions it
+closed; the open versions replace the previous current file, so the history grows with
+churn rather than with region size times months.
+
+current.parquet is rewritten in full on every run, deliberately. Each monthly output is
+a full snapshot of the region, so finding removed properties already means reading
+every open version; one file of one row per property costs about the same to write as
+to read, and writing it whole keeps the undo of a re-run month a plain replace.
+Partitioning it would only save the write while adding a file per partition to every read.
+
+Store layout (output/<region_key>/property_history/):
+- current.parquet: the open version of every property (ValidTo blank)
+- closed_<YYYY_MM>.parquet: versions closed by that month's run
+- history.json: last month applied and change counts per month
+
+Re-running a month first undoes that month's previous update, so the same month can
+be applied again (e.g. after skip trace adds its flags).
+"""
+
+import json
+import logging
+import pandas as pd
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from columnar_io import COLUMNAR_SUFFIX, columnar_columns, read_columnar, write_columnar
+from parcel_keys import canonical_column, property_keys
+from enhanced_property_processor import DISTRESS_FLAG_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+HISTORY_DIRNAME = "property_history"
+CURRENT_FILENAME = f"current{COLUMNAR_SUFFIX}"
+STATE_FILENAME = "history.json"
+
+KEY_COLUMN = 'PropertyKey'
+VALID_FROM_COLUMN = 'ValidFrom'
+VALID_TO_COLUMN = 'ValidTo'
+HASH_COLUMN = 'VersionHash'
+
+# Attributes whose changes open a new version
+TRACKED_COLUMNS = [
+    'Owner 1 Last Name', 'Owner 1 First Name', 'Mailing Address', 'Mailing City', 'Mailing State', 'Mailing Zip',
+    'Last Sale Date', 'PriorityCode'
+] + DISTRESS_FLAG_COLUMNS
+
+# Output columns read to update the history
+HISTORY_INPUT_COLUMNS = ['APN', 'Address'] + TRACKED_COLUMNS
+
+VERSION_COLUMNS = [KEY_COLUMN, VALID_FROM_COLUMN, VALID_TO_COLUMN, HASH_COLUMN] + TRACKED_COLUMNS
+
+
+def _text_values(series: pd.Series) -> pd.Series:
+    """Column values as stored in the history: canonical text without float/midnight noise"""
+    text = canonical_column(series).astype(str)
+    return text.str.replace(r'\.0$', '', regex=True).str.replace(r'T00:00:00$', '', regex=True)
+
+
+def snapshot_versions(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per property of an enhanced output: key, tracked attributes as text and
+    their hash. Rows without a key are dropped; of rows sharing a key the first is kept.
+    """
+    snapshot = pd.DataFrame({KEY_COLUMN: property_keys(df)}, index=df.index)
+    for column in TRACKED_COLUMNS:
+        snapshot[column] = _text_values(df[column]) if column in df.columns else ''
+    snapshot = snapshot[snapshot[KEY_COLUMN] != ''].drop_duplicates(subset=[KEY_COLUMN]).reset_index(drop=True)
+    snapshot[HASH_COLUMN] = pd.util.hash_pandas_object(snapshot[TRACKED_COLUMNS], index=False).to_numpy()
+    return snapshot
+
+
+class PropertyHistoryStore:
+    """Versioned property state of one region"""
+
+    def __init__(self, region_key: str, output_root: Path = Path("output")):
+        self.region_key = region_key
+        self.directory = Path(output_root) / region_key / HISTORY_DIRNAME
+
+    def _closed_path(self, month: str) -> Path:
+        return self.directory / f"closed_{month}{COLUMNAR_SUFFIX}"
+
+    def _load_state(self) -> Dict:
+        state_path = self.directory / STATE_FILENAME
+        if not state_path.exists():
+            return {'last_month': None, 'months': {}}
+        with open(state_path, 'r') as f:
+            return json.load(f)
+
+    def current_versions(self) -> pd.DataFrame:
+        """Open version of every property (empty before the first update)"""
+        current_path = self.directory / CURRENT_FILENAME
+        if not current_path.exists():
+            return pd.DataFrame(columns=VERSION_COLUMNS)
+        return read_columnar(current_path)
+
+    def update(self, df: pd.DataFrame, month: str) -> Dict[str, int]:
+        """
+        Apply one month's enhanced output.
+
+        Args:
+            df: Enhanced output (at least the HISTORY_INPUT_COLUMNS it has)
+            month: Month of the snapshot, 'YYYY_MM'
+
+        Returns:
+            Dict with new/changed/removed/unchanged property counts
+
+        Raises:
+            ValueError: month is earlier than the last month applied
+        """
+        state = self._load_state()
+        current = self.current_versions()
+
+        if state['last_month'] is not None and month < state['last_month']:
+            raise ValueError(f"Property history of {self.region_key} is at {state['last_month']}; "
+                             f"can't apply the older month {month}")
+        if month == state['last_month']:
+            current = self._undo_month(current, month)
+
+        snapshot = snapshot_versions(df)
+
+        # Hash join of the snapshot against the current versions
+        joined = snapshot[[KEY_COLUMN, HASH_COLUMN]].merge(
+            current[[KEY_COLUMN, HASH_COLUMN]], on=KEY_COLUMN, how='outer', suffixes=('', '_current'), indicator=True
+        )
+        matched = joined['_merge'] == 'both'
+        same_hash = joined[HASH_COLUMN] == joined[f'{HASH_COLUMN}_current']
+        unchanged_keys = joined.loc[matched & same_hash, KEY_COLUMN]
+        changed_keys = joined.loc[matched & ~same_hash, KEY_COLUMN]
+        new_keys = joined.loc[joined['_merge'] == 'left_only', KEY_COLUMN]
+        removed_keys = joined.loc[joined['_merge'] == 'right_only', KEY_COLUMN]
+
+        closed = current[current[KEY_COLUMN].isin(changed_keys) | current[KEY_COLUMN].isin(removed_keys)].copy()
+        closed[VALID_TO_COLUMN] = month
+        opened = snapshot[snapshot[KEY_COLUMN].isin(changed_keys) | snapshot[KEY_COLUMN].isin(new_keys)].copy()
+        opened[VALID_FROM_COLUMN] = month
+        opened[VALID_TO_COLUMN] = ''
+
+        current = pd.concat([current[current[KEY_COLUMN].isin(unchanged_keys)], opened[VERSION_COLUMNS]],
+                            ignore_index=True).astype({HASH_COLUMN: 'uint64'})
+        counts = {'new': len(new_keys), 'changed': len(changed_keys), 'removed': len(removed_keys),
+                  'unchanged': len(unchanged_keys)}
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if not closed.empty:
+            write_columnar(closed[VERSION_COLUMNS].reset_index(drop=True), self._closed_path(month))
+        write_columnar(current[VERSION_COLUMNS], self.directory / CURRENT_FILENAME)
+        state['last_month'] = month
+        state['months'][month] = {**counts, 'updated_at': datetime.now().isoformat(timespec='seconds')}
+        with open(self.directory / STATE_FILENAME, 'w') as f:
+            json.dump(state, f, indent=2)
+
+        logger.info(f"Property history {self.region_key} {month}: {counts['new']:,} new, {counts['changed']:,} changed, "
+                    f"{counts['removed']:,} removed, {counts['unchanged']:,} unchanged")
+        return counts
+
+    def _undo_month(self, current: pd.DataFrame, month: str) -> pd.DataFrame:
+        """Current versions as they were before the given (latest) month was applied"""
+        closed_path = self._closed_path(month)
+        reopened = read_columnar(closed_path) if closed_path.exists() else pd.DataFrame(columns=VERSION_COLUMNS)
+        reopened[VALID_TO_COLUMN] = ''
+        closed_path.unlink(missing_ok=True)
+        logger.info(f"Property history {self.region_key}: replacing the update of {month}")
+        return pd.concat([current[current[VALID_FROM_COLUMN] != month], reopened], ignore_index=True)
+
+    def history(self, keys: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        All versions (closed and current), oldest first per property.
+
+        Args:
+            keys: Property keys to include ('APN:<apn>' or 'ADDR:<address>'; all when None)
+        """
+        frames = [read_columnar(path) for path in sorted(self.directory.glob(f"closed_*{COLUMNAR_SUFFIX}"))]
+        frames.append(self.current_versions())
+        versions = pd.concat(frames, ignore_index=True)
+        if keys is not None:
+            versions = versions[versions[KEY_COLUMN].isin(keys)]
+        return versions.sort_values([KEY_COLUMN, VALID_FROM_COLUMN], kind='stable', ignore_index=True)
+
+
+def update_history_from_output(region_key: str, output_file: Path, month: str,
+                               output_root: Path = Path("output")) -> Dict[str, int]:
+    """Update a region's property history from a Parquet enhanced output (reads only the tracked columns)"""
+    available = columnar_columns(output_file)
+    df = read_columnar(output_file, columns=[column for column in HISTORY_INPUT_COLUMNS if column in available])
+    return PropertyHistoryStore(region_key, output_root).update(df, month)
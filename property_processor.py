@@ -14,6 +14,9 @@ from pathlib import Path
 import re
 import logging
 
+from input_adapters import read_input
+from ingest_schema import MAIN_EXPORT_SCHEMA
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -721,10 +724,10 @@ class PropertyProcessor:
         
     def process_excel_file(self, file_path: str) -> pd.DataFrame:
         """
-        Process a single Excel file and return enhanced data with classifications and priorities.
+        Process a single input file and return enhanced data with classifications and priorities.
         
         Args:
-            file_path: Path to Excel file
+            file_path: Path to Excel, CSV, Parquet or Feather file
             
         Returns:
             DataFrame with additional columns for classification and priority
@@ -736,20 +739,9 @@ class PropertyProcessor:
             if not Path(file_path).exists():
                 raise FileNotFoundError(f"File not found: {file_path}")
             
-            # Read Excel file with error handling and memory optimization
+            # Read the file straight into the declared dtypes of the main export
             try:
-                # Use dtype optimization to reduce memory usage
-                df = pd.read_excel(file_path, dtype={'FIPS': 'category'})
-                
-                # Convert only specific columns to category to avoid assignment issues
-                # Skip columns we might modify later
-                protected_columns = {'Owner 1 Last Name', 'Owner 1 First Name', 'Address', 'Mailing Address'}
-                string_columns = df.select_dtypes(include=['object']).columns
-                for col in string_columns:
-                    if (col not in protected_columns and 
-                        df[col].nunique() / len(df) < 0.5):  # Less than 50% unique values
-                        df[col] = df[col].astype('category')
-                        
+                df = read_input(file_path, schema=MAIN_EXPORT_SCHEMA)
             except Exception as e:
                 raise ValueError(f"Failed to read Excel file {file_path}: {e}")
             
@@ -0,0 +1,200 @@
+"""
+Region Input Catalog
+
+This module keeps a per-region catalog of the input files (Excel, CSV, Parquet or
+Feather) in regions/<region_key>/. For each file it records the file fingerprint,
+detected niche type, column header, row count and FIPS value distribution. Entries are refreshed only for
+files whose fingerprint changed, so validation and file discovery read the
+catalog instead of reopening every file on every run.
+
+Catalog location: output/<region_key>/input_catalog.json
+"""
+
+import json
+import logging
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from input_fingerprint import fingerprint_file
+from input_adapters import discover_input_files, scan_input_column
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILENAME = "input_catalog.json"
+EMPTY_FILE_ERROR = "empty file"
+
+
+def detect_niche_type_from_filename(filename: str) -> str:
+    """Detect niche type from filename"""
+    filename_lower = filename.lower()
+
+    if 'lien' in filename_lower:
+        return 'Liens'
+    elif 'foreclosure' in filename_lower or 'preforeclosure' in filename_lower:
+        return 'PreForeclosure'
+    elif 'bankrupt' in filename_lower:
+        return 'Bankruptcy'
+    elif 'landlord' in filename_lower or 'tired' in filename_lower:
+        return 'Landlord'
+    elif ('tax' in filename_lower and 'delinq' in filename_lower) or ('delinq' in filename_lower):
+        # Distinguish between current city tax delinquencies and historical vendor data
+        if 'current' in filename_lower or filename_lower.startswith(('roanoke_', 'lynchburg_', 'norfolk_')):
+            return 'CurrentTax'  # Higher priority - direct from locality
+        else:
+            return 'TaxHistory'  # Lower priority - historical vendor data
+    elif 'probate' in filename_lower:
+        return 'Probate'
+    elif 'interfamily' in filename_lower or 'family' in filename_lower:
+        return 'InterFamily'
+    elif 'cash' in filename_lower and 'buyer' in filename_lower:
+        return 'CashBuyer'
+    elif 'vacant' in filename_lower:
+        return 'Vacant'
+    elif 'code' in filename_lower and 'enforcement' in filename_lower:
+        return 'CodeEnforcement'
+    elif 'inherited' in filename_lower or 'inherit' in filename_lower:
+        return 'Inherited'
+    else:
+        return 'Other'
+
+
+def normalize_fips_value(value) -> str:
+    """
+    Normalize a FIPS cell value to the string form used in region configs.
+
+    Integer-valued floats (51770.0) become plain integer strings; text is stripped,
+    including a trailing '.0' left by CSV exports of float columns.
+    """
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    text = str(value).strip()
+    if text.endswith('.0') and text[:-2].isdigit():
+        return text[:-2]
+    return text
+
+
+def catalog_input_file(file_path: Path) -> Dict:
+    """
+    Read the metadata of one input file.
+
+    Only the FIPS column is materialized (workbooks are streamed in read-only mode),
+    so every row's FIPS value is counted without loading the file.
+
+    Returns:
+        Dict with columns, row_count, fips_counts (None without a FIPS column),
+        fips_blank_count and read_error
+    """
+    entry = {
+        'niche_type': detect_niche_type_from_filename(file_path.name),
+        'columns': [],
+        'row_count': 0,
+        'fips_counts': None,
+        'fips_blank_count': 0,
+        'read_error': None
+    }
+
+    if file_path.stat().st_size == 0:
+        entry['read_error'] = EMPTY_FILE_ERROR
+        return entry
+
+    try:
+        scan = scan_input_column(file_path, 'FIPS', normalize=normalize_fips_value)
+        entry['columns'] = scan.columns
+        entry['row_count'] = scan.row_count
+        if scan.value_counts is not None:
+            entry['fips_counts'] = dict(scan.value_counts.most_common())
+            entry['fips_blank_count'] = scan.blank_count
+    except Exception as e:
+        entry['read_error'] = str(e)
+
+    return entry
+
+
+class RegionInputCatalog:
+    """Cached per-file metadata for a region's input files"""
+
+    def __init__(self, region_key: str, region_dir: Path, output_root: Path = Path("output")):
+        self.region_key = region_key
+        self.region_dir = Path(region_dir)
+        self.path = Path(output_root) / region_key / CATALOG_FILENAME
+        self.entries: Dict[str, Dict] = {}
+
+    def load(self) -> Dict[str, Dict]:
+        """Load catalog entries from disk (empty if the catalog doesn't exist or can't be read)"""
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f).get('files', {})
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Ignoring unreadable input catalog {self.path}: {e}")
+            return {}
+
+    def save(self) -> None:
+        """Write the catalog to disk"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump({'region_key': self.region_key, 'files': self.entries}, f, indent=2)
+
+    def refresh(self) -> Dict[str, Dict]:
+        """
+        Bring the catalog up to date with the input files currently in the region directory.
+
+        Files whose fingerprint is unchanged keep their cached entry; new or changed
+        files are re-read and removed files are dropped.
+
+        Returns:
+            Dict mapping input file name to catalog entry
+        """
+        previous = self.load()
+        entries = {}
+        refreshed = []
+
+        for input_file in discover_input_files(self.region_dir):
+            cached = previous.get(input_file.name)
+            fingerprint = fingerprint_file(input_file, cached.get('fingerprint') if cached else None)
+
+            if cached and cached.get('fingerprint', {}).get('sha256') == fingerprint['sha256']:
+                # Content unchanged - keep metadata, update size/mtime in case the file was touched
+                entries[input_file.name] = {**cached, 'fingerprint': fingerprint}
+                continue
+
+            entry = catalog_input_file(input_file)
+            entry['fingerprint'] = fingerprint
+            entry['cataloged_at'] = datetime.now().isoformat(timespec='seconds')
+            entries[input_file.name] = entry
+            refreshed.append(input_file.name)
+
+        removed = sorted(set(previous) - set(entries))
+        self.entries = entries
+
+        if refreshed or removed or entries != previous:
+            self.save()
+        if refreshed or removed:
+            logger.info(f"Input catalog for {self.region_key}: refreshed {len(refreshed)} of {len(entries)} files"
+                        + (f", dropped {len(removed)} removed files" if removed else ""))
+
+        return entries
+
+    def input_files(self) -> List[Path]:
+        """Paths of all cataloged input files"""
+        return [self.region_dir / name for name in self.entries]
+
+    def main_file(self) -> Optional[Path]:
+        """The main region file: one named 'main_region', otherwise the file with the most rows"""
+        if not self.entries:
+            return None
+        for name in self.entries:
+            if 'main_region' in name.lower():
+                return self.region_dir / name
+        # By row count, then size - file size alone isn't comparable across formats
+        largest = max(self.entries, key=lambda name: (self.entries[name].get('row_count', 0),
+                                                      self.entries[name]['fingerprint']['size']))
+        return self.region_dir / largest
+
+    def fingerprints(self) -> Dict[str, Dict]:
+        """File fingerprints keyed by input file name"""
+        return {name: entry['fingerprint'] for name, entry in self.entries.items()}
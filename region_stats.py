@@ -0,0 +1,162 @@
+"""
+Region Statistics
+
+Computes the summary statistics of an enhanced region DataFrame in one columnar
+pass: record counts by base priority × PropertyCategory with the count of every
+distress flag in each cell, record source (main export vs. niche-only inserts and,
+after skip trace, the skip trace match type) and data-quality counts.
+
+Everything else in the summary - priority distribution, flag totals - is derived
+from the cross-tab instead of re-scanning the data, and the result is plain
+Python types so it can be written to the summary workbook and to JSON as-is.
+"""
+
+import json
+import logging
+import pandas as pd
+from pathlib import Path
+from typing import Dict, List
+
+from enhanced_property_processor import DISTRESS_FLAG_COLUMNS
+from property_processor import NICHE_ONLY_PRIORITY_ID
+
+logger = logging.getLogger(__name__)
+
+MAIN_REGION_SOURCE = 'Main Region'
+ANY_DISTRESS_COLUMN = 'AnyDistress'
+
+# Columns compute_region_stats reads (enough to compute statistics from a column subset)
+STATS_INPUT_COLUMNS = [
+    'PriorityCode', 'PropertyCategory', 'PriorityId', 'PriorityName', 'ST_MatchSource', 'Address',
+    'Mailing Address', 'APN', 'Last Sale Amount', 'Owner 1 Last Name', 'Owner 1 First Name', 'Last Sale Date'
+] + DISTRESS_FLAG_COLUMNS
+
+
+def _blank_mask(series: pd.Series) -> pd.Series:
+    """True where a value is missing or only whitespace"""
+    return series.isna() | series.astype(str).str.strip().eq('')
+
+
+def _column_or_blank(df: pd.DataFrame, column: str) -> pd.Series:
+    """A column as text with missing values as '', or all '' if the column does not exist"""
+    if column not in df.columns:
+        return pd.Series('', index=df.index)
+    return df[column].astype(str).where(df[column].notna(), '')
+
+
+def _cross_tab(df: pd.DataFrame, flag_columns: List[str]) -> pd.DataFrame:
+    """Records and per-flag counts for every (PriorityCode, PropertyCategory) pair"""
+    flags = df[flag_columns].fillna(False).astype(bool)
+    flags[ANY_DISTRESS_COLUMN] = flags.any(axis=1) if flag_columns else False
+    flags.insert(0, 'Records', 1)
+
+    keys = [_column_or_blank(df, 'PriorityCode').rename('PriorityCode'),
+            _column_or_blank(df, 'PropertyCategory').rename('PropertyCategory')]
+    table = flags.astype(int).groupby(keys, sort=True).sum().reset_index()
+    return table.sort_values(['Records', 'PriorityCode'], ascending=[False, True], kind='stable')
+
+
+def _match_sources(df: pd.DataFrame) -> Dict[str, Dict[str, int]]:
+    """Record counts per source: main export or the niche list that inserted it, and skip trace match type"""
+    sources = {}
+
+    if 'PriorityId' in df.columns:
+        niche_only = pd.to_numeric(df['PriorityId'], errors='coerce').eq(NICHE_ONLY_PRIORITY_ID)
+        record_source = _column_or_blank(df, 'PriorityName').where(niche_only, MAIN_REGION_SOURCE)
+        sources['record_source'] = {str(key): int(value) for key, value in record_source.value_counts().items()}
+
+    if 'ST_MatchSource' in df.columns:
+        match_source = _column_or_blank(df, 'ST_MatchSource').replace('', 'Unmatched')
+        sources['skip_trace'] = {str(key): int(value) for key, value in match_source.value_counts().items()}
+
+    return sources
+
+
+def _data_quality(df: pd.DataFrame) -> Dict[str, int]:
+    """Counts of records with missing or unusable key fields"""
+    quality = {}
+
+    for label, column in [('missing_address', 'Address'), ('missing_mailing_address', 'Mailing Address'),
+                          ('missing_apn', 'APN'), ('missing_last_sale_amount', 'Last Sale Amount')]:
+        if column in df.columns:
+            quality[label] = int(_blank_mask(df[column]).sum())
+
+    if 'Owner 1 Last Name' in df.columns:
+        owner_blank = _blank_mask(df['Owner 1 Last Name'])
+        if 'Owner 1 First Name' in df.columns:
+            owner_blank &= _blank_mask(df['Owner 1 First Name'])
+        quality['missing_owner_name'] = int(owner_blank.sum())
+
+    if 'Last Sale Date' in df.columns:
+        sale_blank = _blank_mask(df['Last Sale Date'])
+        parsed = pd.to_datetime(df['Last Sale Date'].where(~sale_blank), errors='coerce', format='mixed')
+        quality['missing_last_sale_date'] = int(sale_blank.sum())
+        quality['unparseable_last_sale_date'] = int((parsed.isna() & ~sale_blank).sum())
+
+    if 'Address' in df.columns:
+        address = df['Address'].astype(str).str.strip().str.upper()
+        address = address[~_blank_mask(df['Address'])]
+        quality['duplicate_address_records'] = int(address.duplicated().sum())
+
+    return quality
+
+
+def compute_region_stats(df: pd.DataFrame) -> Dict:
+    """
+    Compute the summary statistics of an enhanced region DataFrame.
+
+    Args:
+        df: Enhanced DataFrame (monthly output or skip-trace-updated file)
+
+    Returns:
+        Dict with total_records, priority_category_flags (cross-tab rows),
+        priority_totals, flag_totals, match_sources and data_quality
+    """
+    flag_columns = [column for column in DISTRESS_FLAG_COLUMNS if column in df.columns]
+    table = _cross_tab(df, flag_columns)
+
+    # Totals come from the cross-tab, not another pass over the records
+    priority_totals = table.groupby('PriorityCode', sort=False)['Records'].sum().sort_values(ascending=False, kind='stable')
+    flag_totals = table[flag_columns + [ANY_DISTRESS_COLUMN]].sum()
+
+    return {
+        'total_records': int(len(df)),
+        'priority_category_flags': [
+            {key: (int(value) if key not in ('PriorityCode', 'PropertyCategory') else value)
+             for key, value in row.items()}
+            for row in table.to_dict(orient='records')
+        ],
+        'priority_totals': {str(key): int(value) for key, value in priority_totals.items()},
+        'flag_totals': {str(key): int(value) for key, value in flag_totals.items()},
+        'match_sources': _match_sources(df),
+        'data_quality': _data_quality(df)
+    }
+
+
+def stats_sheets(stats: Dict) -> Dict[str, pd.DataFrame]:
+    """Summary workbook sheets for the statistics, keyed by sheet name"""
+    total = stats['total_records'] or 1
+
+    def with_percentage(counts: Dict[str, int], label: str) -> pd.DataFrame:
+        return pd.DataFrame([{label: key, 'Count': value, 'Percentage': round(value / total * 100, 1)}
+                             for key, value in counts.items()])
+
+    sources = [{'Source_Type': source_type, 'Source': source, 'Count': count}
+               for source_type, counts in stats['match_sources'].items() for source, count in counts.items()]
+
+    return {
+        'Priority_Category_Flags': pd.DataFrame(stats['priority_category_flags']),
+        'Flag_Totals': with_percentage(stats['flag_totals'], 'Flag'),
+        'Match_Sources': pd.DataFrame(sources, columns=['Source_Type', 'Source', 'Count']),
+        'Data_Quality': pd.DataFrame([{'Check': key, 'Count': value} for key, value in stats['data_quality'].items()],
+                                     columns=['Check', 'Count'])
+    }
+
+
+def write_stats_json(stats: Dict, path: Path, **metadata) -> Path:
+    """Write statistics (plus optional metadata such as region_key) to a JSON file"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump({**metadata, **stats}, f, indent=2)
+    return path
@@ -10,6 +10,7 @@ Usage:
 """
 
 import logging
+import numpy as np
 import pandas as pd
 import argparse
 from pathlib import Path
@@ -18,6 +19,15 @@ from typing import Dict, List, Optional, Tuple
 import re
 
 from multi_region_config import MultiRegionConfigManager
+from address_normalizer import normalize_addresses
+from parcel_keys import MISSING_PARCEL_ID, ParcelIndex
+from region_stats import compute_region_stats, write_stats_json
+from owner_locations import assign_primary_locations
+from columnar_io import COLUMNAR_SUFFIX, preferred_source, save_dataset
+from input_adapters import read_input
+from ingest_schema import SKIP_TRACE_SCHEMA
+from output_dataset import publish_output, run_month
+from property_history import update_history_from_output
 
 # Set up logging
 logging.basicConfig(
@@ -29,29 +39,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def _normalize_address(address_str) -> str:
-    """Normalize address for matching (reuse from monthly_processing_v2.py)"""
-    if pd.isna(address_str) or address_str == '':
-        return ''
-    
-    # Convert to string and normalize
-    addr = str(address_str).upper().strip()
-    
-    # Remove common variations
-    addr = addr.replace(' ST,', ' ST')
-    addr = addr.replace(' AVE,', ' AVE') 
-    addr = addr.replace(' RD,', ' RD')
-    addr = addr.replace(' DR,', ' DR')
-    addr = addr.replace(' BLVD,', ' BLVD')
-    
-    # Remove trailing commas and extra spaces
-    addr = addr.replace(',', ' ').strip()
-    
-    # Collapse multiple spaces
-    addr = re.sub(r'\s+', ' ', addr)
-    
-    return addr
-
 def _normalize_city(city_str) -> str:
     """Normalize city name for matching"""
     if pd.isna(city_str) or city_str == '':
@@ -66,55 +53,110 @@ def _normalize_city(city_str) -> str:
     
     return city
 
-def _create_address_city_key(address: str, city: str) -> str:
-    """Create compound key for address + city matching"""
-    norm_addr = _normalize_address(address)
-    norm_city = _normalize_city(city)
-    
-    if norm_addr and norm_city:
-        return f"{norm_addr}|{norm_city}"
-    elif norm_addr:
-        return norm_addr  # Fallback to address only
-    else:
-        return ""
+def _address_city_keys(addresses: pd.Series, cities: Optional[pd.Series]) -> pd.Series:
+    """Compound keys for address + city matching ('' unless both address and city are present)"""
+    if cities is None:
+        return pd.Series('', index=addresses.index, dtype=object)
+    norm_cities = cities.map(_normalize_city)
+    keys = addresses + '|' + norm_cities
+    return keys.where((addresses != '') & (norm_cities != ''), '')
 
-def _detect_skip_trace_flags(row: pd.Series) -> List[str]:
-    """Detect skip trace flags based on actual data format and return appropriate ST codes"""
-    import datetime
-    flags = []
-    
-    # Owner Is Deceased - check for 1.0 (Excel converts TRUE to 1.0)
-    deceased_val = row.get('Owner Is Deceased')
-    if pd.notna(deceased_val):
-        try:
-            if float(deceased_val) == 1.0:
-                flags.append('STDeceased')
-        except (ValueError, TypeError):
-            # Handle non-numeric values - check for string TRUE
-            if str(deceased_val).lower() in ['true', 'yes', '1', 'y']:
-                flags.append('STDeceased')
-    
-    # Date-based distress indicators - check for actual datetime objects
-    date_columns = {
-        'Owner Bankruptcy': 'STBankruptcy',
-        'Owner Foreclosure': 'STForeclosure',
-        'Lien': 'STLien',
-        'Judgment': 'STJudgment',
-        'Quitclaim': 'STQuitclaim'
-    }
+# Skip trace date columns whose presence as a date marks distress, in ST_Flags order after STDeceased
+ST_DATE_FLAG_COLUMNS = {
+    'Owner Bankruptcy': 'STBankruptcy',
+    'Owner Foreclosure': 'STForeclosure',
+    'Lien': 'STLien',
+    'Judgment': 'STJudgment',
+    'Quitclaim': 'STQuitclaim'
+}
+
+# Skip trace columns copied to the enhanced file where present
+GOLDEN_COLUMNS = {
+    'Golden Address': 'Golden_Address',
+    'Golden City': 'Golden_City',
+    'Golden State': 'Golden_State',
+    'Golden Zip': 'Golden_Zip'
+}
+
+def _skip_trace_flags(st_rows: pd.DataFrame) -> pd.Series:
+    """Comma-separated ST codes of every skip trace row ('' when a row has none)"""
+    flag_masks = {}
+    
+    # Owner Is Deceased - 1.0 (Excel converts TRUE to 1.0) or a TRUE-like string
+    if 'Owner Is Deceased' in st_rows.columns:
+        deceased = st_rows['Owner Is Deceased']
+        numeric = pd.to_numeric(deceased, errors='coerce')
+        text = deceased.astype(str).str.strip().str.lower()
+        flag_masks['STDeceased'] = (numeric == 1.0) | (numeric.isna() & deceased.notna() &
+                                                       text.isin(['true', 'yes', '1', 'y']))
+    
+    # Date-based distress indicators - only actual dates count ('No Data' and other text don't)
+    for col_name, st_code in ST_DATE_FLAG_COLUMNS.items():
+        if col_name in st_rows.columns:
+            values = st_rows[col_name]
+            if pd.api.types.is_datetime64_any_dtype(values):
+                flag_masks[st_code] = values.notna()
+            else:
+                flag_masks[st_code] = values.notna() & values.map(
+                    lambda value: isinstance(value, (datetime, pd.Timestamp)))
     
-    for col_name, st_code in date_columns.items():
-        if col_name in row:
-            value = row[col_name]
-            # Check if it's a datetime object (indicates actual distress date)
-            if (pd.notna(value) and 
-                isinstance(value, (datetime.datetime, pd.Timestamp)) and
-                str(value) != 'No Data'):
-                flags.append(st_code)
+    flags = pd.Series('', index=st_rows.index, dtype=object)
+    for st_code, has_flag in flag_masks.items():
+        flags = flags.mask(has_flag.to_numpy(dtype=bool), flags + ',' + st_code)
+    return flags.str.lstrip(',')
+
+def _last_positions(keys: pd.Series) -> pd.Series:
+    """Position of the last row of each non-blank key, indexed by key"""
+    keys = keys.to_numpy(dtype=object)
+    present = keys != ''
+    return pd.Series(np.flatnonzero(present)).groupby(keys[present]).last()
+
+def _lookup_positions(position_by_key: pd.Series, keys: pd.Series) -> np.ndarray:
+    """Skip trace row position for each key (-1 for blank or unknown keys)"""
+    found = position_by_key.index.get_indexer(keys.to_numpy(dtype=object))
+    # Unknown keys index the trailing -1
+    return np.append(position_by_key.to_numpy(dtype=np.int64), -1)[found]
+
+def _apply_skip_trace_matches(enhanced_df: pd.DataFrame, matched: np.ndarray, st_pos: np.ndarray,
+                              st_region_data: pd.DataFrame, st_flag_strings: pd.Series, source: str) -> int:
+    """
+    Copy skip trace values into matched enhanced rows as whole columns.
     
-    return flags
+    Args:
+        enhanced_df: Enhanced DataFrame (updated in place)
+        matched: Boolean mask of the enhanced rows that matched
+        st_pos: Skip trace row position of each matched row, in row order
+        st_region_data: Skip trace rows of the region
+        st_flag_strings: ST codes of every skip trace row (see _skip_trace_flags)
+        source: ST_MatchSource value of these matches
+        
+    Returns:
+        Number of matched rows
+    """
+    st_matches = st_region_data.iloc[st_pos]
+    
+    # Golden Address, City, State, Zip (missing skip trace values leave the column empty)
+    for st_col, enh_col in GOLDEN_COLUMNS.items():
+        if st_col in st_matches.columns:
+            values = st_matches[st_col].to_numpy(dtype=object)
+            present = matched.copy()
+            present[matched] = pd.notna(values)
+            enhanced_df.loc[present, enh_col] = values[pd.notna(values)]
+    
+    # Golden Address differs from the original mailing address
+    if 'Golden Address' in st_matches.columns:
+        golden = pd.Series(st_matches['Golden Address'].to_numpy(dtype=object))
+        original = pd.Series(enhanced_df.loc[matched, 'Mailing Address'].to_numpy(dtype=object))
+        differs = (golden.notna() & original.notna() &
+                   (golden.astype(str).str.strip() != original.astype(str).str.strip()))
+        enhanced_df.loc[matched, 'Golden_Address_Differs'] = differs.to_numpy(dtype=bool)
+    
+    enhanced_df.loc[matched, 'ST_Flags'] = st_flag_strings.iloc[st_pos].to_numpy(dtype=object)
+    enhanced_df.loc[matched, 'ST_MatchSource'] = source
+    return int(matched.sum())
 
-def _match_skip_trace_hybrid(enhanced_df: pd.DataFrame, skip_trace_df: pd.DataFrame, region_fips: str) -> pd.DataFrame:
+def _match_skip_trace_hybrid(enhanced_df: pd.DataFrame, skip_trace_df: pd.DataFrame, region_fips: str,
+                             strip_parcel_suffix: bool = False) -> pd.DataFrame:
     """
     Match skip trace data using hybrid approach: APN+FIPS primary, address fallback
     
@@ -122,6 +164,7 @@ def _match_skip_trace_hybrid(enhanced_df: pd.DataFrame, skip_trace_df: pd.DataFr
         enhanced_df: Main enhanced region DataFrame
         skip_trace_df: Skip trace data DataFrame  
         region_fips: Expected FIPS code for this region
+        strip_parcel_suffix: Match lettered split parcels to their base parcel (region config)
         
     Returns:
         Enhanced DataFrame with skip trace data integrated
@@ -143,12 +186,12 @@ def _match_skip_trace_hybrid(enhanced_df: pd.DataFrame, skip_trace_df: pd.DataFr
         enhanced_df['Golden_Zip'] = None
         enhanced_df['Golden_Address_Differs'] = False
         enhanced_df['ST_Flags'] = ''
+        enhanced_df['ST_MatchSource'] = ''
         
-        # Initialize skip trace boolean flag columns
+        # Initialize skip trace boolean flag columns (derived from ST_Flags, so reset like it)
         st_flag_columns = ['HasSTBankruptcy', 'HasSTForeclosure', 'HasSTLien', 'HasSTJudgment', 'HasSTQuitclaim', 'HasSTDeceased']
         for col in st_flag_columns:
-            if col not in enhanced_df.columns:
-                enhanced_df[col] = False
+            enhanced_df[col] = False
         return enhanced_df
     
     logger.info(f"Found {len(st_region_data)} skip trace records for FIPS {region_fips}")
@@ -160,132 +203,64 @@ def _match_skip_trace_hybrid(enhanced_df: pd.DataFrame, skip_trace_df: pd.DataFr
     enhanced_df['Golden_Zip'] = None
     enhanced_df['Golden_Address_Differs'] = False  
     enhanced_df['ST_Flags'] = ''
+    enhanced_df['ST_MatchSource'] = ''
     
-    # Initialize skip trace boolean flag columns if they don't exist
+    # Initialize skip trace boolean flag columns (derived from ST_Flags, so reset like it)
     st_flag_columns = ['HasSTBankruptcy', 'HasSTForeclosure', 'HasSTLien', 'HasSTJudgment', 'HasSTQuitclaim', 'HasSTDeceased']
     for col in st_flag_columns:
-        if col not in enhanced_df.columns:
-            enhanced_df[col] = False
+        enhanced_df[col] = False
     
     matches_apn = 0
     matches_address = 0
     
+    # ST codes of every skip trace row, computed once for both matching phases
+    st_flag_strings = _skip_trace_flags(st_region_data)
+    
     # Phase 1: Primary matching on APN + FIPS (if APN column exists)
     if 'APN' in enhanced_df.columns and 'Property APN' in st_region_data.columns:
         logger.info("Phase 1: Matching on APN + FIPS...")
         
-        # Create lookup dictionary for APN matches
-        apn_lookup = {}
-        for idx, row in st_region_data.iterrows():
-            apn = str(row['Property APN']).strip()
-            if apn and apn != 'nan':
-                apn_lookup[apn] = row
+        # Skip trace parcels get integer ids from their canonical APNs (dashes, dots and
+        # leading zeros don't matter); enhanced APNs are looked up against them
+        parcels = ParcelIndex(strip_suffix=strip_parcel_suffix)
+        st_ids = parcels.ids(st_region_data['Property APN'], register=True)
+        enh_ids = parcels.ids(enhanced_df['APN'])
         
-        # Apply APN matches
-        for idx, enh_row in enhanced_df.iterrows():
-            enh_apn = str(enh_row.get('APN', '')).strip()
-            if enh_apn and enh_apn != 'nan' and enh_apn in apn_lookup:
-                st_row = apn_lookup[enh_apn]
-                
-                # Apply Golden Address fields
-                if pd.notna(st_row.get('Golden Address')):
-                    enhanced_df.loc[idx, 'Golden_Address'] = st_row['Golden Address']
-                    # Check if different from original mailing address
-                    original_addr = enhanced_df.loc[idx, 'Mailing Address']
-                    enhanced_df.loc[idx, 'Golden_Address_Differs'] = (
-                        pd.notna(original_addr) and 
-                        str(st_row['Golden Address']).strip() != str(original_addr).strip()
-                    )
-                
-                # Apply Golden City, State, Zip
-                if pd.notna(st_row.get('Golden City')):
-                    enhanced_df.loc[idx, 'Golden_City'] = st_row['Golden City']
-                if pd.notna(st_row.get('Golden State')):
-                    enhanced_df.loc[idx, 'Golden_State'] = st_row['Golden State']
-                if pd.notna(st_row.get('Golden Zip')):
-                    enhanced_df.loc[idx, 'Golden_Zip'] = st_row['Golden Zip']
-                
-                # Apply skip trace flags
-                st_flags = _detect_skip_trace_flags(st_row)
-                if st_flags:
-                    enhanced_df.loc[idx, 'ST_Flags'] = ','.join(st_flags)
-                
-                matches_apn += 1
+        # Skip trace row per parcel id (the last row wins for duplicate APNs)
+        st_positions = pd.Series(np.arange(len(st_ids)))[st_ids != MISSING_PARCEL_ID]
+        st_row_by_id = st_positions.groupby(st_ids[st_ids != MISSING_PARCEL_ID]).last()
+        
+        # Apply APN matches as whole columns: each matched row takes its skip trace row's values
+        # (enhanced ids are lookups only, so every known id has a skip trace row)
+        matched = enh_ids != MISSING_PARCEL_ID
+        st_pos = st_row_by_id.reindex(enh_ids[matched]).to_numpy()
+        matches_apn = _apply_skip_trace_matches(enhanced_df, matched, st_pos, st_region_data, st_flag_strings, 'apn')
         
         logger.info(f"APN+FIPS matches: {matches_apn}")
     
     # Phase 2: Address+City-based matching for unmatched records
     logger.info("Phase 2: Address+City-based matching for remaining records...")
     
-    # Create address+city lookup for skip trace data (primary)
-    address_city_lookup = {}
-    # Also maintain address-only lookup as fallback
-    address_only_lookup = {}
-    
-    for idx, row in st_region_data.iterrows():
-        # Try address+city combination first (most accurate)
-        if 'Property City' in row and pd.notna(row['Property City']):
-            addr_city_key = _create_address_city_key(row['Property Address'], row['Property City'])
-            if addr_city_key and '|' in addr_city_key:  # Only if we have both address and city
-                address_city_lookup[addr_city_key] = row
-        
-        # Also create address-only fallback
-        norm_addr = _normalize_address(row['Property Address'])
-        if norm_addr:
-            address_only_lookup[norm_addr] = row
-    
-    # Apply address+city matches to records that don't already have skip trace data
-    city_matches = 0
-    fallback_matches = 0
-    
-    for idx, enh_row in enhanced_df.iterrows():
-        # Skip if already matched by APN
-        if pd.notna(enhanced_df.loc[idx, 'Golden_Address']) or (pd.notna(enhanced_df.loc[idx, 'ST_Flags']) and enhanced_df.loc[idx, 'ST_Flags'] != ''):
-            continue
-        
-        st_row = None
-        match_type = None
-        
-        # First try: Address + City matching (most accurate)
-        if 'City' in enh_row and pd.notna(enh_row['City']):
-            addr_city_key = _create_address_city_key(enh_row['Address'], enh_row['City'])
-            if addr_city_key and '|' in addr_city_key and addr_city_key in address_city_lookup:
-                st_row = address_city_lookup[addr_city_key]
-                match_type = "address+city"
-                city_matches += 1
-        
-        # Second try: Address-only fallback (less accurate, but still useful)
-        if st_row is None:
-            norm_addr = _normalize_address(enh_row['Address'])
-            if norm_addr and norm_addr in address_only_lookup:
-                st_row = address_only_lookup[norm_addr]
-                match_type = "address-only"
-                fallback_matches += 1
-        
-        # Apply match if found
-        if st_row is not None:
-            # Apply Golden Address fields
-            if pd.notna(st_row.get('Golden Address')):
-                enhanced_df.loc[idx, 'Golden_Address'] = st_row['Golden Address']
-                # Check if different from original mailing address
-                original_addr = enhanced_df.loc[idx, 'Mailing Address']
-                enhanced_df.loc[idx, 'Golden_Address_Differs'] = (
-                    pd.notna(original_addr) and 
-                    str(st_row['Golden Address']).strip() != str(original_addr).strip()
-                )
-            
-            # Apply Golden City, State, Zip
-            if pd.notna(st_row.get('Golden City')):
-                enhanced_df.loc[idx, 'Golden_City'] = st_row['Golden City']
-            if pd.notna(st_row.get('Golden State')):
-                enhanced_df.loc[idx, 'Golden_State'] = st_row['Golden State']
-            if pd.notna(st_row.get('Golden Zip')):
-                enhanced_df.loc[idx, 'Golden_Zip'] = st_row['Golden Zip']
-            
-            # Apply skip trace flags
-            st_flags = _detect_skip_trace_flags(st_row)
-            if st_flags:
-                enhanced_df.loc[idx, 'ST_Flags'] = ','.join(st_flags)
+    # Addresses are normalized for the whole file at once
+    st_addresses = normalize_addresses(st_region_data['Property Address'])
+    st_city_keys = _address_city_keys(st_addresses, st_region_data.get('Property City'))
+    enh_addresses = normalize_addresses(enhanced_df['Address'])
+    enh_city_keys = _address_city_keys(enh_addresses, enhanced_df.get('City'))
+    
+    # Records without skip trace data yet (no golden address and no flags)
+    unmatched = (enhanced_df['Golden_Address'].isna() & enhanced_df['ST_Flags'].fillna('').eq('')).to_numpy()
+    
+    # First try: Address + City matching (most accurate); the last skip trace row wins per key
+    city_pos = _lookup_positions(_last_positions(st_city_keys), enh_city_keys)
+    city_matched = unmatched & (city_pos >= 0)
+    city_matches = _apply_skip_trace_matches(enhanced_df, city_matched, city_pos[city_matched], st_region_data,
+                                             st_flag_strings, 'address+city')
+    
+    # Second try: Address-only fallback (less accurate, but still useful)
+    address_pos = _lookup_positions(_last_positions(st_addresses), enh_addresses)
+    address_matched = unmatched & ~city_matched & (address_pos >= 0)
+    fallback_matches = _apply_skip_trace_matches(enhanced_df, address_matched, address_pos[address_matched],
+                                                 st_region_data, st_flag_strings, 'address-only')
     
     matches_address = city_matches + fallback_matches
     
@@ -307,16 +282,12 @@ def _match_skip_trace_hybrid(enhanced_df: pd.DataFrame, skip_trace_df: pd.DataFr
         'STDeceased': 'HasSTDeceased'
     }
     
-    for idx, row in enhanced_df.iterrows():
-        st_flags = row.get('ST_Flags', '')
-        if st_flags:
-            # Set boolean flags for each detected ST flag
-            st_flag_list = st_flags.split(',')
-            for flag in st_flag_list:
-                if flag in st_flag_mapping:
-                    col_name = st_flag_mapping[flag]
-                    enhanced_df.loc[idx, col_name] = True
-                    flag_updates += 1
+    # One vectorized membership test per flag instead of splitting every row's ST_Flags
+    st_flags = enhanced_df['ST_Flags'].fillna('').astype(str)
+    for flag, col_name in st_flag_mapping.items():
+        has_flag = st_flags.str.contains(rf'(?:^|,){flag}(?:,|$)', regex=True)
+        enhanced_df[col_name] = enhanced_df[col_name] | has_flag
+        flag_updates += int(has_flag.sum())
     
     # Clean up temporary columns if they exist
     temp_columns = ['_NormalizedAddress']
@@ -337,15 +308,19 @@ def _match_skip_trace_hybrid(enhanced_df: pd.DataFrame, skip_trace_df: pd.DataFr
     return enhanced_df
 
 def process_region_skip_trace(region_key: str, enhanced_file_path: str, skip_trace_file_path: str, 
-                             config_manager: MultiRegionConfigManager) -> Dict:
+                             config_manager: MultiRegionConfigManager, export_excel: bool = True) -> Dict:
     """
     Process skip trace integration for a single region
     
+    The enhanced data is read from its Parquet file when one exists and written back
+    in place as Parquet, with the Excel copy refreshed unless export_excel is False.
+    
     Args:
         region_key: Region identifier (e.g., 'roanoke_city_va')
-        enhanced_file_path: Path to existing enhanced region file
-        skip_trace_file_path: Path to skip trace data file
+        enhanced_file_path: Path to existing enhanced region file (.parquet or .xlsx)
+        skip_trace_file_path: Path to skip trace data file (Excel, CSV, Parquet or Feather)
         config_manager: Configuration manager instance
+        export_excel: Also rewrite the Excel copy of the enhanced file
         
     Returns:
         Dictionary with processing results
@@ -379,8 +354,8 @@ def process_region_skip_trace(region_key: str, enhanced_file_path: str, skip_tra
         if not enhanced_file.exists():
             raise FileNotFoundError(f"Enhanced file not found: {enhanced_file_path}")
         
-        enhanced_df = pd.read_excel(enhanced_file)
-        print(f"Loaded {len(enhanced_df):,} enhanced records")
+        enhanced_df = read_input(preferred_source(enhanced_file))
+        print(f"Loaded {len(enhanced_df):,} enhanced records from {preferred_source(enhanced_file).name}")
         
         # Load skip trace file
         print("\\nSTEP 2: Loading skip trace file...")
@@ -388,7 +363,7 @@ def process_region_skip_trace(region_key: str, enhanced_file_path: str, skip_tra
         if not skip_trace_file.exists():
             raise FileNotFoundError(f"Skip trace file not found: {skip_trace_file_path}")
         
-        skip_trace_df = pd.read_excel(skip_trace_file)
+        skip_trace_df = read_input(skip_trace_file, schema=SKIP_TRACE_SCHEMA)
         print(f"Loaded {len(skip_trace_df):,} skip trace records")
         
         # Validate skip trace file has required columns
@@ -404,12 +379,26 @@ def process_region_skip_trace(region_key: str, enhanced_file_path: str, skip_tra
         
         # Process skip trace integration
         print("\\nSTEP 3: Integrating skip trace data...")
-        updated_df = _match_skip_trace_hybrid(enhanced_df, skip_trace_df, config.fips_code)
+        updated_df = _match_skip_trace_hybrid(enhanced_df, skip_trace_df, config.fips_code,
+                                              config.parcel_strip_suffix)
+        
+        # Skip trace flags count toward the primary location tie-break
+        updated_df = assign_primary_locations(updated_df)
         
-        # Save updated file in place
+        # Save updated file in place (Parquet canonical, Excel copy optional)
         print("\\nSTEP 4: Saving updated file...")
-        updated_df.to_excel(enhanced_file, index=False)
-        print(f"Updated file saved: {enhanced_file}")
+        saved = save_dataset(updated_df, enhanced_file.with_suffix(''), export_excel, logger)
+        enhanced_file = saved['columnar'] or saved['excel']
+        for saved_path in filter(None, saved.values()):
+            print(f"Updated file saved: {saved_path}")
+        
+        # Replace the month's partition of the output dataset and the month's property history
+        # update with the skip traced output
+        try:
+            if publish_output(enhanced_file, region_key):
+                update_history_from_output(region_key, enhanced_file, run_month(enhanced_file))
+        except Exception as e:
+            logger.warning(f"Could not publish {enhanced_file.name} to the output dataset and property history: {e}")
         
         # Generate summary stats
         golden_address_count = updated_df['Golden_Address'].notna().sum()
@@ -419,6 +408,15 @@ def process_region_skip_trace(region_key: str, enhanced_file_path: str, skip_tra
         golden_differs_count = updated_df['Golden_Address_Differs'].sum()
         st_flags_count = (updated_df['ST_Flags'] != '').sum()
         
+        # Flag distribution, match sources and data quality in one columnar pass
+        region_stats = compute_region_stats(updated_df)
+        stats_file = enhanced_file.parent / f"{region_code}_skip_trace_stats_{datetime.now().strftime('%Y%m%d')}.json"
+        try:
+            write_stats_json(region_stats, stats_file, region_key=region_key, enhanced_file=str(enhanced_file),
+                             skip_trace_file=str(skip_trace_file))
+        except Exception as e:
+            print(f"Warning: Could not save statistics file: {e}")
+        
         print("\\nFINAL SUMMARY")
         print("=" * 70)
         print(f"Region: {config.region_name}")
@@ -431,17 +429,19 @@ def process_region_skip_trace(region_key: str, enhanced_file_path: str, skip_tra
         print(f"Records with Skip Trace flags: {st_flags_count:,}")
         
         if st_flags_count > 0:
-            # Show skip trace flag distribution
-            st_flag_dist = {}
-            for flags in updated_df[updated_df['ST_Flags'] != '']['ST_Flags']:
-                for flag in str(flags).split(','):
-                    st_flag_dist[flag] = st_flag_dist.get(flag, 0) + 1
+            # Show skip trace flag distribution (HasSTLien -> STLien)
+            st_flag_dist = {column[3:]: count for column, count in region_stats['flag_totals'].items()
+                            if column.startswith('HasST') and count > 0}
             
             print(f"\\nSkip Trace Flag Distribution:")
             for flag, count in sorted(st_flag_dist.items()):
                 pct = (count / len(updated_df)) * 100
                 print(f"   {flag}: {count:,} ({pct:.1f}%)")
         
+        print(f"\\nMatch Sources:")
+        for source, count in region_stats['match_sources'].get('skip_trace', {}).items():
+            print(f"   {source}: {count:,}")
+        
         print("=" * 70)
         
         # Clean up logging handler
@@ -458,7 +458,9 @@ def process_region_skip_trace(region_key: str, enhanced_file_path: str, skip_tra
             'golden_zip_count': golden_zip_count,
             'golden_differs_count': golden_differs_count,
             'st_flags_count': st_flags_count,
-            'output_file': str(enhanced_file)
+            'match_sources': region_stats['match_sources'].get('skip_trace', {}),
+            'output_file': str(enhanced_file),
+            'stats_file': str(stats_file)
         }
         
     except Exception as e:
@@ -472,7 +474,7 @@ def process_region_skip_trace(region_key: str, enhanced_file_path: str, skip_tra
         return {'success': False, 'error': str(e)}
 
 def find_enhanced_files(region_key: str, config_manager: MultiRegionConfigManager) -> List[Path]:
-    """Find enhanced files for a region"""
+    """Find enhanced files for a region (the Parquet file when an output has both formats)"""
     output_dir = Path("output") / region_key
     
     if not output_dir.exists():
@@ -482,8 +484,11 @@ def find_enhanced_files(region_key: str, config_manager: MultiRegionConfigManage
     enhanced_files = []
     for month_dir in output_dir.iterdir():
         if month_dir.is_dir():
-            pattern = f"*_main_region_enhanced_*.xlsx"
-            enhanced_files.extend(month_dir.glob(pattern))
+            for pattern in [f"*_main_region_enhanced_*{COLUMNAR_SUFFIX}", "*_main_region_enhanced_*.xlsx"]:
+                enhanced_files.extend(month_dir.glob(pattern))
+    
+    # One entry per output, preferring the columnar file
+    enhanced_files = list({preferred_source(f) for f in enhanced_files})
     
     # Sort by modification time (newest first)
     enhanced_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
@@ -500,6 +505,7 @@ Examples:
   python skip_trace_processor.py --region roanoke_city_va --enhanced-file "output/roanoke_city_va/2024_01/roa_main_region_enhanced_20240115.xlsx" --skip-trace-file "skip_trace_data.xlsx"
   python skip_trace_processor.py --all-regions --skip-trace-file "skip_trace_data.xlsx"
   python skip_trace_processor.py --region roanoke_city_va --skip-trace-file "skip_trace_data.xlsx"  # Auto-find latest enhanced file
+  python skip_trace_processor.py --all-regions --skip-trace-file "skip_trace_data.xlsx" --no-excel
         """
     )
     
@@ -509,6 +515,7 @@ Examples:
     
     parser.add_argument("--skip-trace-file", required=True, help="Path to skip trace data file")
     parser.add_argument("--enhanced-file", help="Path to enhanced region file (optional, will auto-find latest if not specified)")
+    parser.add_argument("--no-excel", action="store_true", help="Update only the Parquet enhanced file, not its Excel copy")
     
     args = parser.parse_args()
     
@@ -531,7 +538,8 @@ Examples:
                 enhanced_file_path = str(enhanced_files[0])
                 print(f"Auto-selected enhanced file: {enhanced_file_path}")
             
-            result = process_region_skip_trace(args.region, enhanced_file_path, args.skip_trace_file, config_manager)
+            result = process_region_skip_trace(args.region, enhanced_file_path, args.skip_trace_file, config_manager,
+                                               export_excel=not args.no_excel)
             
             if result['success']:
                 print("\\n[SUCCESS] Skip trace processing completed successfully!")
@@ -556,7 +564,8 @@ Examples:
                     continue
                 
                 enhanced_file_path = str(enhanced_files[0])
-                result = process_region_skip_trace(region_key, enhanced_file_path, args.skip_trace_file, config_manager)
+                result = process_region_skip_trace(region_key, enhanced_file_path, args.skip_trace_file, config_manager,
+                                                   export_excel=not args.no_excel)
                 result['region_key'] = region_key
                 results.append(result)
             
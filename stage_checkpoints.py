@@ -0,0 +1,158 @@
+"""
+Pipeline Stages and Checkpoints
+
+Monthly region processing is split into named stages with declared inputs and
+outputs. After a stage runs, its output frames are checkpointed as Parquet files
+under output/<region_key>/checkpoints/, keyed by a hash of the stage's inputs
+(input file contents, upstream stage keys) and parameters (scoring settings).
+
+A later run whose stage key matches loads the checkpoint instead of recomputing.
+Because each key includes the keys of the stages it depends on, changing a niche
+file only invalidates the niche merge: the loaded and scored main frame is reused.
+Changing the main file or the scoring settings invalidates everything downstream.
+Scoring compares sale dates with the run date (ownership cutoffs, date windows), so
+the scored_main key also includes the scoring date: scores are reused on the day
+they were computed, never on a later day.
+
+Only the latest checkpoint of each stage is kept. Checkpoints are skipped (with a
+warning) when pyarrow is missing or a frame can't be stored as Parquet.
+"""
+
+import hashlib
+import json
+import logging
+import pandas as pd
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from columnar_io import COLUMNAR_SUFFIX, columnar_available, read_columnar, write_columnar
+
+logger = logging.getLogger(__name__)
+
+# Bump when a stage's computation changes so old checkpoints stop matching
+CHECKPOINT_VERSION = 2
+CHECKPOINT_DIRNAME = "checkpoints"
+
+
+@dataclass(frozen=True)
+class PipelineStage:
+    """A checkpointed step of region processing"""
+    name: str
+    inputs: Tuple[str, ...]     # Upstream stages, input files and parameters the output depends on
+    outputs: Tuple[str, ...]    # Frames the stage produces
+    description: str
+
+
+PIPELINE_STAGES = [
+    PipelineStage('main_data', ('main file', 'recent sales files'), ('main_df', 'dedup_audit'),
+                  "Load the main file, append recent sales and drop duplicate parcels"),
+    PipelineStage('scored_main', ('main_data', 'scoring params', 'scoring date'), ('main_result',),
+                  "Classify and score every main record"),
+    PipelineStage('niche_merge', ('scored_main', 'niche files'), ('main_result',),
+                  "Set niche flags on matching records and insert niche-only records"),
+]
+
+STAGE_NAMES = [stage.name for stage in PIPELINE_STAGES]
+
+
+def stage_key(stage_name: str, inputs: Dict) -> str:
+    """Hash of a stage's name, inputs and parameters (anything JSON-serializable)"""
+    payload = json.dumps({'stage': stage_name, 'version': CHECKPOINT_VERSION, 'inputs': inputs},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def scored_main_key(main_data_key: str, scoring_params: Dict, scoring_date: date) -> str:
+    """Key of the scored_main stage: main data, scoring settings and the day scores were computed for"""
+    return stage_key('scored_main', {'main_data': main_data_key, 'scoring_params': scoring_params,
+                                     'scoring_date': scoring_date.isoformat()})
+
+
+class StageCheckpointStore:
+    """Latest checkpoint of each pipeline stage for one region"""
+
+    def __init__(self, region_key: str, output_root: Path = Path("output"), from_stage: Optional[str] = None,
+                 log: logging.Logger = logger):
+        if from_stage is not None and from_stage not in STAGE_NAMES:
+            raise ValueError(f"Unknown stage '{from_stage}'. Stages: {', '.join(STAGE_NAMES)}")
+        self.directory = Path(output_root) / region_key / CHECKPOINT_DIRNAME
+        self.from_stage = from_stage
+        self.log = log
+        self.enabled = columnar_available()
+        if not self.enabled:
+            self.log.warning("pyarrow not installed - stage checkpoints disabled")
+
+    def _index_path(self, stage_name: str) -> Path:
+        return self.directory / f"{stage_name}.json"
+
+    def is_forced(self, stage_name: str) -> bool:
+        """True when --from-stage requires this stage to be recomputed"""
+        if self.from_stage is None:
+            return False
+        return STAGE_NAMES.index(stage_name) >= STAGE_NAMES.index(self.from_stage)
+
+    def load(self, stage_name: str, key: str) -> Optional[Tuple[Dict[str, pd.DataFrame], Dict]]:
+        """
+        Load a stage's checkpoint if it was saved under the same key.
+
+        Returns:
+            tuple: (frames by output name, metadata), or None when the stage must run
+        """
+        if not self.enabled or self.is_forced(stage_name):
+            return None
+
+        index_path = self._index_path(stage_name)
+        if not index_path.exists():
+            return None
+        try:
+            with open(index_path, 'r') as f:
+                index = json.load(f)
+            if index.get('key') != key:
+                return None
+            frames = {name: read_columnar(self.directory / file_name) for name, file_name in index['frames'].items()}
+        except Exception as e:
+            self.log.warning(f"Ignoring unreadable checkpoint for stage {stage_name}: {e}")
+            return None
+
+        self.log.info(f"Checkpoint hit: {stage_name} ({key[:12]}, saved {index.get('saved_at')})")
+        return frames, index.get('metadata', {})
+
+    def save(self, stage_name: str, key: str, frames: Dict[str, pd.DataFrame], metadata: Optional[Dict] = None) -> bool:
+        """
+        Checkpoint a stage's output frames, replacing its previous checkpoint.
+
+        Returns:
+            True if saved, False if checkpoints are disabled or a frame could not be stored
+        """
+        if not self.enabled:
+            return False
+
+        file_names = {name: f"{stage_name}_{key[:16]}_{name}{COLUMNAR_SUFFIX}" for name in frames}
+        try:
+            for name, df in frames.items():
+                write_columnar(df, self.directory / file_names[name])
+        except Exception as e:
+            self.log.warning(f"Could not checkpoint stage {stage_name}: {e}")
+            for file_name in file_names.values():
+                (self.directory / file_name).unlink(missing_ok=True)
+            return False
+
+        # Index is written last, so a partially written checkpoint is never loaded
+        with open(self._index_path(stage_name), 'w') as f:
+            json.dump({'stage': stage_name, 'key': key, 'saved_at': datetime.now().isoformat(timespec='seconds'),
+                       'frames': file_names, 'metadata': metadata or {}}, f, indent=2, default=str)
+
+        # Drop older checkpoints of this stage
+        for old_file in self.directory.glob(f"{stage_name}_*{COLUMNAR_SUFFIX}"):
+            if old_file.name not in file_names.values():
+                old_file.unlink(missing_ok=True)
+
+        self.log.info(f"Checkpoint saved: {stage_name} ({key[:12]})")
+        return True
+
+
+def stage_descriptions() -> List[str]:
+    """One line per stage for help text"""
+    return [f"{stage.name}: {stage.description}" for stage in PIPELINE_STAGES]
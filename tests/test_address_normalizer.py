@@ -0,0 +1,34 @@
+import pandas as pd
+
+from address_normalizer import normalize_address, normalize_addresses
+
+
+def test_vendor_spellings_normalize_to_one_form():
+    addresses = pd.Series([
+        '123 Main Street, Apt #4',
+        '123 MAIN ST APT 4',
+        '123 main st.,  apartment 4',
+        '45 North First Avenue',
+        '45 N. 1st Av',
+        '9 Southwest Court #B',
+        "12 O'Hara Blvd.",
+        '100 Park Ave Suite 200',
+    ], index=[10, 11, 12, 13, 14, 15, 16, 17])
+
+    result = normalize_addresses(addresses)
+
+    assert result.index.tolist() == addresses.index.tolist()
+    assert result.tolist() == [
+        '123 MAIN ST APT 4', '123 MAIN ST APT 4', '123 MAIN ST APT 4',
+        '45 N 1ST AVE', '45 N 1ST AVE',
+        '9 SW CT # B', '12 OHARA BLVD', '100 PARK AVE STE 200',
+    ]
+
+
+def test_missing_values_and_whole_words_only():
+    addresses = pd.Series([None, '', float('nan'), '  ', 1234, '7 STREETER DR', '88 1ST ST'])
+
+    assert normalize_addresses(addresses).tolist() == ['', '', '', '', '1234', '7 STREETER DR', '88 1ST ST']
+    assert normalize_addresses(pd.Series([], dtype=object)).tolist() == []
+    assert normalize_address('1 Twelfth Street NorthEast') == '1 12TH ST NE'
+    assert normalize_address(None) == ''
@@ -0,0 +1,38 @@
+from batch_job_store import BatchJobStore, PROCESSING_STATES, STATUS_FAILED, STATUS_QUEUED, STATUS_SUCCEEDED
+
+
+def test_interrupted_and_failed_regions_are_resumed(tmp_path):
+    store = BatchJobStore(tmp_path / 'batch_jobs.sqlite')
+    regions = ['norfolk_city_va', 'richmond_city_va', 'roanoke_city_va']
+    batch_id = store.create_batch(regions, {'jobs': 2})
+    assert store.latest_batch_id() == batch_id
+
+    # roanoke succeeds, richmond fails, norfolk dies while merging niches
+    assert store.mark_running(batch_id, 'roanoke_city_va') == 1
+    store.record_stage(batch_id, 'roanoke_city_va', 'scoring')
+    store.mark_finished(batch_id, 'roanoke_city_va', {'success': True, 'total_records': 5071,
+                                                      'output_file': 'output/roanoke_city_va/enhanced.parquet'})
+    store.mark_running(batch_id, 'richmond_city_va')
+    store.mark_finished(batch_id, 'richmond_city_va', {'success': False, 'error': 'Region validation failed'})
+    store.mark_running(batch_id, 'norfolk_city_va')
+    store.record_stage(batch_id, 'norfolk_city_va', 'merging_niches')
+    store.record_stage(batch_id, 'norfolk_city_va', 'not_a_stage')
+
+    jobs = {job['region_key']: job for job in store.get_jobs(batch_id)}
+    assert jobs['roanoke_city_va']['status'] == STATUS_SUCCEEDED
+    assert jobs['roanoke_city_va']['processing_state'] == PROCESSING_STATES['completed']
+    assert jobs['roanoke_city_va']['total_records'] == 5071
+    assert jobs['richmond_city_va']['status'] == STATUS_FAILED
+    assert jobs['richmond_city_va']['error'] == 'Region validation failed'
+    assert jobs['norfolk_city_va']['processing_stage'] == 'merging_niches'
+    assert store.regions_to_resume(batch_id) == ['norfolk_city_va', 'richmond_city_va']
+
+    # A retry counts as a new attempt and clears the previous error
+    assert store.mark_running(batch_id, 'richmond_city_va') == 2
+    retried = {job['region_key']: job for job in store.get_jobs(batch_id)}['richmond_city_va']
+    assert retried['error'] is None
+
+    # A new batch starts with every region queued
+    next_batch = store.create_batch(regions)
+    assert next_batch > batch_id
+    assert {job['status'] for job in store.get_jobs(next_batch)} == {STATUS_QUEUED}
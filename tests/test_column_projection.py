@@ -0,0 +1,59 @@
+import pandas as pd
+from datetime import datetime
+
+from column_projection import ROW_ID_COLUMN, project_columns
+from enhanced_property_processor import ENHANCED_OUTPUT_COLUMNS, EnhancedPropertyProcessor
+
+
+def make_main():
+    return pd.DataFrame({
+        'APN': ['100-01', '100-02', '100-03'],
+        'Owner 1 Last Name': ['SMITH', 'JONES', 'BROWN'],
+        'Owner 1 First Name': ['JOHN', 'MARY', 'ANN'],
+        'Address': ['1 MAIN ST', '2 MAIN ST', '3 MAIN ST'],
+        'Bedrooms': pd.array([3, None, 2], dtype='Int32'),
+        'Owner Occupied': ['Yes', 'No', 'Yes'],
+        'Last Sale Date': ['2005-03-01', '2021-06-15', '2015-01-20'],
+        'Last Sale Amount': [50000.0, 250000.0, 180000.0],
+        'Loan 1 Lender': ['FIRST BANK', None, 'CREDIT UNION']
+    })
+
+
+def test_rejoin_restores_passthrough_columns_and_order():
+    main = make_main()
+    working, passthrough = project_columns(main, ['APN', 'Address', 'Owner 1 Last Name'])
+
+    assert list(working.columns) == ['APN', 'Owner 1 Last Name', 'Address', ROW_ID_COLUMN]
+    assert passthrough.columns == ['Owner 1 First Name', 'Bedrooms', 'Owner Occupied', 'Last Sale Date',
+                                   'Last Sale Amount', 'Loan 1 Lender']
+
+    # A stage adds a column and an inserted row, then sorts the working frame
+    working['PriorityCode'] = ['ABS1', 'OWN1', 'OWN20']
+    niche = pd.DataFrame({'APN': ['100-09'], 'Address': ['9 OAK AVE'], 'Loan 1 Lender': ['HOME LOANS']})
+    inserted = niche[['APN', 'Address']].assign(PriorityCode='DEFAULT')
+    inserted[ROW_ID_COLUMN] = passthrough.add_rows(niche)
+    working = pd.concat([working, inserted], ignore_index=True).sort_values('APN', ascending=False)
+
+    output = passthrough.rejoin(working)
+
+    assert list(output.columns) == list(main.columns) + ['PriorityCode']
+    assert output['APN'].tolist() == ['100-09', '100-03', '100-02', '100-01']
+    assert output['Loan 1 Lender'].tolist()[:2] == ['HOME LOANS', 'CREDIT UNION']
+    assert output['Bedrooms'].tolist()[0] == ''
+    assert output['Owner 1 First Name'].tolist()[1:] == ['ANN', 'MARY', 'JOHN']
+
+
+def test_scoring_carries_unread_columns_over_whole():
+    processor = EnhancedPropertyProcessor({
+        'region_input_date1': datetime(2009, 1, 1),
+        'region_input_date2': datetime(2019, 1, 1),
+        'region_input_amount1': 75000,
+        'region_input_amount2': 200000
+    })
+    main = make_main()
+
+    result = processor.process_dataframe(main)
+
+    assert list(result.columns) == list(main.columns) + ENHANCED_OUTPUT_COLUMNS
+    assert str(result['Bedrooms'].dtype) == 'Int32'
+    pd.testing.assert_frame_equal(result[list(main.columns)], main)
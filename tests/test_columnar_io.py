@@ -0,0 +1,47 @@
+import pandas as pd
+
+import columnar_io
+from columnar_io import ChunkedColumnarWriter, preferred_source, read_columnar, save_dataset
+
+
+def test_chunks_with_conflicting_types_settle_on_one_column_type(tmp_path):
+    writer = ChunkedColumnarWriter(tmp_path / 'out.parquet')
+    writer.append(pd.DataFrame({'APN': [1, 2], 'Unit': [None, None], 'Zip': [24016, 24017]}))
+    writer.append(pd.DataFrame({'APN': ['100-01', None], 'Unit': [5, 'B'], 'Zip': [24018.0, None],
+                                'Extra': [1, 2]}))
+
+    result = read_columnar(writer.close())
+
+    # Integers and floats widen to float; anything else conflicting becomes text; extra columns are dropped
+    assert list(result.columns) == ['APN', 'Unit', 'Zip']
+    assert list(result['APN'][:3]) == ['1', '2', '100-01']
+    assert list(result['Unit'][2:]) == ['5', 'B']
+    assert result['Zip'].dtype == 'float64'
+    assert writer.rows_written == 4
+    assert not writer.part_dir.exists()
+
+
+def test_parquet_is_canonical_and_excel_an_optional_export(tmp_path):
+    df = pd.DataFrame({'APN': ['100-01', 100.0], 'Score': [1.5, None]})
+    stem = tmp_path / 'roak_main_region_enhanced_20250901'
+
+    saved = save_dataset(df, stem)
+    assert saved == {'columnar': stem.with_suffix('.parquet'), 'excel': stem.with_suffix('.xlsx')}
+    # Mixed-type columns are stored as text
+    assert read_columnar(saved['columnar'])['APN'].tolist() == ['100-01', '100']
+    assert preferred_source(saved['excel']) == saved['columnar']
+
+    # Without the export, an Excel copy from an earlier write is removed
+    saved = save_dataset(df, stem, export_excel=False)
+    assert saved == {'columnar': stem.with_suffix('.parquet'), 'excel': None}
+    assert not stem.with_suffix('.xlsx').exists()
+
+
+def test_excel_is_written_when_parquet_is_unavailable(tmp_path, monkeypatch):
+    monkeypatch.setattr(columnar_io, '_PYARROW_AVAILABLE', False)
+    stem = tmp_path / 'roak_main_region_enhanced_20250901'
+
+    saved = save_dataset(pd.DataFrame({'APN': ['100-01']}), stem, export_excel=False)
+
+    assert saved == {'columnar': None, 'excel': stem.with_suffix('.xlsx')}
+    assert pd.read_excel(saved['excel'])['APN'].tolist() == ['100-01']
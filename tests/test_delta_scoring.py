@@ -0,0 +1,50 @@
+import pandas as pd
+from datetime import datetime
+
+from delta_scoring import score_with_delta
+from enhanced_property_processor import EnhancedPropertyProcessor
+
+
+def make_processor():
+    return EnhancedPropertyProcessor({
+        'region_input_date1': datetime(2009, 1, 1),
+        'region_input_date2': datetime(2019, 1, 1),
+        'region_input_amount1': 75000,
+        'region_input_amount2': 200000
+    })
+
+
+def make_main():
+    return pd.DataFrame({
+        'APN': ['100-01', '100-02', '100-03'],
+        'Owner 1 Last Name': ['SMITH', 'JONES', 'BROWN'],
+        'Owner 1 First Name': ['JOHN', 'MARY', 'ANN'],
+        'Address': ['1 MAIN ST', '2 MAIN ST', '3 MAIN ST'],
+        'Mailing Address': ['1 MAIN ST', 'PO BOX 5', '3 MAIN ST'],
+        'Owner Occupied': ['Yes', 'No', 'Yes'],
+        'Last Sale Date': ['2005-03-01', '2021-06-15', '2015-01-20'],
+        'Last Sale Amount': [50000, 250000, 180000]
+    })
+
+
+def test_delta_matches_full_scoring_and_logs_changes():
+    processor = make_processor()
+    previous_output = processor.process_dataframe(make_main())
+
+    current = make_main()
+    current.loc[1, 'Last Sale Date'] = '2006-01-01'  # changed
+    current = current.drop(index=2)                    # removed
+    current = pd.concat([current, pd.DataFrame([{
+        'APN': '100-04', 'Owner 1 Last Name': 'GRACE CHURCH', 'Owner 1 First Name': '',
+        'Address': '4 MAIN ST', 'Owner Occupied': 'No', 'Last Sale Date': '', 'Last Sale Amount': None
+    }])], ignore_index=True)                           # new
+
+    scored, change_log, counts = score_with_delta(current, previous_output, processor)
+    full = processor.process_dataframe(current).reset_index(drop=True)
+
+    pd.testing.assert_frame_equal(scored[full.columns], full, check_dtype=False)
+    assert counts['unchanged'] == 1
+    assert counts['rescored'] == 2
+    assert dict(change_log.groupby('ChangeType')['PropertyKey'].first()) == {
+        'CHANGED': 'APN:100-02', 'NEW': 'APN:100-04', 'REMOVED': 'APN:100-03'
+    }
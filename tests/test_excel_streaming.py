@@ -0,0 +1,59 @@
+import pandas as pd
+
+from columnar_io import write_columnar
+from excel_streaming import iter_table_chunks, write_excel_streaming
+
+
+def _sample_frame():
+    return pd.DataFrame({
+        'APN': ['100-01', '100-02', None, '100-04', '100-05'],
+        'Score': [1.5, None, 3.0, 4.25, 5.0],
+        'PriorityId': [7, 11, 99, 7, 11],
+        'HasLiens': [True, False, True, False, False],
+        'Last Sale Date': pd.to_datetime(['2010-05-01', None, '2004-07-15', '2000-01-01', '2012-01-01'])
+    })
+
+
+def test_matches_to_excel_across_chunks(tmp_path):
+    df = _sample_frame()
+    df.to_excel(tmp_path / 'expected.xlsx', index=False, sheet_name='Data')
+
+    rows = write_excel_streaming(df, tmp_path / 'streamed.xlsx', sheet_name='Data', chunk_size=2)
+
+    assert rows == len(df)
+    expected = pd.read_excel(tmp_path / 'expected.xlsx', sheet_name='Data')
+    pd.testing.assert_frame_equal(pd.read_excel(tmp_path / 'streamed.xlsx', sheet_name='Data'), expected)
+
+
+def test_writes_parquet_source_in_column_order(tmp_path):
+    df = _sample_frame()
+    write_columnar(df, tmp_path / 'data.parquet')
+
+    write_excel_streaming(tmp_path / 'data.parquet', tmp_path / 'out.xlsx', chunk_size=2,
+                          columns=['PriorityId', 'APN'])
+
+    result = pd.read_excel(tmp_path / 'out.xlsx')
+    assert list(result.columns) == ['PriorityId', 'APN']
+    assert list(result['PriorityId']) == [7, 11, 99, 7, 11]
+
+
+def test_empty_frame_writes_header_only(tmp_path):
+    write_excel_streaming(_sample_frame().iloc[0:0], tmp_path / 'empty.xlsx')
+
+    result = pd.read_excel(tmp_path / 'empty.xlsx')
+    assert result.empty
+    assert list(result.columns) == list(_sample_frame().columns)
+
+
+def test_chunks_are_typed_like_read_excel_and_indexed_by_row(tmp_path):
+    df = _sample_frame()
+    df.to_excel(tmp_path / 'data.xlsx', index=False)
+
+    chunks = list(iter_table_chunks(tmp_path / 'data.xlsx', chunk_size=2))
+
+    assert [list(chunk.index) for chunk in chunks] == [[0, 1], [2, 3], [4]]
+    pd.testing.assert_frame_equal(next(iter_table_chunks(tmp_path / 'data.xlsx', chunk_size=10)),
+                                  pd.read_excel(tmp_path / 'data.xlsx'))
+
+    keys = pd.concat(iter_table_chunks(tmp_path / 'data.xlsx', chunk_size=2, columns=['APN', 'Missing']))
+    assert list(keys.columns) == ['APN']
@@ -0,0 +1,54 @@
+from datetime import datetime
+
+from openpyxl import Workbook, load_workbook
+
+from monthly_processing_v2 import _cleanup_fips_mismatches
+
+HEADER = ('APN', 'FIPS', 'Owner', 'Amount', 'Recorded')
+ROWS = [
+    ('00313-0419', 51770, 'SMITH, JOHN', 125000.5, datetime(2021, 3, 4)),
+    ('120-0001', '51161', 'JONES', 99000, datetime(2019, 7, 1)),
+    ('0007', '51770', "O'HARA & SONS", None, datetime(2020, 1, 2, 15, 30)),
+    ('5-5', None, 'BLANK FIPS', 1, None),
+]
+
+
+def _write_workbook(path, rows):
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.append(HEADER)
+    for row in rows:
+        worksheet.append(row)
+    workbook.save(path)
+
+
+def _read_rows(path):
+    workbook = load_workbook(path, read_only=True)
+    try:
+        return list(workbook.worksheets[0].iter_rows(values_only=True))
+    finally:
+        workbook.close()
+
+
+def test_cleanup_keeps_matching_rows_unchanged_and_backs_up_the_original(tmp_path):
+    liens = tmp_path / 'liens.xlsx'
+    _write_workbook(liens, ROWS)
+    original_bytes = liens.read_bytes()
+
+    assert _cleanup_fips_mismatches(tmp_path, '51770', [{'file': 'liens.xlsx'}])
+
+    assert (tmp_path / 'liens.xlsx.backup').read_bytes() == original_bytes
+    # Matching rows keep their cell values and types: text APNs keep leading zeros, dates stay dates
+    assert _read_rows(liens) == [HEADER, ROWS[0], ROWS[2]]
+    assert not list(tmp_path.glob('.*cleaning'))
+
+
+def test_cleanup_refuses_to_empty_a_file(tmp_path):
+    liens = tmp_path / 'liens.xlsx'
+    _write_workbook(liens, ROWS[1:2])
+    original_bytes = liens.read_bytes()
+
+    assert not _cleanup_fips_mismatches(tmp_path, '51770', [{'file': 'liens.xlsx'}])
+
+    assert liens.read_bytes() == original_bytes
+    assert not list(tmp_path.glob('.*cleaning'))
@@ -0,0 +1,45 @@
+import json
+import pandas as pd
+
+from excel_streaming import scan_column
+from multi_region_config import MultiRegionConfigManager
+from region_catalog import normalize_fips_value
+
+
+def test_scan_counts_every_row_of_one_column(tmp_path):
+    workbook = tmp_path / 'liens.xlsx'
+    fips = [51770.0] * 2998 + [51161, None]
+    pd.DataFrame({'APN': range(3000), 'FIPS': fips}).to_excel(workbook, index=False)
+
+    scan = scan_column(workbook, 'FIPS', normalize=normalize_fips_value)
+
+    assert scan.columns == ['APN', 'FIPS']
+    assert scan.row_count == 3000
+    assert dict(scan.value_counts) == {'51770': 2998, '51161': 1}
+    assert scan.blank_count == 1
+    missing = scan_column(workbook, 'Property FIPS')
+    assert (missing.value_counts, missing.row_count) == (None, 3000)
+
+
+def test_validation_reports_mismatches_past_the_first_rows(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    region_dir = tmp_path / 'regions' / 'roanoke_city_va'
+    region_dir.mkdir(parents=True)
+    (region_dir / 'config.json').write_text(json.dumps({
+        'region_name': 'Roanoke City, VA', 'region_code': 'ROAK', 'fips_code': '51770',
+        'region_input_date1': '2017-09-03', 'region_input_date2': '2024-09-03',
+        'region_input_amount1': 75000, 'region_input_amount2': 200000
+    }))
+    pd.DataFrame({'APN': range(2000), 'FIPS': [51770] * 1997 + [51161] * 3}).to_excel(
+        region_dir / 'roanoke_main_region.xlsx', index=False)
+    pd.DataFrame({'APN': ['1'], 'FIPS': [51770]}).to_excel(region_dir / 'liens.xlsx', index=False)
+
+    validation = MultiRegionConfigManager('regions').validate_fips_codes('roanoke_city_va')
+
+    assert not validation['all_valid']
+    assert (validation['files_checked'], validation['files_valid']) == (2, 1)
+    assert validation['fips_histogram'] == {'51770': 1998, '51161': 3}
+    assert validation['mismatched_rows'] == 3
+    mismatch, = validation['fips_mismatches']
+    assert mismatch['file'] == 'roanoke_main_region.xlsx'
+    assert (mismatch['mismatch_counts'], mismatch['matching_rows']) == ({'51161': 3}, 1997)
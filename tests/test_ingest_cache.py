@@ -0,0 +1,93 @@
+import os
+
+import pandas as pd
+
+import input_fingerprint
+from ingest_cache import IngestCache
+from input_fingerprint import fingerprint_file
+
+
+def _write_workbook(path, df):
+    df.to_excel(path, index=False)
+    return path
+
+
+def test_second_read_is_served_from_cache(tmp_path):
+    workbook = _write_workbook(tmp_path / 'liens.xlsx', pd.DataFrame({'APN': ['1', '2'], 'FIPS': [51770, 51770]}))
+    cache = IngestCache(cache_dir=tmp_path / 'cache')
+
+    first = cache.read_excel(workbook, dtype={'FIPS': 'category'})
+    second = cache.read_excel(workbook, dtype={'FIPS': 'category'})
+
+    assert (cache.misses, cache.hits) == (1, 1)
+    pd.testing.assert_frame_equal(first, second)
+
+    assert isinstance(second['FIPS'].dtype, pd.CategoricalDtype)
+
+    # Category dtypes are applied after loading and share the entry; other parse options don't
+    cache.read_excel(workbook)
+    cache.read_excel(workbook, dtype={'FIPS': str})
+    assert (cache.misses, cache.hits, len(cache.entries())) == (2, 2, 2)
+
+
+def test_changed_content_is_parsed_again(tmp_path):
+    workbook = _write_workbook(tmp_path / 'liens.xlsx', pd.DataFrame({'APN': ['1']}))
+    cache = IngestCache(cache_dir=tmp_path / 'cache')
+    cache.read_excel(workbook)
+
+    _write_workbook(workbook, pd.DataFrame({'APN': ['1', '2']}))
+
+    assert len(cache.read_excel(workbook)) == 2
+    assert cache.misses == 2
+
+
+def test_mixed_type_column_is_not_cached(tmp_path):
+    workbook = _write_workbook(tmp_path / 'main.xlsx', pd.DataFrame({'Mailing Unit #': [5, 'B', None]}))
+    cache = IngestCache(cache_dir=tmp_path / 'cache')
+
+    df = cache.read_excel(workbook)
+
+    assert list(df['Mailing Unit #'][:2]) == [5, 'B']
+    assert cache.entries() == []
+
+
+def test_evicts_least_recently_used_and_expired_entries(tmp_path):
+    cache = IngestCache(cache_dir=tmp_path / 'cache')
+    for name in ['a', 'b', 'c']:
+        cache.read_excel(_write_workbook(tmp_path / f'{name}.xlsx', pd.DataFrame({'APN': [name] * 50})))
+    oldest, middle, newest = cache.entries()
+    os.utime(oldest, (0, 0))
+
+    # Age limit removes the entry unused since 1970, size limit the least recently used of the rest
+    removed = cache.evict(max_size_bytes=newest.stat().st_size, max_age_seconds=365 * 24 * 60 * 60)
+
+    assert removed == 2
+    assert cache.entries() == [newest]
+
+
+def test_unchanged_workbooks_are_not_rehashed(tmp_path, monkeypatch):
+    workbook = _write_workbook(tmp_path / 'liens.xlsx', pd.DataFrame({'APN': ['1', '2']}))
+    catalog_fingerprint = fingerprint_file(workbook)
+    hashed = []
+    hash_file = input_fingerprint.hash_file
+    monkeypatch.setattr(input_fingerprint, 'hash_file', lambda path: hashed.append(path.name) or hash_file(path))
+
+    IngestCache(cache_dir=tmp_path / 'cache').read_excel(workbook)
+    assert hashed == ['liens.xlsx']
+
+    # Another run reuses the stored fingerprint and is still served from the entry
+    later_run = IngestCache(cache_dir=tmp_path / 'cache')
+    later_run.read_excel(workbook)
+    assert hashed == ['liens.xlsx']
+    assert later_run.hits == 1
+
+    # Fingerprints from the region catalog are used the same way
+    with_catalog = IngestCache(cache_dir=tmp_path / 'other_cache')
+    with_catalog.add_fingerprints({workbook: catalog_fingerprint})
+    with_catalog.read_excel(workbook)
+    assert hashed == ['liens.xlsx']
+
+    # A rewritten workbook is hashed and parsed again
+    _write_workbook(workbook, pd.DataFrame({'APN': ['1', '2', '3']}))
+    assert len(later_run.read_excel(workbook)) == 3
+    assert hashed == ['liens.xlsx', 'liens.xlsx']
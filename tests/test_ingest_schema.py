@@ -0,0 +1,62 @@
+import pandas as pd
+
+from ingest_schema import MAIN_EXPORT_SCHEMA, niche_schema
+from input_adapters import iter_input_chunks, read_input
+
+
+def _export_frame():
+    return pd.DataFrame({
+        'Owner 1 Last Name': ['SMITH', 'JONES', None],
+        'Address': ['12 MAIN ST', '40 OAK AVE', '7 ELM CT'],
+        'City': ['ROANOKE', 'ROANOKE', 'SALEM'],
+        'Zip': [24012, 24013, 24153],
+        'APN': ['0100-01', '0100-02', '0100-03'],
+        'Last Sale Date': ['2020-07-29', None, 'unknown'],
+        'Last Sale Amount': [125000.0, None, 89000.0],
+        'Lien Amount': [1520.37, None, None],
+        'FIPS': [51770, 51770, 51770],
+    })
+
+
+def test_csv_is_parsed_into_declared_dtypes(tmp_path):
+    path = tmp_path / 'main.csv'
+    _export_frame().to_csv(path, index=False)
+
+    df = read_input(path, schema=MAIN_EXPORT_SCHEMA)
+
+    assert isinstance(df['City'].dtype, pd.CategoricalDtype)
+    assert isinstance(df['FIPS'].dtype, pd.CategoricalDtype)
+    assert str(df['Zip'].dtype) == 'Int32'
+    assert df['Last Sale Amount'].dtype == 'float32'
+    assert df['Lien Amount'].dtype == 'float64'
+    assert df['APN'].tolist() == ['0100-01', '0100-02', '0100-03']
+    assert pd.api.types.is_datetime64_any_dtype(df['Last Sale Date'])
+    assert df['Last Sale Date'].isna().tolist() == [False, True, True]
+
+
+def test_column_that_does_not_fit_is_kept_as_parsed(tmp_path):
+    frame = _export_frame()
+    frame['Zip'] = ['24012', '24013-1234', None]
+    path = tmp_path / 'main.csv'
+    frame.to_csv(path, index=False)
+
+    df = read_input(path, schema=MAIN_EXPORT_SCHEMA)
+    chunks = list(iter_input_chunks(path, 2, schema=MAIN_EXPORT_SCHEMA))
+
+    assert df['Zip'].tolist()[:2] == ['24012', '24013-1234']
+    assert df['Last Sale Amount'].dtype == 'float32'
+    assert isinstance(df['City'].dtype, pd.CategoricalDtype)
+    assert pd.concat(chunks)['APN'].tolist() == frame['APN'].tolist()
+
+
+def test_government_niche_columns_stay_text(tmp_path):
+    frame = pd.DataFrame({'Address': ['12 MAIN ST'], 'Parcel ID': ['0012345'], 'Zip': [''],
+                          'Last Sale Amount': ['$125,000'], 'FIPS': ['51770']})
+    path = tmp_path / 'roanoke_city_va_code_enforcement_20250225.parquet'
+    frame.to_parquet(path, index=False)
+
+    df = read_input(path, schema=niche_schema('CodeEnforcement'))
+
+    assert df['Parcel ID'].tolist() == ['0012345']
+    assert df['Last Sale Amount'].tolist() == ['$125,000']
+    assert niche_schema('Liens') is MAIN_EXPORT_SCHEMA
@@ -0,0 +1,66 @@
+import pandas as pd
+
+from ingest_cache import IngestCache
+from input_adapters import discover_input_files, filter_input_rows, iter_input_chunks, read_input, scan_input_column
+
+
+def _sample_frame():
+    return pd.DataFrame({
+        'APN': ['0100-01', '0100-02', '0100-03', '0100-04', '0100-05'],
+        'FIPS': ['51770', '51770', '51161', '51770', None],
+        'Last Sale Amount': [125000.0, None, 89000.0, 240000.0, 51000.0],
+    })
+
+
+def _write_all_formats(df, directory):
+    df.to_excel(directory / 'main.xlsx', index=False)
+    df.to_csv(directory / 'main.csv', index=False)
+    df.to_parquet(directory / 'main.parquet', index=False)
+    df.to_feather(directory / 'main.feather')
+
+
+def test_discovery_prefers_columnar_formats(tmp_path):
+    _write_all_formats(_sample_frame(), tmp_path)
+    _sample_frame().to_csv(tmp_path / 'liens.csv', index=False)
+    _sample_frame().to_excel(tmp_path / 'landlords.xlsx', index=False)
+    (tmp_path / '~$landlords.xlsx').write_bytes(b'')
+    (tmp_path / 'liens.csv.backup').write_bytes(b'')
+
+    names = [path.name for path in discover_input_files(tmp_path)]
+
+    assert names == ['landlords.xlsx', 'liens.csv', 'main.parquet']
+
+
+def test_formats_load_and_chunk_alike(tmp_path):
+    df = _sample_frame()
+    _write_all_formats(df, tmp_path)
+    text_columns = {'APN': str, 'FIPS': str}
+    cache = IngestCache(cache_dir=tmp_path / 'cache')
+
+    for suffix in ('.xlsx', '.csv', '.parquet', '.feather'):
+        path = tmp_path / f'main{suffix}'
+        loaded = read_input(path, dtype=text_columns, cache=cache)
+        pd.testing.assert_frame_equal(loaded, df, check_dtype=False)
+
+        chunks = list(iter_input_chunks(path, 2, columns=['APN', 'Last Sale Amount'], dtype=text_columns))
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        combined = pd.concat(chunks)
+        assert list(combined.index) == [0, 1, 2, 3, 4]
+        assert combined['APN'].tolist() == df['APN'].tolist()
+
+
+def test_scan_and_filter_csv(tmp_path):
+    path = tmp_path / 'liens.csv'
+    _sample_frame().to_csv(path, index=False)
+
+    scan = scan_input_column(path, 'FIPS')
+    assert scan.row_count == 5
+    assert scan.blank_count == 1
+    assert scan.value_counts == {'51770': 3, '51161': 1}
+
+    result = filter_input_rows(path, tmp_path / 'cleaned.csv', 'FIPS', keep=lambda fips: fips == '51770')
+    assert result['kept'] == 3
+    assert result['removed'] == {'51161': 1, '': 1}
+
+    cleaned = pd.read_csv(tmp_path / 'cleaned.csv', dtype=str)
+    assert cleaned['APN'].tolist() == ['0100-01', '0100-02', '0100-04']
@@ -0,0 +1,63 @@
+from input_fingerprint import RegionRunManifest, fingerprint_file
+
+
+def _saved_manifest(tmp_path):
+    input_file = tmp_path / 'main_region.xlsx'
+    input_file.write_bytes(b'main data')
+    output_file = tmp_path / 'rc_main_region_enhanced.parquet'
+    output_file.write_bytes(b'enhanced')
+
+    manifest = RegionRunManifest('roanoke_city_va', output_root=tmp_path)
+    inputs = {input_file.name: fingerprint_file(input_file)}
+    options = {'export_excel': True, 'delta': False, 'chunk_size': None, 'scoring_date': '2025-09-01'}
+    manifest.save(inputs, {'main_output': str(output_file)}, {'output_file': str(output_file)},
+                  run_options=options, output_month='2025_09')
+    return manifest, inputs, options, input_file, output_file
+
+
+def test_unchanged_run_reuses_previous_output(tmp_path):
+    manifest, inputs, options, _, _ = _saved_manifest(tmp_path)
+
+    reuse = manifest.check_reuse(inputs, run_options=dict(options), output_month='2025_09')
+
+    assert reuse['reuse']
+    assert reuse['manifest']['run_options'] == options
+
+
+def test_changed_inputs_options_month_or_outputs_reprocess(tmp_path):
+    manifest, inputs, options, input_file, output_file = _saved_manifest(tmp_path)
+
+    no_excel = manifest.check_reuse(inputs, run_options={**options, 'export_excel': False}, output_month='2025_09')
+    assert not no_excel['reuse']
+    assert 'export_excel True -> False' in no_excel['reason']
+
+    for changed in ({'delta': True}, {'chunk_size': 50000}):
+        assert not manifest.check_reuse(inputs, run_options={**options, **changed}, output_month='2025_09')['reuse']
+
+    # Scores depend on the run date: a later day of the same month reprocesses
+    later_day = manifest.check_reuse(inputs, run_options={**options, 'scoring_date': '2025-09-15'},
+                                     output_month='2025_09')
+    assert not later_day['reuse']
+    assert 'scoring_date 2025-09-01 -> 2025-09-15' in later_day['reason']
+
+    new_month = manifest.check_reuse(inputs, run_options=options, output_month='2025_10')
+    assert not new_month['reuse']
+    assert '2025_09 -> 2025_10' in new_month['reason']
+
+    input_file.write_bytes(b'new main data')
+    changed_inputs = {input_file.name: fingerprint_file(input_file)}
+    assert 'inputs changed' in manifest.check_reuse(changed_inputs, run_options=options,
+                                                    output_month='2025_09')['reason']
+
+    output_file.unlink()
+    assert 'previous output missing' in manifest.check_reuse(inputs, run_options=options,
+                                                             output_month='2025_09')['reason']
+
+
+def test_manifest_without_options_is_not_reused(tmp_path):
+    manifest = RegionRunManifest('roanoke_city_va', output_root=tmp_path)
+
+    assert manifest.check_reuse({})['reason'] == 'no previous run recorded'
+    # Manifests written before options were recorded can't prove the output matches
+    legacy = {'inputs': {}, 'outputs': {}, 'recorded_at': '2025-09-01T08:00:00'}
+    assert not manifest.check_reuse({}, legacy, {'export_excel': True}, '2025_09')['reuse']
@@ -0,0 +1,53 @@
+import pandas as pd
+import pytest
+
+from memory_budget import MIN_CHUNK_ROWS, MemoryBudget, MemoryBudgetExceeded, frame_bytes
+from monthly_processing_v2 import RunWorkbookCache
+
+
+def make_frame(rows):
+    return pd.DataFrame({
+        'APN': [f'100-{i:05d}' for i in range(rows)],
+        'Address': [f'{i} MAIN ST' for i in range(rows)],
+        'Zip': [24012] * rows
+    })
+
+
+def test_budget_decides_between_memory_and_chunks(tmp_path):
+    df = make_frame(5000)
+    main_file = tmp_path / 'main.csv'
+    df.to_csv(main_file, index=False)
+    row_bytes = MemoryBudget(1).row_bytes(main_file)
+    assert row_bytes > 0
+
+    roomy = MemoryBudget(64)
+    assert roomy.fits_in_memory(frame_bytes(df))
+    roomy.check('main data', df)
+    assert roomy.chunk_rows(row_bytes, 50000) == 50000
+
+    tight = MemoryBudget(0.5)
+    assert not tight.fits_in_memory(frame_bytes(df))
+    with pytest.raises(MemoryError):
+        tight.check('main data', df)
+    with pytest.raises(MemoryBudgetExceeded):
+        tight.check('main data', df)
+    assert MIN_CHUNK_ROWS <= tight.chunk_rows(row_bytes, 50000) < 5000
+
+
+def test_workbook_cache_spills_past_memory_limit(tmp_path):
+    files = []
+    for name in ('liens', 'probate', 'landlords'):
+        files.append(tmp_path / f'{name}.csv')
+        make_frame(2000).to_csv(files[-1], index=False)
+
+    one_frame = frame_bytes(pd.read_csv(files[0]))
+    workbooks = RunWorkbookCache(memory_limit_bytes=int(one_frame * 1.5))
+    try:
+        frames = [workbooks.read_input(file) for file in files]
+        assert len(workbooks.frames) == 1
+        assert len(workbooks.spilled) == 2
+        assert workbooks.memory_bytes() <= int(one_frame * 1.5)
+        # Spilled frames are served again from disk
+        assert workbooks.read_input(files[2]).equals(frames[2])
+    finally:
+        workbooks.close()
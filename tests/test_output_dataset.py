@@ -0,0 +1,53 @@
+import pandas as pd
+
+from output_dataset import flagged_properties, partition_files, publish_output, query_dataset
+
+
+def make_output(tax_flags, zips):
+    return pd.DataFrame({
+        'APN': ['100-01', '100-02', ''],
+        'Address': ['1 MAIN ST', '2 MAIN ST', '3 Main St'],
+        'Zip': zips,
+        'PriorityCode': ['ABS1', 'OWN1', 'DEFAULT'],
+        'HasCurrentTax': tax_flags,
+        'HasLiens': [False, True, False]
+    })
+
+
+def publish(df, tmp_path, region_key, month):
+    output_file = tmp_path / 'output' / region_key / month / f'{region_key}_main_region_enhanced.parquet'
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(output_file)
+    return publish_output(output_file, region_key, dataset_root=tmp_path / 'dataset')
+
+
+def test_publish_replaces_partition_and_queries_filter(tmp_path):
+    dataset = tmp_path / 'dataset'
+    publish(make_output([True, False, True], [24012, 24013, 24014]), tmp_path, 'roanoke_city_va', '2025_08')
+    publish(make_output([False, False, False], [24012, 24013, 24014]), tmp_path, 'roanoke_city_va', '2025_09')
+    # Re-run of the same month replaces the partition; Zip changes type between months
+    publish(make_output([True, True, True], ['24012', '24013-1234', '']), tmp_path, 'roanoke_city_va', '2025_09')
+    publish(make_output([True, False, False], [24501, 24502, 24503]), tmp_path, 'lynchburg_city_va', '2025_09')
+
+    assert len(partition_files(dataset)) == 3
+
+    taxed = query_dataset(flags=['HasCurrentTax'], dataset_root=dataset)
+    assert len(taxed) == 6
+    assert set(taxed['region']) == {'roanoke_city_va', 'lynchburg_city_va'}
+
+    september = query_dataset(regions=['roanoke_city_va'], since='2025-09', priority_codes=['OWN1'],
+                              flags=['HasLiens'], columns=['APN', 'Zip'], dataset_root=dataset)
+    assert list(september.columns) == ['APN', 'Zip', 'region', 'month']
+    assert september[['APN', 'Zip', 'month']].values.tolist() == [['100-02', '24013-1234', '2025_09']]
+
+
+def test_flagged_properties_counts_months_per_property(tmp_path):
+    publish(make_output([True, False, True], [1, 2, 3]), tmp_path, 'roanoke_city_va', '2025_07')
+    publish(make_output([True, True, True], [1, 2, 3]), tmp_path, 'roanoke_city_va', '2025_08')
+    publish(make_output([True, False, False], [1, 2, 3]), tmp_path, 'roanoke_city_va', '2025_09')
+
+    result = flagged_properties('HasCurrentTax', min_months=2, dataset_root=tmp_path / 'dataset')
+
+    assert result['PropertyKey'].tolist() == ['APN:100-01', 'ADDR:3 MAIN ST']
+    assert result['months'].tolist() == [3, 2]
+    assert result[['first_month', 'last_month']].values.tolist() == [['2025_07', '2025_09'], ['2025_07', '2025_08']]
@@ -0,0 +1,70 @@
+import json
+import pandas as pd
+from pathlib import Path
+
+from columnar_io import read_columnar
+from monthly_processing_v2 import process_region
+from multi_region_config import MultiRegionConfigManager
+from owner_locations import assign_primary_locations
+
+
+def test_primary_location_prefers_priority_then_distress_flags():
+    df = pd.DataFrame({
+        'Owner 1 Last Name': ['SMITH', 'Smith', 'SMITH', 'JONES', None],
+        'Owner 1 First Name': ['JOHN', 'John', 'JOHN', 'MARY', None],
+        'Mailing Address': ['PO BOX 5', 'po box  5', 'PO BOX 5', 'PO BOX 5', None],
+        'PriorityId': [11, 7, 7, 11, 99],
+        'HasLiens': [True, False, True, False, False],
+        'HasProbate': [True, False, False, False, False]
+    })
+
+    result = assign_primary_locations(df)
+
+    # Same owner across rows 0-2: best PriorityId (7) wins, then the extra lien flag
+    assert list(result['IsPrimaryLocation']) == [False, False, True, True, True]
+    assert list(result['OwnerPropertyCount']) == [3, 3, 3, 1, 1]
+
+
+def _write_region(tmp_path):
+    region_dir = tmp_path / 'regions' / 'roanoke_city_va'
+    region_dir.mkdir(parents=True)
+    (region_dir / 'config.json').write_text(json.dumps({
+        'region_name': 'Roanoke City, VA', 'region_code': 'ROAK', 'fips_code': '51770',
+        'region_input_date1': '2017-09-03', 'region_input_date2': '2024-09-03',
+        'region_input_amount1': 75000, 'region_input_amount2': 200000
+    }))
+    owners = [('SMITH', 'JOHN', 'PO BOX 5'), ('Smith', 'John', 'po box  5'), ('JONES', 'MARY', '9 ELM ST'),
+              ('SMITH', 'JOHN', 'PO BOX 5'), (None, None, None), ('JONES', 'MARY', '9 ELM ST'), ('LEE', 'ANN', '1 OAK ST')]
+    pd.DataFrame({
+        'APN': [f'100-{i:04d}' for i in range(len(owners))],
+        'FIPS': [51770] * len(owners),
+        'Address': [f'{i + 10} MAIN ST' for i in range(len(owners))],
+        'City': ['ROANOKE'] * len(owners),
+        'Owner 1 Last Name': [owner[0] for owner in owners],
+        'Owner 1 First Name': [owner[1] for owner in owners],
+        'Mailing Address': [owner[2] for owner in owners],
+        'Last Sale Date': pd.to_datetime(['2010-01-05', '2020-06-01', '2005-03-03', '2023-02-01',
+                                          '2015-05-05', '2012-12-12', '2019-09-09']),
+        'Last Sale Amount': [50000, 250000, 40000, 90000, 120000, 60000, 300000],
+    }).to_excel(region_dir / 'roanoke_main_region.xlsx', index=False)
+    pd.DataFrame({'APN': ['100-0003', '100-0005'], 'FIPS': [51770, 51770],
+                  'Address': ['13 MAIN ST', '15 MAIN ST']}).to_excel(region_dir / 'liens.xlsx', index=False)
+
+
+def test_chunked_output_has_the_same_primary_locations_as_in_memory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_region(tmp_path)
+    config_manager = MultiRegionConfigManager('regions')
+
+    outputs = []
+    for chunk_size in (None, 2):
+        result = process_region('roanoke_city_va', config_manager, interactive=False, force=True,
+                                export_excel=False, chunk_size=chunk_size)
+        assert result['success'], result.get('error')
+        outputs.append(read_columnar(Path(result['output_file'])).sort_values('APN', ignore_index=True))
+    in_memory, chunked = outputs
+
+    assert list(chunked.columns) == list(in_memory.columns)
+    columns = ['APN', 'IsPrimaryLocation', 'OwnerPropertyCount']
+    pd.testing.assert_frame_equal(chunked[columns], in_memory[columns])
+    assert in_memory['OwnerPropertyCount'].tolist() == [3, 3, 2, 3, 1, 2, 1]
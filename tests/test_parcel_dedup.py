@@ -0,0 +1,29 @@
+import pandas as pd
+
+from parcel_dedup import dedupe_parcels, KEPT_ROW_COLUMN, PARCEL_KEY_COLUMN
+
+
+def test_keeps_addressed_then_earliest_sale_and_audits_dropped_rows():
+    df = pd.DataFrame({
+        'APN': ['100-01', '100-01', '100-01', '100-02', None, None],
+        'Address': ['1 MAIN ST', '', '1 MAIN ST', '2 MAIN ST', '3 OAK AVE', '3 oak ave'],
+        'Last Sale Date': ['2010-05-01', '2001-01-01', '2004-07-15', '2000-01-01', '2012-01-01', '1999-03-01']
+    })
+
+    deduped, audit = dedupe_parcels(df)
+
+    # Blank address loses even with the earliest sale; rows without an APN dedupe on the address
+    assert list(deduped.index) == [2, 3, 5]
+    assert sorted(audit.index) == [0, 1, 4]
+    assert audit.loc[1, PARCEL_KEY_COLUMN] == 'APN:100-01'
+    assert audit.loc[1, KEPT_ROW_COLUMN] == 2
+    assert audit.loc[4, KEPT_ROW_COLUMN] == 5
+
+
+def test_no_duplicates_returns_input_unchanged():
+    df = pd.DataFrame({'APN': ['1', '2'], 'Address': ['1 MAIN ST', '2 MAIN ST'], 'Last Sale Date': [None, None]})
+
+    deduped, audit = dedupe_parcels(df)
+
+    assert deduped is df
+    assert audit.empty
@@ -0,0 +1,42 @@
+import pandas as pd
+
+from monthly_processing_v2 import _update_main_with_niche
+from parcel_keys import MISSING_PARCEL_ID, ParcelIndex, base_parcel_keys, parcel_keys
+
+
+def test_parcel_formats_share_one_key_and_id():
+    ids = pd.Series(['313-0419', '313.0419 ', '03130419', 3130419.0, None, '3130419A', '', 'nan'])
+
+    keys = parcel_keys(ids)
+    assert keys.tolist() == ['3130419'] * 4 + ['', '3130419A', '', '']
+    assert base_parcel_keys(keys).tolist()[5] == '3130419'
+    assert parcel_keys(ids, strip_suffix=True).tolist()[5] == '3130419'
+
+    index = ParcelIndex()
+    assert index.ids(ids, register=True).tolist() == [0, 0, 0, 0, MISSING_PARCEL_ID, 1, MISSING_PARCEL_ID,
+                                                      MISSING_PARCEL_ID]
+    # Lookups don't register unseen parcels
+    assert index.ids(pd.Series(['3130-419', '999'])).tolist() == [0, MISSING_PARCEL_ID]
+    assert len(index) == 2
+    assert index.frame_ids(pd.DataFrame({'Parcel ID': ['0003130419A']})).tolist() == [1]
+    assert index.frame_ids(pd.DataFrame({'Address': ['1 MAIN ST']})).tolist() == [MISSING_PARCEL_ID]
+
+
+def test_niche_records_match_main_by_parcel_or_address():
+    main = pd.DataFrame({
+        'APN': ['313-0419', '120-0001', ''],
+        'Address': ['10 MAIN ST', '22 OAK AVE', '5 ELM RD'],
+        'HasLiens': [False, False, False]
+    })
+    niche = pd.DataFrame({
+        'Parcel ID': ['3130419', '', '7770001'],
+        'Address': ['10 Main Street Unit 1', '5 Elm Road', '9 Pine Ln'],
+        'Owner 1 Last Name': ['SMITH', 'JONES', 'BROWN'],
+        'Owner 1 First Name': ['JOHN', 'MARY', 'ANN']
+    })
+
+    result, updates, inserts = _update_main_with_niche(main, niche, 'Liens')
+
+    assert (updates, inserts) == (2, 1)
+    assert result['HasLiens'].tolist() == [True, False, True, True]
+    assert result['Address'].tolist()[-1] == '9 Pine Ln'
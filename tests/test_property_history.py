@@ -0,0 +1,54 @@
+import pandas as pd
+
+from property_history import PropertyHistoryStore
+
+
+def make_output():
+    return pd.DataFrame({
+        'APN': ['100-01', '100-02', ''],
+        'Address': ['1 MAIN ST', '2 MAIN ST', '3 Main St'],
+        'Owner 1 Last Name': ['SMITH', 'JONES', 'BROWN'],
+        'Mailing Zip': [24012.0, 24013.0, None],
+        'Last Sale Date': pd.to_datetime(['2005-03-01', '2021-06-15', None]),
+        'PriorityCode': ['ABS1', 'OWN1', 'DEFAULT'],
+        'HasLiens': [False, True, False]
+    })
+
+
+def test_versions_open_and_close_with_changes(tmp_path):
+    store = PropertyHistoryStore('roanoke_city_va', output_root=tmp_path)
+    assert store.update(make_output(), '2025_07') == {'new': 3, 'changed': 0, 'removed': 0, 'unchanged': 0}
+
+    august = make_output()
+    august.loc[0, 'HasLiens'] = True
+    assert store.update(august, '2025_08') == {'new': 0, 'changed': 1, 'removed': 0, 'unchanged': 2}
+
+    september = august.drop(index=2)
+    september.loc[1, 'Owner 1 Last Name'] = 'GARCIA'
+    assert store.update(september, '2025_09') == {'new': 0, 'changed': 1, 'removed': 1, 'unchanged': 1}
+
+    history = store.history()
+    apn_1 = history[history['PropertyKey'] == 'APN:100-01']
+    assert apn_1[['ValidFrom', 'ValidTo', 'HasLiens']].values.tolist() == [
+        ['2025_07', '2025_08', 'False'], ['2025_08', '', 'True']]
+    assert apn_1['Last Sale Date'].tolist() == ['2005-03-01', '2005-03-01']
+    assert apn_1['Mailing Zip'].tolist() == ['24012', '24012']
+    removed = history[history['PropertyKey'] == 'ADDR:3 MAIN ST']
+    assert removed[['ValidFrom', 'ValidTo']].values.tolist() == [['2025_07', '2025_09']]
+    assert len(store.current_versions()) == 2
+
+
+def test_rerunning_a_month_replaces_its_update(tmp_path):
+    store = PropertyHistoryStore('roanoke_city_va', output_root=tmp_path)
+    store.update(make_output(), '2025_07')
+    august = make_output()
+    august.loc[0, 'PriorityCode'] = 'OWN20'
+    store.update(august, '2025_08')
+
+    # Same month again, e.g. after skip trace set a flag on another property
+    august.loc[1, 'HasLiens'] = False
+    assert store.update(august, '2025_08') == {'new': 0, 'changed': 2, 'removed': 0, 'unchanged': 1}
+
+    history = store.history()
+    assert len(history) == 5
+    assert history.groupby('PropertyKey')['ValidTo'].apply(lambda valid_to: (valid_to == '').sum()).eq(1).all()
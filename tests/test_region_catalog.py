@@ -0,0 +1,38 @@
+import pandas as pd
+
+import region_catalog
+from region_catalog import RegionInputCatalog
+
+
+def test_only_new_or_changed_files_are_recataloged(tmp_path, monkeypatch):
+    region_dir = tmp_path / 'regions' / 'roanoke_city_va'
+    region_dir.mkdir(parents=True)
+    pd.DataFrame({'APN': ['1', '2', '3'], 'FIPS': [51770, 51770, 51770]}).to_excel(
+        region_dir / 'roanoke_main_region.xlsx', index=False)
+    pd.DataFrame({'APN': ['1'], 'FIPS': ['51770.0']}).to_csv(region_dir / 'liens.csv', index=False)
+
+    cataloged = []
+    catalog_input_file = region_catalog.catalog_input_file
+    monkeypatch.setattr(region_catalog, 'catalog_input_file',
+                        lambda path: cataloged.append(path.name) or catalog_input_file(path))
+
+    catalog = RegionInputCatalog('roanoke_city_va', region_dir, output_root=tmp_path / 'output')
+    entries = catalog.refresh()
+
+    assert sorted(cataloged) == ['liens.csv', 'roanoke_main_region.xlsx']
+    assert entries['roanoke_main_region.xlsx']['row_count'] == 3
+    assert entries['roanoke_main_region.xlsx']['fips_counts'] == {'51770': 3}
+    assert entries['liens.csv']['niche_type'] == 'Liens'
+    assert entries['liens.csv']['fips_counts'] == {'51770': 1}
+    assert catalog.main_file() == region_dir / 'roanoke_main_region.xlsx'
+    assert set(catalog.fingerprints()) == set(entries)
+
+    # A fresh catalog object reads the saved entries; only the changed file is re-read
+    pd.DataFrame({'APN': ['1', '2'], 'FIPS': ['51770', '51161']}).to_csv(region_dir / 'liens.csv', index=False)
+    (region_dir / 'probate.csv').write_bytes(b'')
+    cataloged.clear()
+    entries = RegionInputCatalog('roanoke_city_va', region_dir, output_root=tmp_path / 'output').refresh()
+
+    assert sorted(cataloged) == ['liens.csv', 'probate.csv']
+    assert entries['liens.csv']['fips_counts'] == {'51770': 1, '51161': 1}
+    assert entries['probate.csv']['read_error'] == region_catalog.EMPTY_FILE_ERROR
@@ -0,0 +1,36 @@
+import pandas as pd
+
+from region_stats import compute_region_stats
+
+
+def test_cross_tab_totals_sources_and_quality():
+    df = pd.DataFrame({
+        'Address': ['1 MAIN ST', '2 MAIN ST', '2 main st', ''],
+        'Mailing Address': ['1 MAIN ST', None, 'PO BOX 5', 'PO BOX 9'],
+        'Last Sale Date': ['2005-03-01', 'not a date', None, '2021-06-15'],
+        'PropertyCategory': ['DEVELOPED', 'DEVELOPED', 'RAW_LAND', 'DEVELOPED'],
+        'HasLiens': [True, False, True, True],
+        'HasProbate': [False, False, True, False],
+        'PriorityCode': ['ABS1', 'ABS1', 'LAND1', 'DEFAULT'],
+        'PriorityId': [1, 1, 20, 99],
+        'PriorityName': ['Absentee', 'Absentee', 'Land', 'Liens List Only']
+    })
+
+    stats = compute_region_stats(df)
+
+    cells = {(row['PriorityCode'], row['PropertyCategory']): row for row in stats['priority_category_flags']}
+    assert cells[('ABS1', 'DEVELOPED')]['Records'] == 2
+    assert cells[('ABS1', 'DEVELOPED')]['HasLiens'] == 1
+    assert cells[('LAND1', 'RAW_LAND')]['HasProbate'] == 1
+
+    assert stats['priority_totals'] == {'ABS1': 2, 'LAND1': 1, 'DEFAULT': 1}
+    assert stats['flag_totals']['HasLiens'] == 3
+    assert stats['flag_totals']['AnyDistress'] == 3
+    assert stats['match_sources']['record_source'] == {'Main Region': 3, 'Liens List Only': 1}
+
+    quality = stats['data_quality']
+    assert quality['missing_address'] == 1
+    assert quality['missing_mailing_address'] == 1
+    assert quality['missing_last_sale_date'] == 1
+    assert quality['unparseable_last_sale_date'] == 1
+    assert quality['duplicate_address_records'] == 1
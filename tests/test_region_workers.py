@@ -0,0 +1,46 @@
+import json
+import logging
+import pandas as pd
+import pytest
+
+from monthly_processing_v2 import _close_region_logger, _create_region_logger, process_region
+from multi_region_config import MultiRegionConfigManager
+
+
+def test_regions_log_to_their_own_files(tmp_path):
+    roanoke, roanoke_handler = _create_region_logger('roanoke_city_va', tmp_path / 'roanoke.log')
+    norfolk, norfolk_handler = _create_region_logger('norfolk_city_va', tmp_path / 'norfolk.log')
+    roanoke.setLevel(logging.INFO)
+    norfolk.setLevel(logging.INFO)
+
+    roanoke.info('scoring roanoke')
+    norfolk.info('scoring norfolk')
+    _close_region_logger(roanoke, roanoke_handler)
+    _close_region_logger(norfolk, norfolk_handler)
+
+    assert 'scoring roanoke' in (tmp_path / 'roanoke.log').read_text()
+    assert 'norfolk' not in (tmp_path / 'roanoke.log').read_text()
+    assert 'roanoke' not in (tmp_path / 'norfolk.log').read_text()
+    assert not roanoke.handlers and not norfolk.handlers
+
+
+def test_worker_refuses_the_fips_prompt(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    region_dir = tmp_path / 'regions' / 'roanoke_city_va'
+    region_dir.mkdir(parents=True)
+    (region_dir / 'config.json').write_text(json.dumps({
+        'region_name': 'Roanoke City, VA', 'region_code': 'ROAK', 'fips_code': '51770',
+        'region_input_date1': '2017-09-03', 'region_input_date2': '2024-09-03',
+        'region_input_amount1': 75000, 'region_input_amount2': 200000
+    }))
+    main_file = region_dir / 'roanoke_main_region.xlsx'
+    pd.DataFrame({'APN': ['1', '2'], 'FIPS': [51770, 51161]}).to_excel(main_file, index=False)
+    monkeypatch.setattr('builtins.input', lambda prompt='': pytest.fail('worker prompted for input'))
+
+    result = process_region('roanoke_city_va', MultiRegionConfigManager('regions'), interactive=False)
+
+    assert not result['success']
+    assert 'FIPS' in result['error']
+    # The file is left as it was (cleanup needs --auto-clean-fips)
+    assert pd.read_excel(main_file)['FIPS'].tolist() == [51770, 51161]
+    assert not logging.getLogger('monthly_processing_v2.roanoke_city_va').handlers
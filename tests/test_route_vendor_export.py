@@ -0,0 +1,49 @@
+import json
+import pandas as pd
+
+from multi_region_config import MultiRegionConfigManager
+from tools import route_vendor_export
+from tools.route_vendor_export import route_export
+
+
+def _config_manager(tmp_path):
+    for region_key, region_code, fips in [('roanoke_city_va', 'ROAK', '51770'), ('salem_city_va', 'SALM', '51775')]:
+        region_dir = tmp_path / 'regions' / region_key
+        region_dir.mkdir(parents=True)
+        (region_dir / 'config.json').write_text(json.dumps({
+            'region_name': region_key, 'region_code': region_code, 'fips_code': fips,
+            'region_input_date1': '2017-09-03', 'region_input_date2': '2024-09-03',
+            'region_input_amount1': 75000, 'region_input_amount2': 200000
+        }))
+    return MultiRegionConfigManager(str(tmp_path / 'regions'))
+
+
+def test_rows_are_routed_by_fips_with_unknown_fips_left_over(tmp_path, monkeypatch):
+    monkeypatch.setattr(route_vendor_export, 'UNROUTED_DIR', tmp_path / 'unrouted')
+    config_manager = _config_manager(tmp_path)
+    export = tmp_path / 'liens_all_counties.csv'
+    pd.DataFrame({
+        'FIPS': ['51770', '51775.0', '51770', '99999', '', '51775'],
+        'Parcel ID': ['313-0419', '10-1', '120-0001', '5-5', '6-6', '10-2'],
+    }).to_csv(export, index=False)
+
+    result = route_export(export, config_manager, output_name='liens')
+
+    assert result['success']
+    assert result['total_rows'] == 6
+    assert result['routed'] == {'roanoke_city_va': 2, 'salem_city_va': 2}
+    assert result['unknown_fips'] == {'99999': 1, '': 1}
+
+    roanoke = pd.read_excel(tmp_path / 'regions' / 'roanoke_city_va' / 'liens.xlsx', dtype=str)
+    assert roanoke['Parcel ID'].tolist() == ['313-0419', '120-0001']
+    salem = pd.read_excel(tmp_path / 'regions' / 'salem_city_va' / 'liens.xlsx', dtype=str)
+    assert salem['Parcel ID'].tolist() == ['10-1', '10-2']
+    leftover = tmp_path / 'unrouted' / 'liens_unknown_fips.xlsx'
+    assert result['output_files']['unknown'] == str(leftover)
+    assert pd.read_excel(leftover, dtype=str)['Parcel ID'].tolist() == ['5-5', '6-6']
+
+    # Routed files are not replaced without overwrite
+    refused = route_export(export, config_manager, output_name='liens')
+    assert not refused['success']
+    assert 'already exists' in refused['error']
+    assert route_export(export, config_manager, output_name='liens', overwrite=True)['success']
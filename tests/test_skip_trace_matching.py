@@ -0,0 +1,57 @@
+import pandas as pd
+
+from skip_trace_processor import _match_skip_trace_hybrid
+
+
+def test_apn_matches_fill_golden_fields_and_flags():
+    skip_trace = pd.DataFrame({
+        'Property FIPS': ['51770', '51770', '51770', '51161'],
+        'Property APN': ['313-0419', '120-0001', '120.0001', '313-0419'],
+        'Property Address': ['10 MAIN ST', '22 OAK AVE', '22 OAK AVE', '10 MAIN ST'],
+        'Golden Address': [' 10 MAIN ST ', '1 OLD RD', '99 NEW RD', '5 OTHER RD'],
+        'Golden City': ['ROANOKE', None, 'SALEM', 'VINTON'],
+        'Owner Is Deceased': [0.0, None, 'TRUE', 1.0],
+        'Lien': [pd.Timestamp('2024-03-01'), 'No Data', None, pd.Timestamp('2024-03-01')],
+    })
+    enhanced = pd.DataFrame({
+        'APN': ['3130419', '00120-0001', '555-0000'],
+        'Address': ['10 Main Street', '22 Oak Avenue', '7 ELM RD'],
+        'Mailing Address': ['10 MAIN ST', '22 OAK AVE', None],
+    })
+
+    result = _match_skip_trace_hybrid(enhanced, skip_trace, '51770')
+
+    # The last skip trace row wins for a duplicate parcel; other regions' rows are ignored
+    assert result['ST_MatchSource'].tolist() == ['apn', 'apn', '']
+    assert result['Golden_Address'].tolist() == [' 10 MAIN ST ', '99 NEW RD', None]
+    assert result['Golden_City'].tolist() == ['ROANOKE', 'SALEM', None]
+    assert result['Golden_Address_Differs'].tolist() == [False, True, False]
+    assert result['ST_Flags'].tolist() == ['STLien', 'STDeceased', '']
+    assert result['HasSTLien'].tolist() == [True, False, False]
+    assert result['HasSTDeceased'].tolist() == [False, True, False]
+
+
+def test_address_matches_prefer_city_and_skip_apn_matched_rows():
+    skip_trace = pd.DataFrame({
+        'Property FIPS': ['51770'] * 4,
+        'Property APN': ['313-0419', None, None, None],
+        'Property Address': ['10 MAIN ST', '22 OAK AVE', '22 OAK AVE', '7 ELM RD'],
+        'Property City': ['ROANOKE', 'SALEM', 'ROANOKE', 'VINTON'],
+        'Golden Address': ['1 APN RD', '2 SALEM RD', '3 ROANOKE RD', '4 ELM RD'],
+        'Lien': [None, None, pd.Timestamp('2024-03-01'), None],
+    })
+    enhanced = pd.DataFrame({
+        'APN': ['3130419', None, None, None],
+        'Address': ['10 Main Street', '22 Oak Avenue', '7 Elm Road', '9 Pine Ct'],
+        'City': ['Roanoke', 'Roanoke', 'Salem', 'Roanoke'],
+        'Mailing Address': ['1 APN RD', None, '4 ELM RD', None],
+    })
+
+    result = _match_skip_trace_hybrid(enhanced, skip_trace, '51770')
+
+    # Address+city beats the later address-only row; unknown cities fall back to the address alone
+    assert result['ST_MatchSource'].tolist() == ['apn', 'address+city', 'address-only', '']
+    assert result['Golden_Address'].tolist() == ['1 APN RD', '3 ROANOKE RD', '4 ELM RD', None]
+    assert result['Golden_Address_Differs'].tolist() == [False, False, False, False]
+    assert result['ST_Flags'].tolist() == ['', 'STLien', '', '']
+    assert result['HasSTLien'].tolist() == [False, True, False, False]
@@ -0,0 +1,56 @@
+import pandas as pd
+import pytest
+from datetime import date
+
+from stage_checkpoints import STAGE_NAMES, StageCheckpointStore, scored_main_key, stage_key
+
+
+def test_scored_checkpoint_is_not_reused_on_a_later_date(tmp_path):
+    params = {'region_input_amount1': 75000}
+    store = StageCheckpointStore('roanoke_city_va', output_root=tmp_path)
+    scored = pd.DataFrame({'APN': ['100-01'], 'PriorityCode': ['OWN20']})
+
+    saved_key = scored_main_key('main-data-key', params, date(2025, 9, 1))
+    assert store.save('scored_main', saved_key, {'main_result': scored})
+
+    same_day = store.load('scored_main', scored_main_key('main-data-key', params, date(2025, 9, 1)))
+    assert same_day[0]['main_result'].equals(scored)
+    assert store.load('scored_main', scored_main_key('main-data-key', params, date(2025, 10, 1))) is None
+
+
+def test_checkpoint_round_trip_replaces_older_checkpoint(tmp_path):
+    store = StageCheckpointStore('roanoke_city_va', output_root=tmp_path)
+    main_df = pd.DataFrame({'APN': ['100-01', '100-02'], 'Amount': [120000.0, None]})
+    audit = pd.DataFrame({'APN': ['100-01'], 'Reason': ['duplicate parcel']})
+    first_key = stage_key('main_data', {'main file': 'abc'})
+
+    assert store.save('main_data', first_key, {'main_df': main_df, 'dedup_audit': audit}, {'rows': 2})
+    frames, metadata = store.load('main_data', first_key)
+    pd.testing.assert_frame_equal(frames['main_df'], main_df)
+    pd.testing.assert_frame_equal(frames['dedup_audit'], audit)
+    assert metadata == {'rows': 2}
+
+    # A changed input gives a new key: the old checkpoint no longer loads and its files are dropped
+    second_key = stage_key('main_data', {'main file': 'def'})
+    assert second_key != first_key
+    assert store.load('main_data', second_key) is None
+    assert store.save('main_data', second_key, {'main_df': main_df.head(1), 'dedup_audit': audit})
+    assert store.load('main_data', first_key) is None
+    assert len(list(store.directory.glob('main_data_*'))) == 2
+
+
+def test_from_stage_recomputes_that_stage_and_later_ones(tmp_path):
+    scored = pd.DataFrame({'APN': ['100-01'], 'PriorityCode': ['OWN20']})
+    keys = {stage: stage_key(stage, {'input': 1}) for stage in STAGE_NAMES}
+    store = StageCheckpointStore('roanoke_city_va', output_root=tmp_path)
+    for stage in STAGE_NAMES:
+        store.save(stage, keys[stage], {'main_result': scored})
+
+    resumed = StageCheckpointStore('roanoke_city_va', output_root=tmp_path, from_stage='scored_main')
+
+    assert [resumed.is_forced(stage) for stage in STAGE_NAMES] == [False, True, True]
+    assert resumed.load('main_data', keys['main_data']) is not None
+    assert resumed.load('scored_main', keys['scored_main']) is None
+    assert resumed.load('niche_merge', keys['niche_merge']) is None
+    with pytest.raises(ValueError):
+        StageCheckpointStore('roanoke_city_va', output_root=tmp_path, from_stage='scoring')
@@ -0,0 +1,62 @@
+import pandas as pd
+
+import monthly_processing_v2
+from monthly_processing_v2 import RunWorkbookCache
+
+
+def _write_workbook(path, rows):
+    pd.DataFrame({'APN': [f'{i:05d}' for i in range(rows)], 'Owner': ['SMITH, JOHN'] * rows,
+                  'Amount': [float(i) for i in range(rows)]}).to_excel(path, index=False)
+    return path
+
+
+def _counting_parser(monkeypatch):
+    parsed = []
+    read_input = monthly_processing_v2.read_input
+    monkeypatch.setattr(monthly_processing_v2, 'read_input',
+                        lambda path, **options: parsed.append(path.name) or read_input(path, **options))
+    return parsed
+
+
+def test_each_input_is_parsed_once_per_run(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    parsed = _counting_parser(monkeypatch)
+    liens = _write_workbook(tmp_path / 'liens.xlsx', 3)
+    cache = RunWorkbookCache()
+
+    first = cache.read_input(liens, dtype={'APN': str})
+    first['HasLiens'] = True
+    second = cache.read_input(liens, dtype={'APN': str})
+
+    assert parsed == ['liens.xlsx']
+    assert (cache.misses, cache.hits) == (1, 1)
+    # Callers get their own copy; other read options are a separate parse
+    assert 'HasLiens' not in second.columns
+    cache.read_input(liens)
+    assert parsed == ['liens.xlsx', 'liens.xlsx']
+
+    # A file rewritten during the run is parsed again
+    _write_workbook(liens, 4)
+    assert len(cache.read_input(liens, dtype={'APN': str})) == 4
+    cache.close()
+
+
+def test_frames_past_the_limit_spill_to_parquet_and_read_back_equal(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    parsed = _counting_parser(monkeypatch)
+    small = _write_workbook(tmp_path / 'probate.xlsx', 2)
+    large = _write_workbook(tmp_path / 'main_region.xlsx', 200)
+    cache = RunWorkbookCache(memory_limit_bytes=5000)
+
+    cache.read_input(small, dtype={'APN': str})
+    original = cache.read_input(large, dtype={'APN': str})
+
+    # The small frame stays in memory; the one that would pass the limit is spilled
+    assert cache.memory_bytes() < 5000
+    spill_path, = cache.spilled.values()
+    assert spill_path.exists() and spill_path.suffix == '.parquet'
+    pd.testing.assert_frame_equal(cache.read_input(large, dtype={'APN': str}), original)
+    assert parsed == ['probate.xlsx', 'main_region.xlsx']
+
+    cache.close()
+    assert not spill_path.exists()
@@ -9,7 +9,7 @@ import argparse
 import re
 from pathlib import Path
 import pandas as pd
-from gis_utils import load_gis_data, augment_with_gis
+from gis_utils import load_gis_data, augment_records_with_gis
 
 
 def parse_owner(name: str) -> tuple[str, str]:
@@ -100,11 +100,11 @@ def clean_roanoke_tax_delinquent(input_path: Path, gis_data: pd.DataFrame = None
             "Amount Due": amount_due,
         }
         
-        # Augment with GIS data using shared utility
-        record = augment_with_gis(record, parcel_id, gis_data)
-        
         records.append(record)
     
+    # Augment with GIS data using shared utility (all records matched at once)
+    records = augment_records_with_gis(records, gis_data)
+    
     if not records:
         return pd.DataFrame(columns=[
             "Owner 1 Last Name", "Owner 1 First Name", "Address", "City", "State", "Zip",
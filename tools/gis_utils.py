@@ -1,8 +1,18 @@
 """
 Shared GIS utilities for government data processing
 """
+import os
+import sys
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from typing import List, Optional
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from address_normalizer import normalize_addresses
+from input_adapters import read_input
+from parcel_keys import MISSING_PARCEL_ID, ParcelIndex, base_parcel_keys, parcel_keys
+from ingest_schema import GIS_SCHEMA
 
 
 def load_gis_data(gis_file_path: Path) -> pd.DataFrame:
@@ -10,10 +20,11 @@ def load_gis_data(gis_file_path: Path) -> pd.DataFrame:
     if not gis_file_path.exists():
         raise FileNotFoundError(f"GIS file not found: {gis_file_path}")
     
-    gis_df = pd.read_csv(gis_file_path)
+    # TAXID is declared text, so parcel numbers keep their leading zeros
+    gis_df = read_input(gis_file_path, schema=GIS_SCHEMA)
     
-    # Standardize key columns for matching
-    gis_df['_ParcelKey'] = gis_df['TAXID'].astype(str)
+    # Canonical parcel keys for matching (see parcel_keys)
+    gis_df['_ParcelKey'] = parcel_keys(gis_df['TAXID'])
     
     print(f"Loaded GIS data: {len(gis_df):,} parcels")
     return gis_df
@@ -76,77 +87,76 @@ def extract_gis_data(gis_row) -> dict:
     }
 
 
-def normalize_address_for_matching(addr: str) -> str:
-    """Normalize address for consistent matching between datasets"""
-    if not isinstance(addr, str):
-        return ""
-    # Convert to uppercase and strip whitespace
-    addr = addr.strip().upper()
-    # Standardize common abbreviations
-    addr = addr.replace(' AVENUE ', ' AVE ')
-    addr = addr.replace(' STREET ', ' ST ')
-    addr = addr.replace(' ROAD ', ' RD ')
-    addr = addr.replace(' DRIVE ', ' DR ')
-    addr = addr.replace(' COURT ', ' CT ')
-    addr = addr.replace(' PLACE ', ' PL ')
-    return addr
+def _first_rows(ids: np.ndarray, size: int) -> tuple:
+    """First row position and row count of each id 0..size-1 (-1 / 0 for ids without rows)"""
+    first_row = np.full(size, -1, dtype=np.int64)
+    present = ids >= 0
+    unique_ids, positions = np.unique(ids[present], return_index=True)
+    first_row[unique_ids] = np.flatnonzero(present)[positions]
+    return first_row, np.bincount(ids[present], minlength=size)
 
 
-def augment_with_gis(record: dict, parcel_id: str, gis_data: pd.DataFrame) -> dict:
+def augment_records_with_gis(records: List[dict], gis_data: Optional[pd.DataFrame],
+                             parcel_field: str = "Parcel ID") -> List[dict]:
     """
-    Augment a single record with GIS data using hybrid matching strategy:
+    Augment records with GIS data using hybrid matching strategy:
     1. Primary: Parcel ID matching (most accurate)
-    2. Backup: Address matching (handles parcel ID format mismatches)
+    2. Parcel ID without a letter suffix (3130419A -> 3130419, for split parcels)
+    3. Backup: Address matching (handles parcel ID format mismatches)
+    
+    Parcel IDs are compared as integer ids of their canonical keys (parcel_keys), so
+    dashes, dots and leading zeros don't prevent a match; addresses are compared
+    normalized (address_normalizer). All records are matched in one pass.
     
     Args:
-        record: Base record dictionary to augment
-        parcel_id: Parcel ID to match against GIS data
-        gis_data: GIS DataFrame with _ParcelKey column and LOCADDR column
+        records: Base record dictionaries to augment (updated in place)
+        gis_data: GIS DataFrame from load_gis_data (None to skip augmentation)
+        parcel_field: Record field holding the parcel ID
         
     Returns:
-        Updated record with GIS data and Data_Source field
+        The records with GIS data and a Data_Source field
     """
-    gis_match = None
-    match_method = ""
+    if gis_data is None or not records:
+        for record in records:
+            record['Data_Source'] = 'Government_Data_Only'
+        return records
     
-    if gis_data is not None:
-        # Strategy 1: Try parcel ID matching first (most accurate)
-        if parcel_id:
-            gis_match = gis_data[gis_data['_ParcelKey'] == parcel_id]
-            if len(gis_match) > 0:
-                match_method = "Parcel_ID"
-            else:
-                # Strategy 1b: Try parcel ID without suffix (handle A/B/C suffixes)
-                base_parcel = parcel_id.rstrip('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
-                if base_parcel != parcel_id:
-                    gis_match = gis_data[gis_data['_ParcelKey'] == base_parcel]
-                    if len(gis_match) > 0:
-                        match_method = "Parcel_ID_Base"
-        
-        # Strategy 2: Fallback to address matching if parcel ID failed
-        if (gis_match is None or len(gis_match) == 0) and record.get('Address'):
-            normalized_input_addr = normalize_address_for_matching(record['Address'])
-            
-            # Create normalized address column if it doesn't exist
-            if '_NormalizedAddr' not in gis_data.columns:
-                gis_data['_NormalizedAddr'] = gis_data['LOCADDR'].apply(normalize_address_for_matching)
-            
-            # Find address matches
-            gis_match = gis_data[gis_data['_NormalizedAddr'] == normalized_input_addr]
-            if len(gis_match) > 0:
-                match_method = "Address"
+    # GIS parcels and addresses get dense integer ids; record keys are looked up against them
+    parcels = ParcelIndex()
+    gis_parcel_ids = parcels.key_ids(gis_data['_ParcelKey'], register=True)
+    parcel_first_row, parcel_counts = _first_rows(gis_parcel_ids, len(parcels))
     
-    # Apply GIS augmentation if match found
-    if gis_match is not None and len(gis_match) > 0:
-        gis_row = gis_match.iloc[0]
-        gis_fields = extract_gis_data(gis_row)
-        record.update(gis_fields)
+    if '_NormalizedAddr' not in gis_data.columns:
+        gis_data['_NormalizedAddr'] = normalize_addresses(gis_data['LOCADDR'])
+    gis_address_ids, gis_addresses = pd.factorize(gis_data['_NormalizedAddr'])
+    gis_address_ids[(gis_data['_NormalizedAddr'] == '').to_numpy()] = MISSING_PARCEL_ID
+    address_first_row, address_counts = _first_rows(gis_address_ids, len(gis_addresses))
+    
+    record_keys = parcel_keys(pd.Series([record.get(parcel_field, '') for record in records], dtype=object))
+    exact_ids = parcels.key_ids(record_keys)
+    base_keys = base_parcel_keys(record_keys)
+    base_ids = np.where(base_keys != record_keys, parcels.key_ids(base_keys), MISSING_PARCEL_ID)
+    record_addresses = normalize_addresses(pd.Series([record.get('Address') or '' for record in records], dtype=object))
+    address_ids = pd.Index(gis_addresses).get_indexer(record_addresses)
+    address_ids[(record_addresses == '').to_numpy()] = MISSING_PARCEL_ID
+    
+    for i, record in enumerate(records):
+        if exact_ids[i] != MISSING_PARCEL_ID:
+            row, count, match_method = parcel_first_row[exact_ids[i]], parcel_counts[exact_ids[i]], "Parcel_ID"
+        elif base_ids[i] != MISSING_PARCEL_ID:
+            row, count, match_method = parcel_first_row[base_ids[i]], parcel_counts[base_ids[i]], "Parcel_ID_Base"
+        elif address_ids[i] != MISSING_PARCEL_ID:
+            row, count, match_method = address_first_row[address_ids[i]], address_counts[address_ids[i]], "Address"
+        else:
+            record['Data_Source'] = 'Government_Data_Only'
+            continue
+        
+        # Apply GIS augmentation from the first match
+        record.update(extract_gis_data(gis_data.iloc[row]))
         record['Data_Source'] = f'GIS_Augmented_{match_method}'
         
         # Take first match if multiple (should be rare with normalized addresses)
-        if len(gis_match) > 1:
-            record['Data_Source'] += f'_MultiMatch({len(gis_match)})'
-    else:
-        record['Data_Source'] = 'Government_Data_Only'
+        if count > 1:
+            record['Data_Source'] += f'_MultiMatch({count})'
     
-    return record
\ No newline at end of file
+    return records
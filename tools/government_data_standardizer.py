@@ -1,11 +1,16 @@
 import argparse
+import os
 import re
+import sys
 from pathlib import Path
 import pandas as pd
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional, Tuple
 import json
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from columnar_io import save_dataset
+
 
 class BaseGovernmentCleaner(ABC):
     def __init__(self, data_type: str, region: str):
@@ -556,7 +561,17 @@ class GovernmentDataStandardizer:
             return GISParcelCleaner(data_type, region, config["column_mapping"], config.get("name_format", "lastname_first"))
         return None
     
-    def process_file(self, input_path: Path, region: str, data_type: str = None, output_date: str = None) -> Path:
+    def process_file(self, input_path: Path, region: str, data_type: str = None, output_date: str = None,
+                     export_excel: bool = True) -> Path:
+        """
+        Standardize one government data file into a niche file in the region directory.
+        
+        The niche file is saved as Parquet with an optional Excel copy for review; monthly
+        processing reads the Parquet file and ignores an Excel copy of the same name.
+        
+        Returns:
+            Path of the canonical output (Parquet, or Excel when pyarrow is unavailable)
+        """
         if not input_path.exists():
             raise FileNotFoundError(f"Input file not found: {input_path}")
         
@@ -617,18 +632,18 @@ class GovernmentDataStandardizer:
         # Save to region directory
         region_dir = Path("regions") / region
         region_dir.mkdir(parents=True, exist_ok=True)
-        output_path = region_dir / f"{region}_{data_type}_{output_date}.xlsx"
-        cleaned_df.to_excel(output_path, index=False)
+        saved = save_dataset(cleaned_df, region_dir / f"{region}_{data_type}_{output_date}", export_excel)
         
-        return output_path
+        return saved['columnar'] or saved['excel']
     
-    def process_all_region_files(self, region: str, output_date: str = None) -> List[Path]:
+    def process_all_region_files(self, region: str, output_date: str = None, export_excel: bool = True) -> List[Path]:
         """
         Process all government data files for a region.
         
         Args:
             region: Region key (e.g., roanoke_city_va)
             output_date: YYYYMMDD for output filename (auto-generated if not specified)
+            export_excel: Also write an Excel copy of each niche file
             
         Returns:
             List of output file paths
@@ -670,7 +685,7 @@ class GovernmentDataStandardizer:
                 print(f"  Processing {file_path.name} as {data_type}...")
                 
                 # Process the file
-                output_path = self.process_file(file_path, region, data_type, output_date)
+                output_path = self.process_file(file_path, region, data_type, output_date, export_excel)
                 output_paths.append(output_path)
                 processed_count += 1
                 
@@ -694,6 +709,7 @@ def main():
     parser.add_argument("--date", help="YYYYMMDD for output filename (auto-inferred if not specified)")
     parser.add_argument("--list-types", action="store_true", help="List supported data types")
     parser.add_argument("--process-all", action="store_true", help="Process all government data files for the region")
+    parser.add_argument("--no-excel", action="store_true", help="Save niche files as Parquet only, without the Excel copy")
     
     args = parser.parse_args()
     
@@ -707,7 +723,7 @@ def main():
     
     if args.process_all:
         try:
-            output_paths = standardizer.process_all_region_files(args.region, args.date)
+            output_paths = standardizer.process_all_region_files(args.region, args.date, not args.no_excel)
             if output_paths:
                 print(f"Processed {len(output_paths)} government data files for {args.region}:")
                 for output_path in output_paths:
@@ -729,7 +745,8 @@ def main():
             input_path, 
             args.region, 
             args.type, 
-            args.date
+            args.date,
+            not args.no_excel
         )
         print(f"Processed {args.input}")
         print(f"Saved standardized niche file: {output_path}")
@@ -0,0 +1,86 @@
+"""
+Output Dataset Query
+
+Answers questions across months and regions from the partitioned dataset of enhanced
+outputs (output/enhanced_dataset/, see output_dataset.py) instead of opening the
+monthly Excel files. Region, month, priority code and distress flag filters are
+applied while the dataset is scanned.
+
+Usage:
+    python tools/query_output_dataset.py --flag HasCurrentTax --min-months 3
+    python tools/query_output_dataset.py --region roanoke_city_va --since 2025_06 --priority ABS1 --flag HasLiens
+    python tools/query_output_dataset.py --month 2025_09 --flag HasProbate --output probate_sept.csv
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Shared modules live in the repository root
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from output_dataset import (DATASET_ROOT, MONTH_FIELD, REGION_FIELD, flagged_properties, partition_files,
+                            query_dataset)
+
+
+def write_result(df, output_path: Path) -> None:
+    """Write a query result as CSV, Parquet or Excel (by file suffix)"""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if output_path.suffix == '.parquet':
+        df.to_parquet(output_path, index=False)
+    elif output_path.suffix == '.xlsx':
+        df.to_excel(output_path, index=False)
+    else:
+        df.to_csv(output_path, index=False)
+    print(f"Saved {len(df):,} rows to {output_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the multi-month dataset of enhanced outputs")
+    parser.add_argument("--region", action="append", help="Region key (repeat for several regions)")
+    parser.add_argument("--month", action="append", help="Month as YYYY_MM (repeat for several months)")
+    parser.add_argument("--since", help="First month to include (YYYY_MM)")
+    parser.add_argument("--until", help="Last month to include (YYYY_MM)")
+    parser.add_argument("--priority", action="append", help="PriorityCode to include (repeat for several codes)")
+    parser.add_argument("--flag", action="append", help="Distress flag that must be set, e.g. HasCurrentTax")
+    parser.add_argument("--min-months", type=int, help="List properties carrying --flag in at least this many months")
+    parser.add_argument("--columns", help="Comma-separated output columns to read (default: all)")
+    parser.add_argument("--output", help="Save the result (.csv, .parquet or .xlsx)")
+    parser.add_argument("--dataset", default=str(DATASET_ROOT), help=f"Dataset location (default: {DATASET_ROOT})")
+
+    args = parser.parse_args()
+
+    dataset_root = Path(args.dataset)
+    if not partition_files(dataset_root):
+        print(f"Error: No outputs published to {dataset_root} yet - run monthly_processing_v2.py first")
+        exit(1)
+    if args.min_months is not None and (not args.flag or len(args.flag) != 1):
+        parser.error("--min-months needs exactly one --flag")
+
+    try:
+        if args.min_months is not None:
+            result = flagged_properties(args.flag[0], args.min_months, regions=args.region, since=args.since,
+                                        until=args.until, dataset_root=dataset_root)
+            print(f"{len(result):,} properties with {args.flag[0]} in at least {args.min_months} months")
+            counts = result.groupby(REGION_FIELD).size()
+        else:
+            columns = [column.strip() for column in args.columns.split(",")] if args.columns else None
+            result = query_dataset(regions=args.region, months=args.month, since=args.since, until=args.until,
+                                   priority_codes=args.priority, flags=args.flag, columns=columns,
+                                   dataset_root=dataset_root)
+            print(f"{len(result):,} matching records")
+            counts = result.groupby([REGION_FIELD, MONTH_FIELD]).size()
+    except Exception as e:
+        print(f"Error: {e}")
+        exit(1)
+
+    if not result.empty:
+        print(counts.to_string())
+    if args.output:
+        write_result(result, Path(args.output))
+    elif not result.empty:
+        print(result.head(20).to_string())
+
+
+if __name__ == "__main__":
+    main()
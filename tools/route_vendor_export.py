@@ -0,0 +1,158 @@
+"""
+Vendor Export Router
+
+Splits one vendor export (liens, tax history, cash buyers, ...) that covers several
+localities into per-region niche files. The file is streamed once; each row is routed
+by its FIPS value to the region whose config.json has that fips_code and appended to
+regions/<region_key>/<export name>.xlsx. Rows with a FIPS value no region claims go to
+a leftover file under output/unrouted/.
+
+Rows are never held in memory beyond the one being routed, so multi-hundred-thousand
+row exports are handled in bounded memory.
+
+Usage:
+    python tools/route_vendor_export.py --input "vendor/liens_all_counties.xlsx"
+    python tools/route_vendor_export.py --input vendor/cash_buyers.csv --name cash_buyers --overwrite
+"""
+
+import argparse
+import os
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Optional
+
+# Shared modules live in the repository root
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from multi_region_config import MultiRegionConfigManager
+from region_catalog import normalize_fips_value
+from excel_streaming import StreamingExcelWriter, open_table_rows
+
+UNROUTED_DIR = Path("output") / "unrouted"
+
+
+def build_fips_routes(config_manager: MultiRegionConfigManager) -> Dict[str, str]:
+    """Map each region's normalized fips_code to its region key"""
+    routes = {}
+    for region_key, config in config_manager.configs.items():
+        fips = normalize_fips_value(config.fips_code)
+        if fips in routes:
+            print(f"WARNING: FIPS {fips} is configured for both {routes[fips]} and {region_key} - using {routes[fips]}")
+            continue
+        routes[fips] = region_key
+    return routes
+
+
+def route_export(input_path: Path, config_manager: MultiRegionConfigManager, output_name: Optional[str] = None,
+                 fips_column: str = 'FIPS', overwrite: bool = False) -> Dict:
+    """
+    Stream a mixed-FIPS export once and write each region's rows into its region directory.
+
+    Args:
+        input_path: Vendor export (.xlsx or .csv)
+        config_manager: Configuration manager providing the regions and their FIPS codes
+        output_name: File name stem for the routed files (defaults to the input file stem)
+        fips_column: Column holding the FIPS code
+        overwrite: Replace existing routed files instead of refusing
+
+    Returns:
+        Dictionary with routed row counts per region, unknown FIPS counts and output files
+    """
+    output_name = output_name or input_path.stem
+    routes = build_fips_routes(config_manager)
+
+    # Refuse up front rather than after streaming the whole file
+    if not overwrite:
+        existing = [config_manager.get_region_directory(key) / f"{output_name}.xlsx" for key in routes.values()]
+        existing = [path for path in existing if path.exists()]
+        if existing:
+            return {'success': False,
+                    'error': f"Routed file already exists: {', '.join(str(p) for p in existing)} (use --overwrite)"}
+
+    writers: Dict[str, StreamingExcelWriter] = {}
+    routed = Counter()
+    unknown = Counter()
+    total_rows = 0
+
+    with open_table_rows(input_path) as (header, rows):
+        if fips_column not in header:
+            return {'success': False, 'error': f"No '{fips_column}' column in {input_path.name}"}
+        fips_index = header.index(fips_column)
+
+        try:
+            for row in rows:
+                total_rows += 1
+                value = row[fips_index] if fips_index < len(row) else None
+                fips = normalize_fips_value(value)
+                region_key = routes.get(fips, '')
+                if not region_key:
+                    unknown[fips] += 1
+
+                # One lazily created writer per destination ('' = unknown FIPS leftover file)
+                writer = writers.get(region_key)
+                if writer is None:
+                    if region_key:
+                        path = config_manager.get_region_directory(region_key) / f"{output_name}.xlsx"
+                    else:
+                        path = UNROUTED_DIR / f"{output_name}_unknown_fips.xlsx"
+                    writer = writers[region_key] = StreamingExcelWriter(path, header)
+                writer.append(row)
+
+                if region_key:
+                    routed[region_key] += 1
+                if total_rows % 50000 == 0:
+                    print(f"  Routed {total_rows:,} rows...")
+        except Exception:
+            for writer in writers.values():
+                writer.discard()
+            raise
+
+    output_files = {region_key or 'unknown': str(writer.close()) for region_key, writer in writers.items()}
+
+    return {
+        'success': True,
+        'total_rows': total_rows,
+        'routed': dict(routed),
+        'unknown_fips': dict(unknown),
+        'output_files': output_files
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Route a multi-region vendor export into region niche files by FIPS")
+    parser.add_argument("--input", required=True, help="Vendor export to split (.xlsx or .csv)")
+    parser.add_argument("--name", help="File name for the routed niche files (default: input file name)")
+    parser.add_argument("--fips-column", default="FIPS", help="Column holding the FIPS code (default: FIPS)")
+    parser.add_argument("--overwrite", action="store_true", help="Replace routed files that already exist")
+
+    args = parser.parse_args()
+
+    input_path = Path(args.input)
+    if not input_path.exists():
+        print(f"Error: Input file not found: {input_path}")
+        exit(1)
+
+    try:
+        print(f"Routing {input_path.name} by {args.fips_column}...")
+        result = route_export(input_path, MultiRegionConfigManager(), args.name, args.fips_column, args.overwrite)
+    except Exception as e:
+        print(f"Error: {e}")
+        exit(1)
+
+    if not result['success']:
+        print(f"Error: {result['error']}")
+        exit(1)
+
+    print(f"\nRouted {result['total_rows']:,} rows:")
+    for region_key, count in sorted(result['routed'].items()):
+        print(f"  {region_key:<22} {count:>9,}  -> {result['output_files'][region_key]}")
+
+    if result['unknown_fips']:
+        unknown_total = sum(result['unknown_fips'].values())
+        print(f"  {'unknown FIPS':<22} {unknown_total:>9,}  -> {result['output_files']['unknown']}")
+        for fips, count in Counter(result['unknown_fips']).most_common():
+            print(f"    {fips or '(blank)'}: {count:,}")
+
+
+if __name__ == "__main__":
+    main()